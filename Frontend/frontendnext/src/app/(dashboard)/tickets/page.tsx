@@ -1,29 +1,51 @@
 "use client";
 
-import { useEffect, useState } from "react";
+import { useCallback, useEffect, useState } from "react";
 import { useRouter } from "next/navigation";
-import { getTickets } from "@/lib/api";
+import { getTicketPage } from "@/lib/api";
 import { TicketTable } from "@/components/ticket-table";
-import { Ticket } from "@/types/ticket";
+import { TicketListItem } from "@/types/ticket";
 
 export default function TicketPage() {
   const router = useRouter();
-  const [tickets, setTickets] = useState<Ticket[]>([]);
+  const [tickets, setTickets] = useState<TicketListItem[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
+  const handleError = useCallback(
+    (err: Error) => {
+      if (err.message.includes("401")) {
+        router.push("/login");
+      } else {
+        setError(err.message);
+      }
+    },
+    [router]
+  );
+
   useEffect(() => {
-    getTickets()
-      .then(setTickets)
-      .catch((err) => {
-        if (err.message.includes("401")) {
-          router.push("/login");
-        } else {
-          setError(err.message);
-        }
+    getTicketPage()
+      .then((page) => {
+        setTickets(page.items);
+        setNextCursor(page.nextCursor);
       })
+      .catch(handleError)
       .finally(() => setLoading(false));
-  }, [router]);
+  }, [handleError]);
+
+  function loadMore() {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    getTicketPage(nextCursor)
+      .then((page) => {
+        setTickets((loaded) => [...loaded, ...page.items]);
+        setNextCursor(page.nextCursor);
+      })
+      .catch(handleError)
+      .finally(() => setLoadingMore(false));
+  }
 
   if (loading) {
     return (
@@ -45,9 +67,22 @@ export default function TicketPage() {
     <div className="h-full overflow-auto p-6">
       <div className="mb-6">
         <h1 className="text-2xl font-bold text-gray-900">Tickets</h1>
-        <p className="text-sm text-gray-500 mt-1">{tickets.length} Tickets insgesamt</p>
+        <p className="text-sm text-gray-500 mt-1">
+          {tickets.length} Tickets geladen{nextCursor ? ", weitere verfuegbar" : ""}
+        </p>
       </div>
       <TicketTable tickets={tickets} />
+      {nextCursor && (
+        <div className="mt-4 flex justify-center">
+          <button
+            onClick={loadMore}
+            disabled={loadingMore}
+            className="rounded-md border border-gray-200 bg-white px-4 py-2 text-sm text-gray-600 disabled:opacity-40 hover:bg-gray-50"
+          >
+            {loadingMore ? "Laden..." : "Weitere Tickets laden"}
+          </button>
+        </div>
+      )}
     </div>
   );
 }
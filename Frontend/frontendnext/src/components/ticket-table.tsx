@@ -14,7 +14,7 @@ import {
   SortingState,
 } from "@tanstack/react-table";
 import { ArrowUpDown, Search, Mail, MessageCircle, Phone, Share2 } from "lucide-react";
-import { Ticket, TicketChannel } from "@/types/ticket";
+import { TicketListItem, TicketChannel } from "@/types/ticket";
 import { StatusBadge, PriorityBadge } from "./status-badge";
 
 const channelIcons: Record<TicketChannel, React.ReactNode> = {
@@ -24,7 +24,7 @@ const channelIcons: Record<TicketChannel, React.ReactNode> = {
   social: <Share2 className="h-4 w-4" />,
 };
 
-const columnHelper = createColumnHelper<Ticket>();
+const columnHelper = createColumnHelper<TicketListItem>();
 
 const columns = [
   columnHelper.accessor("id", {
@@ -73,7 +73,7 @@ const columns = [
   }),
 ];
 
-export function TicketTable({ tickets }: { tickets: Ticket[] }) {
+export function TicketTable({ tickets }: { tickets: TicketListItem[] }) {
   const router = useRouter();
   const [sorting, setSorting] = useState<SortingState>([]);
   const [globalFilter, setGlobalFilter] = useState("");
@@ -89,6 +89,8 @@ export function TicketTable({ tickets }: { tickets: Ticket[] }) {
     getFilteredRowModel: getFilteredRowModel(),
     getPaginationRowModel: getPaginationRowModel(),
     initialState: { pagination: { pageSize: 10 } },
+    // Stay on the current page when more tickets are loaded
+    autoResetPageIndex: false,
   });
 
   return (
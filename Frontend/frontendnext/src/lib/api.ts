@@ -1,4 +1,4 @@
-import { Ticket } from "@/types/ticket";
+import { Ticket, TicketPage } from "@/types/ticket";
 
 const API_BASE =
   process.env.NEXT_PUBLIC_API_URL ?? "http://localhost:8000/api";
@@ -95,8 +95,13 @@ export async function signup(payload: SignupPayload): Promise<SignupResult> {
 // Tickets API
 // ---------------------------------------------------------------------------
 
-export async function getTickets(): Promise<Ticket[]> {
-  const res = await fetchWithAuth("/tickets/");
+export async function getTicketPage(
+  cursor?: string | null,
+  limit = 50
+): Promise<TicketPage> {
+  const params = new URLSearchParams({ limit: String(limit) });
+  if (cursor) params.set("cursor", cursor);
+  const res = await fetchWithAuth(`/tickets/?${params}`);
   if (!res.ok) {
     throw new Error(`Failed to fetch tickets: ${res.status}`);
   }
@@ -23,3 +23,16 @@ export interface Ticket {
   updatedAt: string;
   messages: TicketMessage[];
 }
+
+// Row of the ticket list: no thread, only its summary
+export interface TicketListItem extends Omit<Ticket, "messages"> {
+  messageCount: number;
+  lastMessageAt: string | null;
+  lastMessageSender: string;
+  lastMessagePreview: string;
+}
+
+export interface TicketPage {
+  items: TicketListItem[];
+  nextCursor: string | null;
+}
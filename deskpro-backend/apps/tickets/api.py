@@ -1,38 +1,460 @@
 """
 Tickets API — all endpoints require a valid JWT (JWTBearer).
 
-GET  /api/tickets/      → list of all tickets for the tenant
-GET  /api/tickets/{id}  → single ticket with messages
+GET  /api/tickets/         → cursor-paginated list of tickets for the tenant
+GET  /api/tickets/summary  → same list, without the customer's email
+GET  /api/tickets/search   → ranked full-text search with highlighted snippets
+GET  /api/tickets/export   → streaming NDJSON / CSV export of all tickets
+GET  /api/tickets/stats    → ticket counts by status, priority, channel, assignee, tag
+GET  /api/tickets/events   → Server-Sent Events stream of ticket/message changes
+GET  /api/tickets/changes  → tickets/messages changed and deleted since a watermark
+PATCH /api/tickets/bulk    → set status/assignee, add/remove tags on many tickets
+GET  /api/tickets/archive?customerEmail= → archived tickets of a customer (read-only)
+GET  /api/tickets/archive/{id} → one archived ticket with messages
+GET  /api/tickets/{id}     → single ticket with messages (all, or ?messages=latest:N)
+GET  /api/tickets/{id}/messages → cursor-paginated message thread (older / newer)
+
+Both list endpoints accept the filters in TicketFilterIn (status, priority,
+channel, assignee, tags, created/updated ranges) and a `sort` key.
+
+List and detail endpoints answer conditional GETs (If-None-Match /
+If-Modified-Since) with 304 before loading any rows — see conditional.py.
+Rendered GET responses are cached per tenant — see cache.py.
+With FAST_JSON on, responses skip schema re-validation (core.renderers).
+Compression is negotiated by core.compression; exports use fast levels.
 """
-from ninja import Router
+from typing import Literal
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils import timezone
+from ninja import Query, Router
+from ninja.decorators import decorate_view
 from ninja.errors import HttpError
 
+from apps.tickets import bulk, conditional, events, export, search, stats, sync
 from apps.tickets.auth import CookieAuth
-from apps.tickets.models import Ticket
-from apps.tickets.schemas import TicketOut
+from apps.tickets.cache import bump_version, cached_response
+from apps.tickets.models import ArchivedTicket, Ticket, TicketMessage
+from apps.tickets.pagination import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_SORT,
+    DEFAULT_THREAD_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    MAX_THREAD_PAGE_SIZE,
+    InvalidCursor,
+    paginate,
+    paginate_thread,
+)
+from apps.tickets.schemas import (
+    ArchivedTicketOut,
+    ArchivedTicketSummaryOut,
+    TicketBulkUpdateIn,
+    TicketBulkUpdateOut,
+    TicketChangesOut,
+    TicketDetailOut,
+    TicketFilterIn,
+    TicketMessagePageOut,
+    TicketPageOut,
+    TicketSearchPageOut,
+    TicketStatsOut,
+    TicketSummaryPageOut,
+    camelize,
+)
+from core.compression import compression
+from core.renderers import trusted_response
+from core.thread_local import get_current_tenant_db
 
 router = Router(tags=["Tickets"])
 jwt_auth = CookieAuth()
 
+# Columns loaded for list views that do not render the message thread
+SUMMARY_FIELDS = (
+    "id",
+    "subject",
+    "customer_name",
+    "status",
+    "priority",
+    "channel",
+    "assignee",
+    "tags",
+    "created_at",
+    "updated_at",
+    "message_count",
+    "last_message_at",
+    "last_message_sender",
+    "last_message_preview",
+)
+
+# Search pages by offset (rank is not a stable keyset); cap how deep it goes
+MAX_SEARCH_OFFSET = 1000
+
+SortKey = Literal["-created_at", "created_at", "-updated_at", "updated_at"]
+ExportFormat = Literal["ndjson", "csv"]
+
+
+@router.get("/", response=TicketPageOut, auth=jwt_auth)
+@decorate_view(cached_response)
+def list_tickets(
+    request,
+    response: HttpResponse,
+    filters: TicketFilterIn = Query(...),
+    sort: SortKey = DEFAULT_SORT,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+):
+    """
+    Return one page of tickets for the current tenant (DB routed via thread-local).
+
+    Pass the returned `nextCursor` as `cursor` to fetch the following page;
+    it is null on the last page. Rows carry the denormalized thread summary,
+    not the messages — fetch the thread from GET /api/tickets/{id}.
+    """
+    queryset = filters.filter(Ticket.objects.only(*SUMMARY_FIELDS, "customer_email"))
+    cached = conditional.not_modified(
+        request, response, conditional.list_etag(request, queryset)
+    )
+    if cached is not None:
+        return cached
+
+    tickets, next_cursor = _page(queryset, sort, cursor, limit)
+    return _render(response, {
+        "items": [
+            {**_serialize_summary(t), "customer_email": t.customer_email}
+            for t in tickets
+        ],
+        "next_cursor": next_cursor,
+    })
+
+
+@router.get("/summary", response=TicketSummaryPageOut, auth=jwt_auth)
+@decorate_view(cached_response)
+def list_ticket_summaries(
+    request,
+    response: HttpResponse,
+    filters: TicketFilterIn = Query(...),
+    sort: SortKey = DEFAULT_SORT,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+):
+    """
+    Return one page of inbox rows for the current tenant.
+
+    Selects only SUMMARY_FIELDS and never touches tickets_ticketmessage —
+    message count and last-message preview come from denormalized Ticket
+    columns. Fetch the full thread from GET /api/tickets/{id}.
+    """
+    queryset = filters.filter(Ticket.objects.only(*SUMMARY_FIELDS))
+    cached = conditional.not_modified(
+        request, response, conditional.list_etag(request, queryset)
+    )
+    if cached is not None:
+        return cached
+
+    tickets, next_cursor = _page(queryset, sort, cursor, limit)
+    return _render(response, {
+        "items": [_serialize_summary(t) for t in tickets],
+        "next_cursor": next_cursor,
+    })
+
+
+@router.get("/search", response=TicketSearchPageOut, auth=jwt_auth)
+@decorate_view(cached_response)
+def search_tickets(
+    request,
+    response: HttpResponse,
+    q: str = Query(..., min_length=1, max_length=500),
+    filters: TicketFilterIn = Query(...),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0, le=MAX_SEARCH_OFFSET),
+):
+    """
+    Full-text search over subject, customer and message bodies, best match first.
+
+    `q` uses websearch syntax ("exact phrase", -exclude, or). Pass the
+    returned `nextOffset` as `offset` for the following page.
+    """
+    query = search.build_query(q)
+    queryset = search.search_tickets(
+        filters.filter(Ticket.objects.only(*SUMMARY_FIELDS)), query
+    )
+    hits = list(queryset[offset: offset + limit + 1])
+    next_offset = offset + limit if len(hits) > limit else None
+    hits = hits[:limit]
+
+    snippets = search.message_snippets([t.pk for t in hits], query, using=queryset.db)
+    return _render(response, {
+        "items": [
+            {
+                **_serialize_summary(t),
+                "rank": t.rank,
+                "subject_highlight": t.subject_headline,
+                "snippet": snippets.get(t.pk),
+            }
+            for t in hits
+        ],
+        "next_offset": next_offset,
+    })
+
+
+@router.get("/export", auth=jwt_auth)
+@decorate_view(compression(gzip=1, br=1, zstd=1))
+def export_tickets(
+    request,
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+    filters: TicketFilterIn = Query(...),
+):
+    """
+    Stream every (filtered) ticket with its messages as NDJSON (one TicketOut
+    per line) or CSV (one row per message). Memory use is independent of
+    tenant size — see export.py.
+    """
+    db_alias = get_current_tenant_db()
+    queryset = filters.filter(Ticket.objects.using(db_alias).defer("search_vector"))
+
+    if fmt == "csv":
+        rows, content_type = export.csv_rows(queryset), "text/csv; charset=utf-8"
+    else:
+        rows = export.ndjson_rows(queryset, lambda t: camelize(_serialize_ticket(t)))
+        content_type = "application/x-ndjson"
+
+    response = StreamingHttpResponse(export.stream(db_alias, rows), content_type=content_type)
+    filename = f"tickets-{timezone.now():%Y%m%d-%H%M%S}.{fmt}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+@router.get("/stats", response=TicketStatsOut, auth=jwt_auth)
+@decorate_view(cached_response)
+def ticket_stats(request):
+    """Dashboard counters, read from the trigger-maintained TicketStat table."""
+    return stats.get_stats()
+
+
+@router.get("/events", auth=jwt_auth)
+def ticket_events(request, last_event_id: int | None = Query(None, alias="lastEventId")):
+    """
+    Live change feed (text/event-stream). Each event names the ticket (and
+    message) that was created, updated or deleted; clients refetch what
+    they display. Reconnects resume from the Last-Event-ID header (or
+    ?lastEventId=); a `reset` event means the gap could not be replayed.
+    """
+    header = request.headers.get("Last-Event-ID")
+    if header:
+        try:
+            last_event_id = int(header)
+        except ValueError:
+            raise HttpError(400, "Invalid Last-Event-ID.")
+
+    response = StreamingHttpResponse(
+        events.stream(get_current_tenant_db(), last_event_id),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+@router.get("/changes", response=TicketChangesOut, auth=jwt_auth)
+def ticket_changes(request, response: HttpResponse, since: str | None = None):
+    """
+    Delta sync: tickets (summary shape) and messages created or updated
+    after the `since` watermark, ids deleted since then, and the next
+    watermark. Without `since`, returns only a fresh watermark. 410 means
+    the delta is unavailable and the client must refetch the full list.
+    """
+    if since is None:
+        return _render(response, {
+            "tickets": [],
+            "messages": [],
+            "deleted_tickets": [],
+            "deleted_messages": [],
+            "watermark": sync.current_watermark(get_current_tenant_db()),
+        })
+    try:
+        moment = sync.decode_watermark(since)
+    except sync.InvalidWatermark as exc:
+        raise HttpError(400, str(exc))
+
+    try:
+        changes = sync.changes_since(Ticket.objects.only(*SUMMARY_FIELDS), moment)
+    except sync.ResyncRequired as exc:
+        raise HttpError(410, str(exc))
+
+    return _render(response, {
+        **changes,
+        "tickets": [_serialize_summary(t) for t in changes["tickets"]],
+        "messages": [_serialize_change_message(m) for m in changes["messages"]],
+    })
+
+
+@router.patch("/bulk", response=TicketBulkUpdateOut, auth=jwt_auth)
+def bulk_update_tickets(request, payload: TicketBulkUpdateIn):
+    """
+    Update many tickets with a single UPDATE statement and return how many
+    rows it touched. Every updated ticket gets a fresh updated_at.
+    """
+    if (payload.ids is None) == (payload.filter is None):
+        raise HttpError(400, "Provide exactly one of 'ids' or 'filter'.")
+    if payload.filter is not None and not payload.filter.get_filter_expression():
+        raise HttpError(400, "An empty filter would update every ticket.")
+    if payload.set_status is not None and payload.set_status not in bulk.valid_statuses():
+        raise HttpError(400, f"Unknown status '{payload.set_status}'.")
+    if payload.set_status is None and payload.set_assignee is None and not (
+        payload.add_tags or payload.remove_tags
+    ):
+        raise HttpError(400, "No changes requested.")
+
+    if payload.ids is not None:
+        queryset = Ticket.objects.filter(pk__in=payload.ids)
+    else:
+        queryset = payload.filter.filter(Ticket.objects.all())
+
+    updated = bulk.bulk_update(
+        queryset,
+        set_status=payload.set_status,
+        set_assignee=payload.set_assignee,
+        add_tags=payload.add_tags,
+        remove_tags=payload.remove_tags,
+    )
+    if updated:
+        bump_version(queryset.db)
+    return {"updated": updated}
+
 
-@router.get("/", response=list[TicketOut], auth=jwt_auth)
-def list_tickets(request):
-    """Return all tickets for the current tenant (DB routed via thread-local)."""
-    tickets = Ticket.objects.prefetch_related("messages").all()
-    return [_serialize_ticket(t) for t in tickets]
+@router.get("/archive", response=list[ArchivedTicketSummaryOut], auth=jwt_auth)
+def list_archived_tickets(
+    request,
+    customer_email: str = Query(..., alias="customerEmail"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
+    """A customer's archived tickets, most recently updated first."""
+    rows = (
+        ArchivedTicket.objects.filter(customer_email=customer_email)
+        .order_by("-updated_at")
+        .values("id", "subject", "customer_email", "status", "created_at", "updated_at", "archived_at")
+    )
+    return list(rows[:limit])
 
 
-@router.get("/{ticket_id}", response=TicketOut, auth=jwt_auth)
-def get_ticket(request, ticket_id: int):
-    """Return a single ticket by ID, or 404 if not found."""
+@router.get("/archive/{ticket_id}", response=ArchivedTicketOut, auth=jwt_auth)
+def get_archived_ticket(request, ticket_id: int):
+    """Return one archived ticket as it was when archived, or 404."""
+    row = ArchivedTicket.objects.filter(pk=ticket_id).values("payload", "archived_at").first()
+    if row is None:
+        raise HttpError(404, f"Archived ticket {ticket_id} not found.")
+    return {**row["payload"], "archived_at": row["archived_at"]}
+
+
+@router.get("/{ticket_id}", response=TicketDetailOut, auth=jwt_auth)
+@decorate_view(cached_response)
+def get_ticket(
+    request,
+    response: HttpResponse,
+    ticket_id: int,
+    messages: str | None = Query(None, pattern=r"^(all|latest:\d+)$"),
+):
+    """
+    Return a single ticket by ID, or 404 if not found. `messages=latest:N`
+    embeds only the N most recent messages plus a cursor for older ones.
+    """
+    latest = None
+    if messages and messages.startswith("latest:"):
+        latest = int(messages.split(":", 1)[1])
+        if not 1 <= latest <= MAX_THREAD_PAGE_SIZE:
+            raise HttpError(400, f"messages=latest:N takes N from 1 to {MAX_THREAD_PAGE_SIZE}.")
+
+    validators = conditional.ticket_validators(
+        Ticket.objects.all(), ticket_id, variant=f"latest:{latest}" if latest else ""
+    )
+    if validators is None:
+        raise HttpError(404, f"Ticket {ticket_id} not found.")
+    cached = conditional.not_modified(request, response, *validators)
+    if cached is not None:
+        return cached
+
+    queryset = Ticket.objects.defer("search_vector")
+    if latest is None:
+        queryset = queryset.prefetch_related("messages")
     try:
-        ticket = Ticket.objects.prefetch_related("messages").get(pk=ticket_id)
+        ticket = queryset.get(pk=ticket_id)
     except Ticket.DoesNotExist:
         raise HttpError(404, f"Ticket {ticket_id} not found.")
-    return _serialize_ticket(ticket)
+
+    if latest is None:
+        return _render(response, {**_serialize_ticket(ticket), "older_messages_cursor": None})
+    tail, older_cursor, _ = paginate_thread(ticket.messages.all(), None, None, latest)
+    return _render(response, {
+        **_serialize_ticket(ticket, tail),
+        "older_messages_cursor": older_cursor,
+    })
+
+
+@router.get("/{ticket_id}/messages", response=TicketMessagePageOut, auth=jwt_auth)
+@decorate_view(cached_response)
+def list_ticket_messages(
+    request,
+    response: HttpResponse,
+    ticket_id: int,
+    before: str | None = None,
+    after: str | None = None,
+    limit: int = Query(DEFAULT_THREAD_PAGE_SIZE, ge=1, le=MAX_THREAD_PAGE_SIZE),
+):
+    """
+    One window of the ticket's thread, oldest first. No cursor returns the
+    latest messages; `before=<olderCursor>` loads older ones ("load older"),
+    `after=<newerCursor>` newer ones ("load newer").
+    """
+    validators = conditional.ticket_validators(
+        Ticket.objects.all(), ticket_id, variant=request.get_full_path()
+    )
+    if validators is None:
+        raise HttpError(404, f"Ticket {ticket_id} not found.")
+    cached = conditional.not_modified(request, response, *validators)
+    if cached is not None:
+        return cached
+
+    try:
+        rows, older, newer = paginate_thread(
+            TicketMessage.objects.filter(ticket_id=ticket_id), before, after, limit
+        )
+    except InvalidCursor as exc:
+        raise HttpError(400, f"Invalid cursor: {exc}")
+    return _render(response, {
+        "items": [_serialize_message(msg) for msg in rows],
+        "older_cursor": older,
+        "newer_cursor": newer,
+    })
 
 
-def _serialize_ticket(ticket: Ticket) -> dict:
+def _render(response: HttpResponse, data: dict):
+    """
+    Hand `data` to Ninja for schema validation, or — with FAST_JSON — render
+    it directly: our serializers already emit exactly the schema's fields.
+    """
+    if settings.FAST_JSON:
+        return trusted_response(camelize(data), response)
+    return data
+
+
+def _page(
+    queryset: QuerySet,
+    sort: str,
+    cursor: str | None,
+    limit: int,
+) -> tuple[list[Ticket], str | None]:
+    """Return one keyset page of `queryset` (400 on a bad cursor)."""
+    try:
+        return paginate(queryset, cursor, limit, sort)
+    except InvalidCursor as exc:
+        raise HttpError(400, f"Invalid cursor: {exc}")
+
+
+def _serialize_ticket(ticket: Ticket, messages=None) -> dict:
+    """`messages` overrides the (prefetched) full thread, e.g. with its tail."""
+    if messages is None:
+        messages = ticket.messages.all()
     return {
         "id": ticket.pk,
         "subject": ticket.subject,
@@ -45,13 +467,41 @@ def _serialize_ticket(ticket: Ticket) -> dict:
         "tags": ticket.tags or [],
         "created_at": ticket.created_at,
         "updated_at": ticket.updated_at,
-        "messages": [
-            {
-                "id": str(msg.id),
-                "sender": msg.sender,
-                "body": msg.body,
-                "timestamp": msg.timestamp,
-            }
-            for msg in ticket.messages.all()
-        ],
+        "messages": [_serialize_message(msg) for msg in messages],
+    }
+
+
+def _serialize_message(msg: TicketMessage) -> dict:
+    return {
+        "id": str(msg.id),
+        "sender": msg.sender,
+        "body": msg.body,
+        "timestamp": msg.timestamp,
+    }
+
+
+def _serialize_summary(ticket: Ticket) -> dict:
+    return {
+        "id": ticket.pk,
+        "subject": ticket.subject,
+        "customer_name": ticket.customer_name,
+        "status": ticket.status,
+        "priority": ticket.priority,
+        "channel": ticket.channel,
+        "assignee": ticket.assignee,
+        "tags": ticket.tags or [],
+        "created_at": ticket.created_at,
+        "updated_at": ticket.updated_at,
+        "message_count": ticket.message_count,
+        "last_message_at": ticket.last_message_at,
+        "last_message_sender": ticket.last_message_sender,
+        "last_message_preview": ticket.last_message_preview,
+    }
+
+
+def _serialize_change_message(msg: TicketMessage) -> dict:
+    return {
+        **_serialize_message(msg),
+        "ticket_id": msg.ticket_id,
+        "updated_at": msg.updated_at,
     }
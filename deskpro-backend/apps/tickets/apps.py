@@ -5,3 +5,6 @@ class TicketsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.tickets"
     label = "tickets"
+
+    def ready(self):
+        from apps.tickets import signals  # noqa: F401
@@ -0,0 +1,171 @@
+"""
+Ticket archival tier and retention purge.
+
+Two thresholds per tenant (Tenant.archive_after_days / purge_after_days,
+falling back to TICKET_ARCHIVE_AFTER_DAYS / TICKET_PURGE_AFTER_DAYS):
+
+  archive — resolved/closed tickets not updated for archive_after_days are
+            copied into tickets_archivedticket (lookup columns + the whole
+            ticket with its messages as compressed jsonb) and removed from
+            the hot tables, shrinking every ticket/message index.
+  purge   — archived tickets not updated for purge_after_days are deleted
+            for good. 0 / unset disables purging.
+
+Work happens in small batches, each its own short transaction; rows are
+claimed with SELECT ... FOR UPDATE SKIP LOCKED, so agents editing a ticket
+never wait on the archiver and two archivers never collide. The usual
+triggers fire on the hot-table deletes: stats counters drop, change-feed
+events and delta sync tombstones are written (archived tickets leave
+client replicas like deleted ones).
+"""
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+from apps.tickets.cache import bump_version
+from apps.tickets.models import ArchivedTicket, Ticket
+
+DEFAULT_BATCH_SIZE = 200
+
+ARCHIVABLE_STATUSES = ("resolved", "closed")
+
+_ARCHIVE_UPDATE_FIELDS = [
+    "subject", "customer_email", "status", "created_at", "updated_at", "archived_at", "payload",
+]
+
+
+@dataclass
+class RetentionResult:
+    archived: int = 0
+    purged: int = 0
+    batches: int = 0
+    dry_run: bool = False
+
+
+def retention_for(tenant) -> tuple[int, int]:
+    """(archive_after_days, purge_after_days) for a Tenant; 0 = disabled."""
+    archive_after = tenant.archive_after_days
+    if archive_after is None:
+        archive_after = settings.TICKET_ARCHIVE_AFTER_DAYS
+    purge_after = tenant.purge_after_days
+    if purge_after is None:
+        purge_after = settings.TICKET_PURGE_AFTER_DAYS
+    return archive_after, purge_after
+
+
+def snapshot(ticket: Ticket) -> dict:
+    """The archived form of a ticket (TicketOut fields, snake_case)."""
+    return {
+        "id": ticket.pk,
+        "subject": ticket.subject,
+        "customer_name": ticket.customer_name,
+        "customer_email": ticket.customer_email,
+        "status": ticket.status,
+        "priority": ticket.priority,
+        "channel": ticket.channel,
+        "assignee": ticket.assignee,
+        "tags": ticket.tags or [],
+        "created_at": ticket.created_at,
+        "updated_at": ticket.updated_at,
+        "messages": [
+            {
+                "id": str(msg.id),
+                "sender": msg.sender,
+                "body": msg.body,
+                "timestamp": msg.timestamp,
+            }
+            for msg in ticket.messages.all()
+        ],
+    }
+
+
+class TicketArchiver:
+    def __init__(self, db_alias: str, batch_size: int = DEFAULT_BATCH_SIZE, pause: float = 0.0):
+        self.db_alias = db_alias
+        self.batch_size = batch_size
+        # Seconds to sleep between batches, to go easy on a busy tenant DB
+        self.pause = pause
+
+    def run(self, archive_after_days: int, purge_after_days: int, dry_run: bool = False) -> RetentionResult:
+        result = RetentionResult(dry_run=dry_run)
+        now = timezone.now()
+        if archive_after_days:
+            self.archive(now - timedelta(days=archive_after_days), result)
+        if purge_after_days:
+            self.purge(now - timedelta(days=purge_after_days), result)
+        if result.archived and not dry_run:
+            bump_version(self.db_alias)
+        return result
+
+    def archive(self, cutoff, result: RetentionResult) -> None:
+        candidates = Ticket.objects.using(self.db_alias).filter(
+            status__in=ARCHIVABLE_STATUSES, updated_at__lt=cutoff
+        )
+        if result.dry_run:
+            result.archived += candidates.count()
+            return
+
+        while True:
+            with transaction.atomic(using=self.db_alias):
+                batch = list(
+                    candidates.select_for_update(skip_locked=True)
+                    .defer("search_vector")
+                    .order_by("updated_at", "id")
+                    .prefetch_related("messages")[: self.batch_size]
+                )
+                if not batch:
+                    return
+                self._move(batch)
+            result.archived += len(batch)
+            result.batches += 1
+            if self.pause:
+                time.sleep(self.pause)
+
+    def _move(self, batch: list[Ticket]) -> None:
+        now = timezone.now()
+        ArchivedTicket.objects.using(self.db_alias).bulk_create(
+            [
+                ArchivedTicket(
+                    id=ticket.pk,
+                    subject=ticket.subject,
+                    customer_email=ticket.customer_email,
+                    status=ticket.status,
+                    created_at=ticket.created_at,
+                    updated_at=ticket.updated_at,
+                    archived_at=now,
+                    payload=snapshot(ticket),
+                )
+                for ticket in batch
+            ],
+            update_conflicts=True,
+            unique_fields=["id"],
+            update_fields=_ARCHIVE_UPDATE_FIELDS,
+        )
+        ids = [ticket.pk for ticket in batch]
+        with connections[self.db_alias].cursor() as cursor:
+            # Tickets first: the message FK is DEFERRABLE INITIALLY DEFERRED,
+            # and this way the message-summary trigger finds no tickets left
+            # to refresh instead of rewriting rows about to disappear.
+            cursor.execute("DELETE FROM tickets_ticket WHERE id = ANY(%s)", [ids])
+            cursor.execute("DELETE FROM tickets_ticketmessage WHERE ticket_id = ANY(%s)", [ids])
+
+    def purge(self, cutoff, result: RetentionResult) -> None:
+        expired = ArchivedTicket.objects.using(self.db_alias).filter(updated_at__lt=cutoff)
+        if result.dry_run:
+            result.purged += expired.count()
+            return
+
+        while True:
+            ids = list(expired.order_by("updated_at", "id").values_list("id", flat=True)[: self.batch_size])
+            if not ids:
+                return
+            with transaction.atomic(using=self.db_alias):
+                ArchivedTicket.objects.using(self.db_alias).filter(id__in=ids).delete()
+            result.purged += len(ids)
+            result.batches += 1
+            if self.pause:
+                time.sleep(self.pause)
@@ -3,18 +3,17 @@ CookieAuth — Ninja cookie authentication class.
 
 Reads the access_token from the httpOnly cookie set at login.
 The decoded payload is available as `request.auth` in protected endpoints.
+TenantMiddleware has normally verified the token already; its auth context
+is reused rather than decoding the JWT a second time.
 """
 from ninja.security import APIKeyCookie
 
+from core.auth_context import COOKIE_NAME, authenticate
+
 
 class CookieAuth(APIKeyCookie):
-    param_name = "access_token"
+    param_name = COOKIE_NAME
 
     def authenticate(self, request, key: str) -> dict | None:
-        try:
-            from rest_framework_simplejwt.tokens import AccessToken
-
-            decoded = AccessToken(key)
-            return dict(decoded.payload)
-        except Exception:
-            return None
+        context = authenticate(request, key)
+        return context.payload if context is not None else None
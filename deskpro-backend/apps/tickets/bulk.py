@@ -0,0 +1,64 @@
+"""
+Bulk ticket updates — one UPDATE statement per request.
+
+All requested changes (status, assignee, tag additions/removals) are folded
+into a single `UPDATE tickets_ticket SET ... WHERE <selection>`; tags are
+rewritten in SQL with nested array_remove / array_append calls, so no
+ticket row ever travels to Python. Postgres plans `id IN (...)` as
+`id = ANY(...)`, served by the primary key index.
+
+QuerySet.update() does not send model signals, so callers bump the tenant's
+cache version themselves (see apps.tickets.api.bulk_update_tickets).
+"""
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+from django.db.models import F, Func, QuerySet, Value
+from django.utils import timezone
+
+from apps.tickets.models import Ticket
+
+_TAGS_FIELD = ArrayField(models.CharField(max_length=100))
+
+
+def _array_func(function: str, array, tag: str) -> Func:
+    return Func(
+        array,
+        Value(tag, output_field=models.CharField()),
+        function=function,
+        output_field=_TAGS_FIELD,
+    )
+
+
+def tags_expression(add: list[str], remove: list[str]):
+    """
+    SQL expression for the new `tags` value. Added tags are removed first,
+    so a tag that is already present is not duplicated.
+    """
+    expr = F("tags")
+    for tag in remove:
+        expr = _array_func("array_remove", expr, tag)
+    for tag in add:
+        expr = _array_func("array_append", _array_func("array_remove", expr, tag), tag)
+    return expr
+
+
+def bulk_update(
+    queryset: QuerySet,
+    set_status: str | None = None,
+    set_assignee: str | None = None,
+    add_tags: list[str] | None = None,
+    remove_tags: list[str] | None = None,
+) -> int:
+    """Apply the changes to every ticket in `queryset`; return rows updated."""
+    values = {"updated_at": timezone.now()}
+    if set_status is not None:
+        values["status"] = set_status
+    if set_assignee is not None:
+        values["assignee"] = set_assignee
+    if add_tags or remove_tags:
+        values["tags"] = tags_expression(add_tags or [], remove_tags or [])
+    return queryset.order_by().update(**values)
+
+
+def valid_statuses() -> set[str]:
+    return {value for value, _ in Ticket.STATUS_CHOICES}
@@ -0,0 +1,120 @@
+"""
+Per-tenant response cache for ticket reads.
+
+Rendered GET responses are stored under
+    tickets:{tenant alias}:{data version}:{md5(path + query)}
+where the data version is a per-tenant counter bumped by every Ticket /
+TicketMessage save or delete (apps.tickets.signals). A bump makes all older
+entries of that tenant unreachable at once, so a stale entry is never
+served; they simply age out of the backend's LRU.
+
+Backend is the "tickets" alias in settings.CACHES:
+  - LocMemCache for single-process dev (bounded by MAX_ENTRIES, LRU)
+  - RedisCache when TICKET_CACHE_URL is set — required with several
+    workers, otherwise a bump in one process is invisible to the others.
+
+Cached entries keep the ETag/Last-Modified headers of the original
+response, so a hit still answers conditional GETs with 304.
+"""
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+from core import metrics
+from core.thread_local import get_current_tenant_db
+
+CACHE_ALIAS = "tickets"
+
+# Headers replayed on a cache hit
+_KEPT_HEADERS = ("ETag", "Last-Modified", "Cache-Control")
+
+
+def _cache():
+    return caches[CACHE_ALIAS]
+
+
+def _version_key(alias: str) -> str:
+    return f"tickets:version:{alias}"
+
+
+def data_version(alias: str) -> int:
+    """Current data version of a tenant, initialising it if missing."""
+    cache = _cache()
+    version = cache.get(_version_key(alias))
+    if version is None:
+        # Seed from the clock rather than 1: if the version key itself was
+        # evicted, entries cached under earlier versions must stay unreachable.
+        cache.add(_version_key(alias), time.time_ns() // 1000, timeout=None)
+        version = cache.get(_version_key(alias))
+    return version
+
+
+def bump_version(alias: str) -> None:
+    """Invalidate every cached response of a tenant."""
+    cache = _cache()
+    try:
+        cache.incr(_version_key(alias))
+    except ValueError:
+        # Key missing — seeding it is as good as bumping
+        data_version(alias)
+    metrics.incr("ticket_cache.invalidations")
+
+
+def _entry_key(alias: str, version: int, request: HttpRequest) -> str:
+    digest = hashlib.md5(request.get_full_path().encode()).hexdigest()
+    return f"tickets:{alias}:{version}:{digest}"
+
+
+def cached_response(view):
+    """
+    View decorator (use via ninja.decorators.decorate_view) that serves and
+    stores rendered 200 responses for the current tenant.
+    """
+    @wraps(view)
+    def wrapper(request: HttpRequest, *args, **kwargs):
+        alias = get_current_tenant_db()
+        if alias is None or request.method != "GET":
+            return view(request, *args, **kwargs)
+
+        # Read the version before running the view: if a write lands while
+        # we render, the entry is stored under the old, already dead version.
+        key = _entry_key(alias, data_version(alias), request)
+        entry = _cache().get(key)
+        if entry is not None:
+            metrics.incr("ticket_cache.hits")
+            return _replay(request, entry)
+
+        metrics.incr("ticket_cache.misses")
+        response = view(request, *args, **kwargs)
+        if response.status_code == 200 and not response.streaming:
+            _cache().set(
+                key,
+                {
+                    "content": response.content,
+                    "content_type": response["Content-Type"],
+                    "headers": {h: response[h] for h in _KEPT_HEADERS if h in response},
+                },
+                settings.TICKET_CACHE_TIMEOUT,
+            )
+        return response
+
+    return wrapper
+
+
+def _replay(request: HttpRequest, entry: dict) -> HttpResponse:
+    response = HttpResponse(entry["content"], content_type=entry["content_type"])
+    for header, value in entry["headers"].items():
+        response[header] = value
+    last_modified = response.get("Last-Modified")
+    return get_conditional_response(
+        request,
+        etag=response.get("ETag"),
+        last_modified=parse_http_date_safe(last_modified) if last_modified else None,
+        response=response,
+    )
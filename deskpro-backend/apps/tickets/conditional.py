@@ -0,0 +1,71 @@
+"""
+Conditional GET support (ETag / Last-Modified → 304) for ticket endpoints.
+
+Validators are computed from one cheap query before anything is loaded or
+serialized:
+
+  list    — COUNT(*) + MAX(updated_at) over the filtered tickets, mixed with
+            the tenant alias and full query string (every page and filter
+            combination gets its own ETag). A ticket delete changes the
+            count but not MAX(updated_at), so lists send an ETag only.
+  detail  — the ticket's updated_at, sent as both ETag and Last-Modified.
+
+New or deleted messages bump their ticket's updated_at (see
+apps.tickets.signals), so both validators also cover the message thread.
+"""
+import hashlib
+from datetime import datetime
+
+from django.db.models import Count, Max, QuerySet
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from core.thread_local import get_current_tenant_db
+
+
+def list_etag(request: HttpRequest, queryset: QuerySet) -> str:
+    """ETag for a (filtered) ticket list — one aggregate query."""
+    agg = queryset.order_by().aggregate(count=Count("id"), latest=Max("updated_at"))
+    latest = agg["latest"].isoformat() if agg["latest"] else "-"
+    raw = f"{get_current_tenant_db()}|{request.get_full_path()}|{agg['count']}|{latest}"
+    return quote_etag(hashlib.md5(raw.encode()).hexdigest())
+
+
+def ticket_validators(
+    queryset: QuerySet, ticket_id: int, variant: str = ""
+) -> tuple[str, datetime] | None:
+    """
+    (ETag, Last-Modified) for one ticket, or None if it does not exist.
+    `variant` distinguishes different representations of the same ticket
+    (e.g. a message window), which must not share an ETag.
+    """
+    updated_at = queryset.filter(pk=ticket_id).values_list("updated_at", flat=True).first()
+    if updated_at is None:
+        return None
+    raw = f"{get_current_tenant_db()}|{ticket_id}|{variant}|{updated_at.isoformat()}"
+    return quote_etag(hashlib.md5(raw.encode()).hexdigest()), updated_at
+
+
+def not_modified(
+    request: HttpRequest,
+    response: HttpResponse,
+    etag: str,
+    last_modified: datetime | None = None,
+) -> HttpResponse | None:
+    """
+    Stamp validators on Ninja's temporal `response` and return a 304 if the
+    client's If-None-Match / If-Modified-Since still match, else None.
+    """
+    response.headers["ETag"] = etag
+    # Browsers must revalidate every poll, but may reuse the body on 304
+    response.headers["Cache-Control"] = "private, no-cache"
+    timestamp = None
+    if last_modified is not None:
+        timestamp = int(last_modified.timestamp())
+        response.headers["Last-Modified"] = http_date(timestamp)
+
+    result = get_conditional_response(
+        request, etag=etag, last_modified=timestamp, response=response
+    )
+    return None if result is response else result
@@ -0,0 +1,400 @@
+"""
+Server-Sent Events change feed for tickets.
+
+Source of truth is the TicketEvent log, written and announced via
+pg_notify('ticket_events') by statement-level DB triggers (migration
+0013): one notification per statement, carrying its events, or for a
+large statement only their id range, which the listener reads back from
+the log (one reset instead, past MAX_REPLAY). Each worker process runs one
+EventHub that fans events out to every connected agent:
+
+  listen  (default) — a feeder thread per database holds a dedicated
+          connection doing LISTEN ticket_events, so writes from any worker
+          or script reach every subscriber. Schema tenants notify on their
+          schema's name, and all those of the shared database go through
+          one feeder (one connection) LISTENing on each of their channels.
+  local   — no LISTEN; Django signals ask the hub to read new TicketEvent
+          rows after each commit (apps.tickets.signals). Only sees writes
+          made by this process — for single-process dev against a local
+          Postgres. Set TICKET_EVENTS_BACKEND=local.
+
+Feeders start with the first subscriber of a database and stop after the
+last one leaves. Reconnecting clients send Last-Event-ID and get the missed
+events replayed from the log; if they were gone longer than the retention
+window they receive a `reset` event and should refetch.
+
+Event ids come from a sequence, so they are handed out in insert order, not
+commit order: a transaction can commit event 41 after event 42 was sent.
+Streams therefore remember the ids they sent instead of a high-water mark,
+and replays start REPLAY_OVERLAP ids before Last-Event-ID. Delivery is at
+least once; clients treat events as idempotent "refetch this" hints.
+
+Streams hold a worker thread each, so serve them from a threaded server
+(runserver, gunicorn gthread). They do not hold a tenant DB connection:
+after the replay a stream hands its connection back to the pool.
+"""
+import json
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from datetime import timedelta
+
+import psycopg
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+from psycopg import sql
+
+from apps.tickets.models import TicketEvent
+from core import metrics
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "ticket_events"
+
+# Seconds between SSE comment lines keeping proxies from closing idle streams
+KEEPALIVE_SECONDS = 15
+
+# Longest a feeder waits for notifications before (UN)LISTENing for tenants
+# that (un)subscribed meanwhile
+LISTEN_POLL_SECONDS = 1.0
+
+# Events replayed on reconnect before giving up and sending `reset`
+MAX_REPLAY = 1000
+
+# Ids before Last-Event-ID replayed too: events of transactions that were
+# still open when the client saw Last-Event-ID and committed later
+REPLAY_OVERLAP = 100
+
+# Event ids each stream remembers having sent, to drop duplicates
+SEEN_IDS = 4096
+
+# Per-subscriber buffer; a client that falls this far behind is reset
+SUBSCRIBER_QUEUE_SIZE = 1000
+
+_PRUNE_EVERY_SECONDS = 3600
+
+_RESET = {"kind": "reset"}
+
+_EVENT_FIELDS = ("id", "kind", "op", "ticket_id", "message_id", "created_at")
+
+
+def channel_for(schema: str | None) -> str:
+    """NOTIFY channel of a tenant: its schema name for schema storage (migration 0012)."""
+    return schema or CHANNEL
+
+
+def format_sse(event: dict) -> str:
+    """Render one event in text/event-stream framing."""
+    if event.get("kind") == "reset":
+        return "event: reset\ndata: {}\n\n"
+    payload = json.dumps(
+        {
+            "kind": event["kind"],
+            "op": event["op"],
+            "ticketId": event["ticket_id"],
+            "messageId": str(event["message_id"]) if event.get("message_id") else None,
+            "createdAt": str(event["created_at"]),
+        }
+    )
+    return f"id: {event['id']}\nevent: {event['kind']}\ndata: {payload}\n\n"
+
+
+def replay(db_alias: str, last_event_id: int) -> list[dict] | None:
+    """
+    Events after `last_event_id`, and the REPLAY_OVERLAP before it, or None
+    if the client must resync (too many missed, or its position was
+    already pruned).
+    """
+    events = TicketEvent.objects.using(db_alias)
+    oldest = events.order_by("id").values_list("id", flat=True).first()
+    if oldest is not None and last_event_id < oldest - 1:
+        return None
+    limit = MAX_REPLAY + REPLAY_OVERLAP
+    rows = list(
+        events.filter(id__gt=last_event_id - REPLAY_OVERLAP)
+        .order_by("id")
+        .values(*_EVENT_FIELDS)[: limit + 1]
+    )
+    if len(rows) > limit:
+        return None
+    return rows
+
+
+def prune(db_alias: str) -> int:
+    """Delete events older than TICKET_EVENTS_RETENTION seconds."""
+    cutoff = timezone.now() - timedelta(seconds=settings.TICKET_EVENTS_RETENTION)
+    deleted, _ = TicketEvent.objects.using(db_alias).filter(created_at__lt=cutoff).delete()
+    return deleted
+
+
+class _RecentIds:
+    """The last `size` event ids a stream sent (oldest forgotten first)."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._order: deque[int] = deque()
+        self._ids: set[int] = set()
+
+    def add(self, event_id: int) -> bool:
+        """Remember `event_id`; False if it was already there."""
+        if event_id in self._ids:
+            return False
+        self._ids.add(event_id)
+        self._order.append(event_id)
+        if len(self._order) > self.size:
+            self._ids.discard(self._order.popleft())
+        return True
+
+
+class Subscription:
+    def __init__(self, db_alias: str):
+        self.db_alias = db_alias
+        self.queue: queue.Queue = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def push(self, event: dict) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            # Too slow to keep up — drop the backlog, tell it to resync
+            with self.queue.mutex:
+                self.queue.queue.clear()
+            self.queue.put_nowait(_RESET)
+
+    def get(self, timeout: float) -> dict | None:
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class _Feeder(threading.Thread):
+    """
+    LISTENs on one database and hands each notification to the hub under
+    the alias of the tenant whose channel it came in on. A database tenant
+    has a feeder of its own; the schema tenants of the shared database share
+    one, and it LISTENs on the channel of each one subscribed in this process.
+    """
+
+    def __init__(self, hub: "EventHub", key: str, db_alias: str):
+        super().__init__(name=f"ticket-events-{key}", daemon=True)
+        self.hub = hub
+        self.key = key
+        params = connections[db_alias].get_connection_params()
+        params.pop("cursor_factory", None)
+        self.params = params
+        self.stopping = threading.Event()
+        # channel → (alias, schema) wanted by the hub, applied by the feeder thread
+        self._tenants: dict[str, tuple[str, str | None]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, db_alias: str) -> None:
+        schema = connections[db_alias].settings_dict.get("SCHEMA")
+        with self._lock:
+            self._tenants[channel_for(schema)] = (db_alias, schema)
+
+    def remove(self, db_alias: str) -> bool:
+        """Stop feeding `db_alias`; True if no tenant is left."""
+        with self._lock:
+            for channel, (alias, _) in list(self._tenants.items()):
+                if alias == db_alias:
+                    del self._tenants[channel]
+            return not self._tenants
+
+    def _snapshot(self) -> dict[str, tuple[str, str | None]]:
+        with self._lock:
+            return dict(self._tenants)
+
+    def run(self):
+        while not self.stopping.is_set():
+            try:
+                self._listen()
+            except Exception as exc:
+                metrics.incr("ticket_events.listener_errors")
+                logger.warning("Event listener for '%s' failed: %s", self.key, exc)
+                for alias, _ in self._snapshot().values():
+                    self.hub.broadcast(alias, _RESET)
+                self.stopping.wait(5)
+
+    def _listen(self):
+        with psycopg.connect(**self.params, autocommit=True) as conn:
+            listening: dict[str, tuple[str, str | None]] = {}
+            last_prune = 0.0
+            while not self.stopping.is_set():
+                wanted = self._snapshot()
+                for channel in listening.keys() - wanted.keys():
+                    conn.execute(sql.SQL("UNLISTEN {}").format(sql.Identifier(channel)))
+                for channel in wanted.keys() - listening.keys():
+                    conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel)))
+                listening = wanted
+
+                # Drain the generator before querying: it holds the connection
+                # (later notifications wait in psycopg's backlog). The short
+                # timeout picks up newly subscribed tenants.
+                received = list(conn.notifies(timeout=LISTEN_POLL_SECONDS, stop_after=1))
+                for notify in received:
+                    tenant = listening.get(notify.channel)
+                    if tenant is None:
+                        continue   # UNLISTENed since
+                    alias, schema = tenant
+                    for event in self._events(conn, schema, json.loads(notify.payload)):
+                        self.hub.broadcast(alias, event)
+
+                if time.monotonic() - last_prune > _PRUNE_EVERY_SECONDS:
+                    last_prune = time.monotonic()
+                    for _, schema in listening.values():
+                        conn.execute(
+                            sql.SQL("DELETE FROM {} WHERE created_at < now() - %s").format(
+                                _event_table(schema)
+                            ),
+                            [timedelta(seconds=settings.TICKET_EVENTS_RETENTION)],
+                        )
+
+    @staticmethod
+    def _events(conn, schema: str | None, message: dict) -> list[dict]:
+        """The events of one notification (see migration 0013 for its shape)."""
+        if "events" in message:
+            return message["events"]
+        if message["count"] > MAX_REPLAY:
+            # A bulk statement (import, archive batch): cheaper to refetch
+            metrics.incr("ticket_events.bulk_resets")
+            return [_RESET]
+        # Rows of other transactions in the range come again with their own
+        # notification; streams drop the duplicates
+        row = conn.execute(
+            sql.SQL(
+                "SELECT json_agg(e ORDER BY e.id) FROM {} e WHERE e.id BETWEEN %s AND %s"
+            ).format(_event_table(schema)),
+            [message["first"], message["last"]],
+        ).fetchone()
+        return row[0] or []
+
+
+def _event_table(schema: str | None) -> sql.Composable:
+    """tickets_ticketevent, qualified with the tenant's schema for schema storage."""
+    if schema:
+        return sql.Identifier(schema, "tickets_ticketevent")
+    return sql.Identifier("tickets_ticketevent")
+
+
+def _feeder_key(db_alias: str) -> str:
+    """Aliases with the same key share a feeder: the shared database's schema tenants."""
+    return connections[db_alias].settings_dict.get("SHARED_POOL") or db_alias
+
+
+class EventHub:
+    """Per-process fan-out of tenant change events to SSE subscribers."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._feeders: dict[str, _Feeder] = {}
+        self._local_cursor: dict[str, int] = {}
+
+    @property
+    def local_mode(self) -> bool:
+        return settings.TICKET_EVENTS_BACKEND == "local"
+
+    def subscribe(self, db_alias: str) -> Subscription:
+        sub = Subscription(db_alias)
+        with self._lock:
+            self._subscribers.setdefault(db_alias, set()).add(sub)
+            if not self.local_mode:
+                key = _feeder_key(db_alias)
+                feeder = self._feeders.get(key)
+                if feeder is None:
+                    feeder = self._feeders[key] = _Feeder(self, key, db_alias)
+                    feeder.start()
+                feeder.add(db_alias)
+            if self.local_mode and db_alias not in self._local_cursor:
+                latest = TicketEvent.objects.using(db_alias).order_by("-id").values_list(
+                    "id", flat=True
+                ).first()
+                self._local_cursor[db_alias] = latest or 0
+                prune(db_alias)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            subs = self._subscribers.get(sub.db_alias)
+            if subs is None:
+                return
+            subs.discard(sub)
+            if not subs:
+                del self._subscribers[sub.db_alias]
+                key = _feeder_key(sub.db_alias)
+                feeder = self._feeders.get(key)
+                if feeder is not None and feeder.remove(sub.db_alias):
+                    del self._feeders[key]
+                    feeder.stopping.set()
+                self._local_cursor.pop(sub.db_alias, None)
+
+    def broadcast(self, db_alias: str, event: dict) -> None:
+        with self._lock:
+            subs = list(self._subscribers.get(db_alias, ()))
+        for sub in subs:
+            sub.push(event)
+        metrics.incr("ticket_events.delivered", len(subs))
+
+    def poll_local(self, db_alias: str) -> None:
+        """local mode: fan out TicketEvent rows committed since the last poll."""
+        with self._lock:
+            last_id = self._local_cursor.get(db_alias)
+        if last_id is None:
+            return  # nobody listening to this tenant
+        # Look back REPLAY_OVERLAP ids for events that committed out of id
+        # order; streams drop the ones they already sent
+        rows = list(
+            TicketEvent.objects.using(db_alias)
+            .filter(id__gt=last_id - REPLAY_OVERLAP)
+            .order_by("id")
+            .values(*_EVENT_FIELDS)
+        )
+        if not rows:
+            return
+        with self._lock:
+            if db_alias in self._local_cursor:
+                self._local_cursor[db_alias] = max(self._local_cursor[db_alias], rows[-1]["id"])
+        for row in rows:
+            self.broadcast(db_alias, row)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subs) for subs in self._subscribers.values())
+
+
+hub = EventHub()
+metrics.register_gauge("ticket_events.subscribers", hub.subscriber_count)
+
+
+def stream(db_alias: str, last_event_id: int | None):
+    """Generator of SSE frames for one client; runs until it disconnects."""
+    sub = hub.subscribe(db_alias)
+    try:
+        yield "retry: 3000\n: connected\n\n"
+        sent = _RecentIds(SEEN_IDS)
+        if last_event_id is not None:
+            missed = replay(db_alias, last_event_id)
+            if missed is None:
+                yield format_sse(_RESET)
+            else:
+                for event in missed:
+                    sent.add(event["id"])
+                    yield format_sse(event)
+        # Nothing below queries on this thread: give the connection back to
+        # the tenant's pool now rather than when the client disconnects
+        connections[db_alias].close()
+
+        while True:
+            event = sub.get(timeout=KEEPALIVE_SECONDS)
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+            # Already replayed, or read twice (overlapping polls or id ranges)
+            if event.get("kind") != "reset" and not sent.add(event["id"]):
+                continue
+            yield format_sse(event)
+    finally:
+        hub.unsubscribe(sub)
@@ -0,0 +1,341 @@
+"""
+Bulk ticket import into a tenant DB via psycopg3 COPY.
+
+Accepts the same formats GET /api/tickets/export produces:
+  ndjson — one ticket per line, messages embedded (camelCase or snake_case keys)
+  csv    — one row per message with ticket columns repeated; rows sharing
+           a ticket_id must be adjacent (CSV_COLUMNS in apps.tickets.export)
+
+Each batch of tickets is written in one transaction:
+  1. reserve ticket ids from the table's sequence (one query)
+  2. COPY tickets_ticket, COPY tickets_ticketmessage
+  3. rebuild search vectors for the batch
+  4. record the number of source tickets consumed under the import's
+     checkpoint key (TicketImportProgress)
+so a re-run with the same key skips exactly the committed batches, even
+after a crash right after a commit. COPY bypasses model signals, so derived state normally kept by
+apps.tickets.signals is refreshed explicitly (_after_batch, and one cache
+version bump at the end of run()). Imports that preserve timestamps also
+force delta sync clients to resync (apps.tickets.sync.mark_resync).
+
+Source ids are not kept: tickets get fresh ids from the sequence and
+messages fresh uuid7s, so importing the same export twice (or into the
+tenant it came from) adds copies instead of failing on duplicate keys.
+"""
+import csv
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone as dt_timezone
+from itertools import groupby, islice
+from typing import IO, Iterable, Iterator
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import connections, transaction
+from django.utils import timezone
+
+from apps.tickets.cache import bump_version
+from apps.tickets.models import Ticket, TicketImportProgress, TicketMessage
+from apps.tickets.search import rebuild_search_vectors
+from apps.tickets.sync import mark_resync
+from core.ids import uuid7
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Errors listed in the result; invalid records past this are only counted
+MAX_REPORTED_ERRORS = 50
+
+TICKET_COLUMNS = (
+    "id", "subject", "customer_name", "customer_email", "status", "priority",
+    "channel", "assignee", "tags", "created_at", "updated_at",
+)
+MESSAGE_COLUMNS = ("id", "ticket_id", "sender", "body", "timestamp")
+
+# Thread summary of a ticket with no messages yet; COPY skips column
+# defaults, and the summary triggers (migration 0006) add the messages
+SUMMARY_COLUMNS = ("message_count", "last_message_sender", "last_message_preview")
+EMPTY_SUMMARY = (0, "", "")
+
+_CHOICES = {
+    "status": {value for value, _ in Ticket.STATUS_CHOICES},
+    "priority": {value for value, _ in Ticket.PRIORITY_CHOICES},
+    "channel": {value for value, _ in Ticket.CHANNEL_CHOICES},
+}
+_DEFAULTS = {"status": "open", "priority": "medium", "channel": "email", "assignee": ""}
+
+# Column widths, so an over-long value is a record error rather than a failed COPY
+_MAX_LENGTHS = {
+    name: Ticket._meta.get_field(name).max_length
+    for name in ("subject", "customer_name", "customer_email", "assignee")
+}
+_TAG_MAX_LENGTH = Ticket._meta.get_field("tags").base_field.max_length
+_SENDER_MAX_LENGTH = TicketMessage._meta.get_field("sender").max_length
+
+
+class RecordError(ValueError):
+    """A source record that cannot be imported."""
+
+    def __init__(self, position: int, message: str):
+        super().__init__(f"record {position}: {message}")
+        self.position = position
+
+
+@dataclass
+class ImportResult:
+    tickets: int = 0
+    messages: int = 0
+    batches: int = 0
+    skipped: int = 0          # already imported according to the checkpoint
+    invalid: int = 0
+    errors: list[str] = field(default_factory=list)
+    dry_run: bool = False
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+def _snake(key: str) -> str:
+    return "".join(f"_{c.lower()}" if c.isupper() else c for c in key)
+
+
+def read_ndjson(stream: IO[str]) -> Iterator[dict]:
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            raw = json.loads(line)
+        except ValueError as exc:
+            yield {"_error": f"invalid JSON: {exc}"}
+            continue
+        record = {_snake(k): v for k, v in raw.items()}
+        record["messages"] = [
+            {_snake(k): v for k, v in msg.items()} for msg in record.get("messages") or []
+        ]
+        yield record
+
+
+def read_csv(stream: IO[str]) -> Iterator[dict]:
+    rows = csv.DictReader(stream)
+    for _, group in groupby(rows, key=lambda row: row.get("ticket_id")):
+        group = list(group)
+        first = group[0]
+        try:
+            tags = json.loads(first.get("tags") or "[]")
+        except ValueError:
+            tags = [t for t in (first.get("tags") or "").split(",") if t]
+        yield {
+            **{col: first.get(col) for col in TICKET_COLUMNS[1:] if col != "tags"},
+            "tags": tags,
+            "messages": [
+                {
+                    "sender": row.get("message_sender"),
+                    "body": row.get("message_body"),
+                    "timestamp": row.get("message_timestamp") or None,
+                }
+                for row in group
+                if row.get("message_sender") or row.get("message_body")
+            ],
+        }
+
+
+READERS = {"ndjson": read_ndjson, "csv": read_csv}
+
+
+# ---------------------------------------------------------------------------
+# Validation
+# ---------------------------------------------------------------------------
+
+def _timestamp(value, position: int, name: str) -> datetime | None:
+    if value in (None, ""):
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        raise RecordError(position, f"{name} is not an ISO 8601 timestamp")
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, dt_timezone.utc)
+    return parsed
+
+
+def validate_record(record: dict, position: int, preserve_timestamps: bool) -> dict:
+    """Return a normalized ticket dict ready for COPY, or raise RecordError."""
+    if "_error" in record:
+        raise RecordError(position, record["_error"])
+
+    ticket = {}
+    for name in ("subject", "customer_name", "customer_email"):
+        value = (record.get(name) or "").strip()
+        if not value:
+            raise RecordError(position, f"{name} is required")
+        ticket[name] = value
+    try:
+        validate_email(ticket["customer_email"])
+    except ValidationError:
+        raise RecordError(position, "customer_email is not a valid address")
+
+    for name, default in _DEFAULTS.items():
+        value = record.get(name) or default
+        if name in _CHOICES and value not in _CHOICES[name]:
+            raise RecordError(position, f"{name} '{value}' is not one of {sorted(_CHOICES[name])}")
+        ticket[name] = value
+    for name, max_length in _MAX_LENGTHS.items():
+        if len(ticket[name]) > max_length:
+            raise RecordError(position, f"{name} is longer than {max_length} characters")
+
+    tags = record.get("tags") or []
+    if not isinstance(tags, list) or not all(isinstance(t, str) for t in tags):
+        raise RecordError(position, "tags must be a list of strings")
+    if any(len(t) > _TAG_MAX_LENGTH for t in tags):
+        raise RecordError(position, f"tags must be at most {_TAG_MAX_LENGTH} characters each")
+    ticket["tags"] = tags
+
+    now = timezone.now()
+    if preserve_timestamps:
+        ticket["created_at"] = _timestamp(record.get("created_at"), position, "created_at") or now
+        ticket["updated_at"] = (
+            _timestamp(record.get("updated_at"), position, "updated_at") or ticket["created_at"]
+        )
+    else:
+        ticket["created_at"] = ticket["updated_at"] = now
+
+    ticket["messages"] = []
+    for msg in record.get("messages") or []:
+        if not msg.get("sender") or msg.get("body") is None:
+            raise RecordError(position, "every message needs sender and body")
+        if len(msg["sender"]) > _SENDER_MAX_LENGTH:
+            raise RecordError(position, f"message sender is longer than {_SENDER_MAX_LENGTH} characters")
+        timestamp = None
+        if preserve_timestamps:
+            timestamp = _timestamp(msg.get("timestamp"), position, "message timestamp")
+        ticket["messages"].append({
+            "id": uuid7(),
+            "sender": msg["sender"],
+            "body": msg["body"],
+            "timestamp": timestamp or now,
+        })
+    return ticket
+
+
+# ---------------------------------------------------------------------------
+# Checkpoints
+# ---------------------------------------------------------------------------
+
+def read_checkpoint(db_alias: str, key: str | None) -> int:
+    if not key:
+        return 0
+    progress = TicketImportProgress.objects.using(db_alias).filter(key=key).first()
+    return progress.records_done if progress else 0
+
+
+def write_checkpoint(db_alias: str, key: str | None, records_done: int) -> None:
+    """Record progress; call inside the transaction that committed the records."""
+    if not key:
+        return
+    TicketImportProgress.objects.using(db_alias).update_or_create(
+        key=key, defaults={"records_done": records_done}
+    )
+
+
+# ---------------------------------------------------------------------------
+# Import
+# ---------------------------------------------------------------------------
+
+class TicketImporter:
+    def __init__(
+        self,
+        db_alias: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        preserve_timestamps: bool = True,
+        checkpoint: str | None = None,
+    ):
+        self.db_alias = db_alias
+        self.batch_size = batch_size
+        self.preserve_timestamps = preserve_timestamps
+        self.checkpoint = checkpoint
+
+    def run(self, records: Iterable[dict], dry_run: bool = False) -> ImportResult:
+        """
+        Validate and import `records`. A dry run validates everything and
+        reports all errors; a real run stops at the first invalid record
+        (fix it and re-run — the checkpoint skips what was committed).
+        """
+        result = ImportResult(dry_run=dry_run)
+        done = 0 if dry_run else read_checkpoint(self.db_alias, self.checkpoint)
+        result.skipped = done
+        records = islice(records, done, None)
+        position = done
+
+        batch: list[dict] = []
+        for record in records:
+            position += 1
+            try:
+                batch.append(validate_record(record, position, self.preserve_timestamps))
+            except RecordError as exc:
+                result.invalid += 1
+                if len(result.errors) < MAX_REPORTED_ERRORS:
+                    result.errors.append(str(exc))
+                if dry_run:
+                    continue
+                raise
+
+            if len(batch) >= self.batch_size:
+                done += len(batch)
+                self._flush(batch, result, dry_run, done)
+                batch = []
+
+        if batch:
+            done += len(batch)
+            self._flush(batch, result, dry_run, done)
+
+        if not dry_run and result.tickets:
+            bump_version(self.db_alias)
+            if self.preserve_timestamps:
+                # Historical updated_at values are invisible to delta sync
+                mark_resync(self.db_alias)
+        return result
+
+    def _flush(self, batch: list[dict], result: ImportResult, dry_run: bool, done: int) -> None:
+        """Write `batch`; `done` counts the source records consumed once it commits."""
+        result.batches += 1
+        result.tickets += len(batch)
+        result.messages += sum(len(t["messages"]) for t in batch)
+        if dry_run:
+            return
+        with transaction.atomic(using=self.db_alias):
+            ids = self._copy_batch(batch)
+            self._after_batch(ids)
+            write_checkpoint(self.db_alias, self.checkpoint, done)
+
+    def _copy_batch(self, batch: list[dict]) -> list[int]:
+        connection = connections[self.db_alias]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence('tickets_ticket', 'id')) "
+                "FROM generate_series(1, %s)",
+                [len(batch)],
+            )
+            ids = [row[0] for row in cursor.fetchall()]
+
+            with cursor.copy(
+                f"COPY tickets_ticket ({', '.join(TICKET_COLUMNS + SUMMARY_COLUMNS)}) FROM STDIN"
+            ) as copy:
+                for ticket_id, ticket in zip(ids, batch):
+                    copy.write_row(
+                        (ticket_id, *(ticket[col] for col in TICKET_COLUMNS[1:]), *EMPTY_SUMMARY)
+                    )
+
+            with cursor.copy(
+                f"COPY tickets_ticketmessage ({', '.join(MESSAGE_COLUMNS)}) FROM STDIN"
+            ) as copy:
+                for ticket_id, ticket in zip(ids, batch):
+                    for msg in ticket["messages"]:
+                        copy.write_row(
+                            (msg["id"], ticket_id, msg["sender"], msg["body"], msg["timestamp"])
+                        )
+        return ids
+
+    def _after_batch(self, ticket_ids: list[int]) -> None:
+        """Refresh state that signals would normally maintain for these tickets."""
+        rebuild_search_vectors(ticket_ids, using=self.db_alias)
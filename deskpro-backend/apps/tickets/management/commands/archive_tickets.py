@@ -0,0 +1,77 @@
+"""
+Management command: archive_tickets
+
+Moves old resolved/closed tickets into the archive table and purges
+archived tickets past the purge threshold (see apps.tickets.archive), on
+every active tenant (or one). Thresholds come from the Tenant row, falling
+back to TICKET_ARCHIVE_AFTER_DAYS / TICKET_PURGE_AFTER_DAYS.
+
+Usage:
+  # All active tenants
+  python manage.py archive_tickets
+
+  # One tenant, count only
+  python manage.py archive_tickets --tenant acme --dry-run
+
+  # Smaller batches with a pause, for a busy tenant
+  python manage.py archive_tickets --tenant acme --batch-size 50 --pause 0.5
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.tickets.archive import DEFAULT_BATCH_SIZE, TicketArchiver, retention_for
+from core.db_router import register_tenant_db
+from management.tenants.models import Tenant
+
+
+class Command(BaseCommand):
+    help = "Archive old closed tickets and purge expired archived tickets"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tenant",
+            default=None,
+            help="Only this tenant slug (default: all active tenants)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Tickets per transaction (default: {DEFAULT_BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.0,
+            help="Seconds to sleep between batches (default: 0)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count what would be archived and purged",
+        )
+
+    def handle(self, *args, **options):
+        tenants = Tenant.objects.using("default").filter(is_active=True)
+        if options["tenant"]:
+            tenants = tenants.filter(slug=options["tenant"])
+            if not tenants.exists():
+                raise CommandError(f"Active tenant '{options['tenant']}' not found.")
+
+        prefix = "would be " if options["dry_run"] else ""
+        for tenant in tenants:
+            register_tenant_db(tenant)
+            db_alias = tenant.get_db_alias()
+            archive_after, purge_after = retention_for(tenant)
+            archiver = TicketArchiver(db_alias, options["batch_size"], options["pause"])
+            try:
+                result = archiver.run(archive_after, purge_after, dry_run=options["dry_run"])
+            except Exception as exc:
+                self.stderr.write(self.style.ERROR(f"  ✗ {db_alias}: {exc}"))
+                continue
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"  ✓ {db_alias}: {result.archived} {prefix}archived "
+                    f"(after {archive_after or '∞'} days), {result.purged} {prefix}purged "
+                    f"(after {purge_after or '∞'} days)"
+                )
+            )
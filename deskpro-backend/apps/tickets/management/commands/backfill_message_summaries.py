@@ -0,0 +1,69 @@
+"""
+Management command: backfill_message_summaries
+
+Recomputes Ticket.message_count / last_message_* from tickets_ticketmessage
+on tenant DBs, one UPDATE per batch of tickets. Needed once after
+migration 0006; afterwards the message triggers keep them current.
+
+Usage:
+  # Every active tenant
+  python manage.py backfill_message_summaries
+
+  # One tenant, larger batches
+  python manage.py backfill_message_summaries --tenant acme --batch-size 2000
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from apps.tickets.models import Ticket
+from core.db_router import register_tenant_db
+from management.tenants.models import Tenant
+
+
+class Command(BaseCommand):
+    help = "Recompute denormalized ticket message summaries across tenant DBs in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tenant",
+            default=None,
+            help="Only this tenant slug (default: all active tenants)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            dest="batch_size",
+            help="Tickets per UPDATE (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        tenants = Tenant.objects.using("default").filter(is_active=True)
+        if options["tenant"]:
+            tenants = tenants.filter(slug=options["tenant"])
+            if not tenants.exists():
+                raise CommandError(f"Active tenant '{options['tenant']}' not found.")
+
+        for tenant in tenants:
+            register_tenant_db(tenant)
+            db_alias = tenant.get_db_alias()
+            try:
+                updated = self._backfill(db_alias, options["batch_size"])
+            except Exception as exc:
+                self.stderr.write(self.style.ERROR(f"  ✗ {db_alias}: {exc}"))
+                continue
+            self.stdout.write(self.style.SUCCESS(f"  ✓ {db_alias}: {updated} ticket(s)"))
+
+    @staticmethod
+    def _backfill(db_alias: str, batch_size: int) -> int:
+        queryset = Ticket.objects.using(db_alias).order_by("id")
+        updated = 0
+        last_id = 0
+        while True:
+            ids = list(queryset.filter(id__gt=last_id).values_list("id", flat=True)[:batch_size])
+            if not ids:
+                return updated
+            with connections[db_alias].cursor() as cursor:
+                cursor.execute("SELECT tickets_refresh_message_summary(%s)", [ids])
+            updated += len(ids)
+            last_id = ids[-1]
@@ -0,0 +1,78 @@
+"""
+Management command: backfill_search_vectors
+
+Rebuilds Ticket.search_vector on tenant DBs in small batches, one UPDATE
+per batch, so no long-running transaction holds row locks. Needed once
+after migration 0004 and whenever SEARCH_CONFIG changes.
+
+Usage:
+  # Tickets without a vector, on every active tenant
+  python manage.py backfill_search_vectors
+
+  # One tenant, rebuild everything
+  python manage.py backfill_search_vectors --tenant acme --all
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.tickets.models import Ticket
+from apps.tickets.search import rebuild_search_vectors
+from core.db_router import register_tenant_db
+from management.tenants.models import Tenant
+
+
+class Command(BaseCommand):
+    help = "Rebuild ticket full-text search vectors across tenant DBs in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tenant",
+            default=None,
+            help="Only this tenant slug (default: all active tenants)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            dest="batch_size",
+            help="Tickets per UPDATE (default: 500)",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            dest="rebuild_all",
+            help="Rebuild every ticket, not just those without a vector",
+        )
+
+    def handle(self, *args, **options):
+        tenants = Tenant.objects.using("default").filter(is_active=True)
+        if options["tenant"]:
+            tenants = tenants.filter(slug=options["tenant"])
+            if not tenants.exists():
+                raise CommandError(f"Active tenant '{options['tenant']}' not found.")
+
+        for tenant in tenants:
+            register_tenant_db(tenant)
+            db_alias = tenant.get_db_alias()
+            try:
+                updated = self._backfill(db_alias, options["batch_size"], options["rebuild_all"])
+            except Exception as exc:
+                self.stderr.write(self.style.ERROR(f"  ✗ {db_alias}: {exc}"))
+                continue
+            self.stdout.write(self.style.SUCCESS(f"  ✓ {db_alias}: {updated} ticket(s)"))
+
+    @staticmethod
+    def _backfill(db_alias: str, batch_size: int, rebuild_all: bool) -> int:
+        queryset = Ticket.objects.using(db_alias).order_by("id")
+        if not rebuild_all:
+            queryset = queryset.filter(search_vector__isnull=True)
+
+        updated = 0
+        last_id = 0
+        while True:
+            ids = list(
+                queryset.filter(id__gt=last_id).values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                return updated
+            updated += rebuild_search_vectors(ids, using=db_alias)
+            last_id = ids[-1]
@@ -0,0 +1,111 @@
+"""
+Management command: import_tickets
+
+Bulk-loads tickets and messages from an NDJSON or CSV file (the formats
+GET /api/tickets/export produces) into one tenant DB using COPY.
+
+Usage:
+  # Validate only — reports every invalid record, writes nothing
+  python manage.py import_tickets acme export.ndjson --dry-run
+
+  # Import, keeping original timestamps; re-run the same command to resume
+  python manage.py import_tickets acme export.ndjson
+
+  # CSV, new timestamps, progress kept under a key of your choosing
+  python manage.py import_tickets acme export.csv --format csv \\
+      --no-preserve-timestamps --checkpoint acme-2026-03
+
+Progress is stored in the tenant DB (TicketImportProgress), committed with
+each batch; by default under the source file's absolute path.
+"""
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.tickets.importer import (
+    DEFAULT_BATCH_SIZE,
+    READERS,
+    RecordError,
+    TicketImporter,
+)
+from core.db_router import register_tenant_db
+from core.tenant_connections import tenant_connections
+from management.tenants.models import Tenant
+
+
+class Command(BaseCommand):
+    help = "Bulk-import tickets into a tenant DB via COPY (NDJSON or CSV)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("tenant", help="Tenant slug")
+        parser.add_argument("path", help="Source file")
+        parser.add_argument(
+            "--format",
+            choices=sorted(READERS),
+            default=None,
+            dest="fmt",
+            help="Source format (default: from the file extension)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            dest="batch_size",
+            help=f"Tickets per transaction (default: {DEFAULT_BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--no-preserve-timestamps",
+            action="store_false",
+            dest="preserve_timestamps",
+            help="Stamp imported rows with the current time instead of the source's",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default=None,
+            help="Key the progress is stored under (default: the source file's absolute path)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            dest="dry_run",
+            help="Validate every record without writing anything",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            tenant = Tenant.objects.using("default").get(slug=options["tenant"], is_active=True)
+        except Tenant.DoesNotExist:
+            raise CommandError(f"Active tenant '{options['tenant']}' not found.")
+        register_tenant_db(tenant)
+        db_alias = tenant.get_db_alias()
+
+        path = options["path"]
+        fmt = options["fmt"] or ("csv" if path.endswith(".csv") else "ndjson")
+        importer = TicketImporter(
+            db_alias=db_alias,
+            batch_size=options["batch_size"],
+            preserve_timestamps=options["preserve_timestamps"],
+            checkpoint=options["checkpoint"] or os.path.abspath(path),
+        )
+
+        # Lease the alias so it is not evicted (its pool closed) mid-import
+        if not tenant_connections.acquire(db_alias):
+            raise CommandError(f"Tenant DB '{db_alias}' was evicted before the import started; re-run.")
+        try:
+            with open(path, newline="", encoding="utf-8") as stream:
+                result = importer.run(READERS[fmt](stream), dry_run=options["dry_run"])
+        except RecordError as exc:
+            raise CommandError(
+                f"Stopped at invalid {exc}. Earlier batches are committed; "
+                "fix the record and re-run to resume."
+            )
+        finally:
+            tenant_connections.release(db_alias)
+
+        for error in result.errors:
+            self.stderr.write(self.style.WARNING(f"  {error}"))
+        verb = "Validated" if result.dry_run else "Imported"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {result.tickets} ticket(s), {result.messages} message(s) "
+            f"in {result.batches} batch(es); skipped {result.skipped}, invalid {result.invalid}."
+        ))
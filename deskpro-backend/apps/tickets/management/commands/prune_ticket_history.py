@@ -0,0 +1,49 @@
+"""
+Management command: prune_ticket_history
+
+Deletes change-feed events (TICKET_EVENTS_RETENTION) and delta sync
+tombstones (TICKET_TOMBSTONE_RETENTION) past their retention window on
+every active tenant (or one). The SSE event hub also prunes events while
+it has listeners; run this from cron so idle tenants are cleaned up too.
+
+Usage:
+  python manage.py prune_ticket_history
+  python manage.py prune_ticket_history --tenant acme
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.tickets.events import prune as prune_events
+from apps.tickets.sync import prune_tombstones
+from core.db_router import register_tenant_db
+from management.tenants.models import Tenant
+
+
+class Command(BaseCommand):
+    help = "Delete ticket change events and tombstones past their retention"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tenant",
+            default=None,
+            help="Only this tenant slug (default: all active tenants)",
+        )
+
+    def handle(self, *args, **options):
+        tenants = Tenant.objects.using("default").filter(is_active=True)
+        if options["tenant"]:
+            tenants = tenants.filter(slug=options["tenant"])
+            if not tenants.exists():
+                raise CommandError(f"Active tenant '{options['tenant']}' not found.")
+
+        for tenant in tenants:
+            register_tenant_db(tenant)
+            db_alias = tenant.get_db_alias()
+            try:
+                events = prune_events(db_alias)
+                tombstones = prune_tombstones(db_alias)
+            except Exception as exc:
+                self.stderr.write(self.style.ERROR(f"  ✗ {db_alias}: {exc}"))
+                continue
+            self.stdout.write(
+                self.style.SUCCESS(f"  ✓ {db_alias}: {events} events, {tombstones} tombstones pruned")
+            )
@@ -0,0 +1,63 @@
+"""
+Management command: reconcile_ticket_stats
+
+Recounts the TicketStat rollup counters from tickets_ticket on every
+active tenant (or one), reports any drift and rewrites the counters.
+
+Usage:
+  # Report and repair drift everywhere
+  python manage.py reconcile_ticket_stats
+
+  # Only report, one tenant
+  python manage.py reconcile_ticket_stats --tenant acme --check
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.tickets.stats import reconcile
+from core.db_router import register_tenant_db
+from management.tenants.models import Tenant
+
+
+class Command(BaseCommand):
+    help = "Rebuild ticket stats counters from scratch and report drift"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tenant",
+            default=None,
+            help="Only this tenant slug (default: all active tenants)",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Report drift without rewriting the counters",
+        )
+
+    def handle(self, *args, **options):
+        tenants = Tenant.objects.using("default").filter(is_active=True)
+        if options["tenant"]:
+            tenants = tenants.filter(slug=options["tenant"])
+            if not tenants.exists():
+                raise CommandError(f"Active tenant '{options['tenant']}' not found.")
+
+        drifted = 0
+        for tenant in tenants:
+            register_tenant_db(tenant)
+            db_alias = tenant.get_db_alias()
+            try:
+                drift = reconcile(db_alias, fix=not options["check"])
+            except Exception as exc:
+                self.stderr.write(self.style.ERROR(f"  ✗ {db_alias}: {exc}"))
+                continue
+
+            if not drift:
+                self.stdout.write(self.style.SUCCESS(f"  ✓ {db_alias}: no drift"))
+                continue
+            drifted += 1
+            action = "found" if options["check"] else "fixed"
+            self.stdout.write(self.style.WARNING(f"  ! {db_alias}: {len(drift)} counter(s) {action}"))
+            for dimension, value, stored, actual in drift:
+                self.stdout.write(f"      {dimension}={value!r}: stored {stored}, actual {actual}")
+
+        if drifted and options["check"]:
+            raise CommandError(f"{drifted} tenant(s) have drifted counters.")
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tickets", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="ticket",
+            options={"ordering": ["-created_at", "-id"]},
+        ),
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(fields=["-created_at", "-id"], name="ticket_created_id_idx"),
+        ),
+    ]
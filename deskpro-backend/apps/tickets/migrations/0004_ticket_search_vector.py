@@ -0,0 +1,22 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tickets", "0003_ticket_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ticket",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="ticket",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="ticket_search_gin"),
+        ),
+    ]
@@ -0,0 +1,96 @@
+from django.db import migrations, models
+
+# Statement-level triggers with transition tables: one upsert per INSERT /
+# UPDATE / DELETE statement, however many rows it touched (bulk updates,
+# COPY imports and cascades included). Unchanged values cancel out in the
+# GROUP BY, so an UPDATE that only touches `subject` writes nothing.
+
+_DELTAS = """
+    SELECT 'total' AS dimension, '' AS value, delta FROM changed
+    UNION ALL SELECT 'status', status, delta FROM changed
+    UNION ALL SELECT 'priority', priority, delta FROM changed
+    UNION ALL SELECT 'channel', channel, delta FROM changed
+    UNION ALL SELECT 'assignee', assignee, delta FROM changed
+    UNION ALL SELECT 'tag', t.tag, delta
+        FROM changed CROSS JOIN LATERAL (SELECT DISTINCT unnest(changed.tags) AS tag) t
+"""
+
+_UPSERT = """
+        WITH changed AS ({changed})
+        INSERT INTO tickets_ticketstat (dimension, value, count)
+        SELECT dimension, value, sum(delta) FROM ({deltas}) d
+        GROUP BY dimension, value
+        HAVING sum(delta) <> 0
+        ON CONFLICT (dimension, value)
+        DO UPDATE SET count = tickets_ticketstat.count + EXCLUDED.count;
+"""
+
+_COLS = "status, priority, channel, assignee, tags"
+_NEW = f"SELECT {_COLS}, 1 AS delta FROM new_rows"
+_OLD = f"SELECT {_COLS}, -1 AS delta FROM old_rows"
+
+CREATE_SQL = f"""
+CREATE OR REPLACE FUNCTION tickets_ticketstat_apply() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        {_UPSERT.format(changed=_NEW, deltas=_DELTAS)}
+    ELSIF TG_OP = 'DELETE' THEN
+        {_UPSERT.format(changed=_OLD, deltas=_DELTAS)}
+    ELSE
+        {_UPSERT.format(changed=f"{_NEW} UNION ALL {_OLD}", deltas=_DELTAS)}
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER tickets_ticketstat_ins
+    AFTER INSERT ON tickets_ticket REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tickets_ticketstat_apply();
+CREATE TRIGGER tickets_ticketstat_upd
+    AFTER UPDATE ON tickets_ticket REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tickets_ticketstat_apply();
+CREATE TRIGGER tickets_ticketstat_del
+    AFTER DELETE ON tickets_ticket REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tickets_ticketstat_apply();
+"""
+
+DROP_SQL = """
+DROP TRIGGER IF EXISTS tickets_ticketstat_ins ON tickets_ticket;
+DROP TRIGGER IF EXISTS tickets_ticketstat_upd ON tickets_ticket;
+DROP TRIGGER IF EXISTS tickets_ticketstat_del ON tickets_ticket;
+DROP FUNCTION IF EXISTS tickets_ticketstat_apply();
+"""
+
+SEED_SQL = f"""
+WITH changed AS (SELECT {_COLS}, 1 AS delta FROM tickets_ticket)
+INSERT INTO tickets_ticketstat (dimension, value, count)
+SELECT dimension, value, sum(delta) FROM ({_DELTAS}) d
+GROUP BY dimension, value;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tickets", "0004_ticket_search_vector"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TicketStat",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("dimension", models.CharField(max_length=20)),
+                ("value", models.CharField(blank=True, max_length=255)),
+                ("count", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "app_label": "tickets",
+                "constraints": [
+                    models.UniqueConstraint(fields=("dimension", "value"), name="ticketstat_dimension_value_uniq"),
+                ],
+            },
+        ),
+        migrations.RunSQL(CREATE_SQL, DROP_SQL),
+        migrations.RunSQL(SEED_SQL, migrations.RunSQL.noop),
+    ]
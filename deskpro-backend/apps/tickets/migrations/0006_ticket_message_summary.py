@@ -0,0 +1,112 @@
+from django.db import migrations, models
+
+# Ticket.message_count / last_message_* are kept in the same transaction as
+# the message write by statement-level triggers on tickets_ticketmessage.
+#
+#   INSERT — incremental: add the per-ticket count and take the newest new
+#            message if it is newer than the stored one (one UPDATE per
+#            statement, so a COPY of 10k messages is still one UPDATE).
+#   DELETE — recompute the affected tickets via
+#            tickets_refresh_message_summary(), which the
+#            backfill_message_summaries command also uses.
+
+PREVIEW_LENGTH = 200
+
+CREATE_SQL = f"""
+CREATE OR REPLACE FUNCTION tickets_refresh_message_summary(ticket_ids bigint[])
+RETURNS void AS $$
+    UPDATE tickets_ticket t SET
+        message_count = s.cnt,
+        last_message_at = l.ts,
+        last_message_sender = coalesce(l.sender, ''),
+        last_message_preview = coalesce(l.preview, '')
+    FROM tickets_ticket t2
+    CROSS JOIN LATERAL (
+        SELECT count(*) AS cnt FROM tickets_ticketmessage m WHERE m.ticket_id = t2.id
+    ) s
+    LEFT JOIN LATERAL (
+        SELECT m.timestamp AS ts, m.sender, left(m.body, {PREVIEW_LENGTH}) AS preview
+        FROM tickets_ticketmessage m
+        WHERE m.ticket_id = t2.id
+        ORDER BY m.timestamp DESC, m.id DESC
+        LIMIT 1
+    ) l ON true
+    WHERE t.id = t2.id AND t.id = ANY(ticket_ids);
+$$ LANGUAGE sql;
+
+CREATE OR REPLACE FUNCTION tickets_message_summary_apply() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE tickets_ticket t SET
+            message_count = t.message_count + n.cnt,
+            last_message_at = CASE WHEN t.last_message_at IS NULL OR n.ts >= t.last_message_at
+                                   THEN n.ts ELSE t.last_message_at END,
+            last_message_sender = CASE WHEN t.last_message_at IS NULL OR n.ts >= t.last_message_at
+                                       THEN n.sender ELSE t.last_message_sender END,
+            last_message_preview = CASE WHEN t.last_message_at IS NULL OR n.ts >= t.last_message_at
+                                        THEN n.preview ELSE t.last_message_preview END
+        FROM (
+            SELECT DISTINCT ON (ticket_id)
+                ticket_id,
+                count(*) OVER (PARTITION BY ticket_id) AS cnt,
+                timestamp AS ts,
+                sender,
+                left(body, {PREVIEW_LENGTH}) AS preview
+            FROM new_rows
+            ORDER BY ticket_id, timestamp DESC, id DESC
+        ) n
+        WHERE t.id = n.ticket_id;
+    ELSE
+        PERFORM tickets_refresh_message_summary(
+            ARRAY(SELECT DISTINCT ticket_id FROM old_rows)
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER tickets_message_summary_ins
+    AFTER INSERT ON tickets_ticketmessage REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tickets_message_summary_apply();
+CREATE TRIGGER tickets_message_summary_del
+    AFTER DELETE ON tickets_ticketmessage REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tickets_message_summary_apply();
+"""
+
+DROP_SQL = """
+DROP TRIGGER IF EXISTS tickets_message_summary_ins ON tickets_ticketmessage;
+DROP TRIGGER IF EXISTS tickets_message_summary_del ON tickets_ticketmessage;
+DROP FUNCTION IF EXISTS tickets_message_summary_apply();
+DROP FUNCTION IF EXISTS tickets_refresh_message_summary(bigint[]);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tickets", "0005_ticketstat"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ticket",
+            name="message_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="ticket",
+            name="last_message_at",
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="ticket",
+            name="last_message_sender",
+            field=models.CharField(blank=True, default="", editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name="ticket",
+            name="last_message_preview",
+            field=models.CharField(blank=True, default="", editable=False, max_length=200),
+        ),
+        migrations.RunSQL(CREATE_SQL, DROP_SQL),
+    ]
@@ -0,0 +1,80 @@
+from django.db import migrations, models
+
+# Every user-visible ticket / message change is appended to
+# tickets_ticketevent and announced with pg_notify('ticket_events', <row>)
+# in the same transaction, so LISTENers only hear about committed changes
+# and reconnecting clients can replay from the table (Last-Event-ID).
+#
+# Ticket UPDATEs that only touch columns maintained by other triggers or
+# helpers (search_vector, message summary, updated_at bumps) are skipped —
+# the message event already covers them.
+
+CREATE_SQL = """
+CREATE OR REPLACE FUNCTION tickets_ticketevent_emit() RETURNS trigger AS $$
+DECLARE
+    ev tickets_ticketevent%ROWTYPE;
+BEGIN
+    IF TG_TABLE_NAME = 'tickets_ticket' THEN
+        IF TG_OP = 'UPDATE' AND
+           (OLD.subject, OLD.customer_name, OLD.customer_email, OLD.status,
+            OLD.priority, OLD.channel, OLD.assignee, OLD.tags)
+           IS NOT DISTINCT FROM
+           (NEW.subject, NEW.customer_name, NEW.customer_email, NEW.status,
+            NEW.priority, NEW.channel, NEW.assignee, NEW.tags)
+        THEN
+            RETURN NULL;
+        END IF;
+        INSERT INTO tickets_ticketevent (kind, op, ticket_id, message_id, created_at)
+        VALUES ('ticket', lower(TG_OP), COALESCE(NEW.id, OLD.id), NULL, now())
+        RETURNING * INTO ev;
+    ELSE
+        INSERT INTO tickets_ticketevent (kind, op, ticket_id, message_id, created_at)
+        VALUES ('message', lower(TG_OP), COALESCE(NEW.ticket_id, OLD.ticket_id),
+                COALESCE(NEW.id, OLD.id), now())
+        RETURNING * INTO ev;
+    END IF;
+
+    PERFORM pg_notify('ticket_events', row_to_json(ev)::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER tickets_ticketevent_ticket
+    AFTER INSERT OR UPDATE OR DELETE ON tickets_ticket
+    FOR EACH ROW EXECUTE FUNCTION tickets_ticketevent_emit();
+CREATE TRIGGER tickets_ticketevent_message
+    AFTER INSERT OR UPDATE OR DELETE ON tickets_ticketmessage
+    FOR EACH ROW EXECUTE FUNCTION tickets_ticketevent_emit();
+"""
+
+DROP_SQL = """
+DROP TRIGGER IF EXISTS tickets_ticketevent_ticket ON tickets_ticket;
+DROP TRIGGER IF EXISTS tickets_ticketevent_message ON tickets_ticketmessage;
+DROP FUNCTION IF EXISTS tickets_ticketevent_emit();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tickets", "0006_ticket_message_summary"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TicketEvent",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("kind", models.CharField(max_length=10)),
+                ("op", models.CharField(max_length=10)),
+                ("ticket_id", models.BigIntegerField()),
+                ("message_id", models.UUIDField(null=True)),
+                ("created_at", models.DateTimeField(db_index=True)),
+            ],
+            options={
+                "app_label": "tickets",
+                "ordering": ["id"],
+            },
+        ),
+        migrations.RunSQL(CREATE_SQL, DROP_SQL),
+    ]
@@ -0,0 +1,78 @@
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+# Deleted rows leave a tombstone so GET /api/tickets/changes can report
+# them. Statement-level triggers with transition tables: one INSERT per
+# DELETE statement however many rows it removed (cascades included).
+
+CREATE_SQL = """
+CREATE OR REPLACE FUNCTION tickets_tombstone_ticket() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO tickets_tickettombstone (kind, ticket_id, message_id, deleted_at)
+    SELECT 'ticket', id, NULL, now() FROM old_rows;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION tickets_tombstone_message() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO tickets_tickettombstone (kind, ticket_id, message_id, deleted_at)
+    SELECT 'message', ticket_id, id, now() FROM old_rows;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER tickets_tombstone_ticket_del
+    AFTER DELETE ON tickets_ticket REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tickets_tombstone_ticket();
+CREATE TRIGGER tickets_tombstone_message_del
+    AFTER DELETE ON tickets_ticketmessage REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tickets_tombstone_message();
+"""
+
+DROP_SQL = """
+DROP TRIGGER IF EXISTS tickets_tombstone_ticket_del ON tickets_ticket;
+DROP TRIGGER IF EXISTS tickets_tombstone_message_del ON tickets_ticketmessage;
+DROP FUNCTION IF EXISTS tickets_tombstone_ticket();
+DROP FUNCTION IF EXISTS tickets_tombstone_message();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tickets", "0007_ticketevent"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ticketmessage",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                db_default=django.db.models.functions.datetime.Now(),
+                db_index=True,
+            ),
+        ),
+        migrations.CreateModel(
+            name="TicketTombstone",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("kind", models.CharField(max_length=10)),
+                ("ticket_id", models.BigIntegerField(null=True)),
+                ("message_id", models.UUIDField(null=True)),
+                (
+                    "deleted_at",
+                    models.DateTimeField(
+                        db_default=django.db.models.functions.datetime.Now(),
+                        db_index=True,
+                    ),
+                ),
+            ],
+            options={
+                "app_label": "tickets",
+                "ordering": ["id"],
+            },
+        ),
+        migrations.RunSQL(CREATE_SQL, DROP_SQL),
+    ]
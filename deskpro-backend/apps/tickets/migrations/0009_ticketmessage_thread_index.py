@@ -0,0 +1,34 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tickets", "0008_ticket_delta_sync"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="ticketmessage",
+            options={"ordering": ["timestamp", "id"]},
+        ),
+        # Build the composite index before dropping the FK's own index so
+        # ticket_id lookups are never left without one.
+        migrations.AddIndex(
+            model_name="ticketmessage",
+            index=models.Index(
+                fields=["ticket", "timestamp", "id"], name="ticketmessage_thread_idx"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="ticketmessage",
+            name="ticket",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="messages",
+                to="tickets.ticket",
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tickets", "0009_ticketmessage_thread_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedTicket",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("subject", models.CharField(max_length=500)),
+                ("customer_email", models.EmailField(max_length=254)),
+                ("status", models.CharField(max_length=20)),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+                ("payload", models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder)),
+            ],
+            options={
+                "app_label": "tickets",
+                "ordering": ["-updated_at", "-id"],
+                "indexes": [
+                    models.Index(
+                        fields=["customer_email", "-updated_at"], name="archived_email_idx"
+                    ),
+                    models.Index(fields=["updated_at", "id"], name="archived_updated_id_idx"),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+import core.ids
+from django.db import migrations, models
+
+# Python-side default only: existing uuid4 ids stay as they are, new
+# messages get time-ordered UUIDv7 keys (core.ids).
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tickets", "0010_archivedticket"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="ticketmessage",
+            name="id",
+            field=models.UUIDField(
+                default=core.ids.uuid7, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+    ]
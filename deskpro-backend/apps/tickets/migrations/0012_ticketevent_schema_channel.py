@@ -0,0 +1,54 @@
+from django.db import migrations
+
+# Schema-per-tenant storage puts many tenants in one database, where a
+# single 'ticket_events' channel would let every tenant's listener hear
+# every other tenant. Tables outside public (schema tenants) notify on a
+# channel named after their schema instead; database tenants are unchanged.
+# See apps.tickets.events.channel_for().
+
+EMIT_SQL = """
+CREATE OR REPLACE FUNCTION tickets_ticketevent_emit() RETURNS trigger AS $$
+DECLARE
+    ev tickets_ticketevent%%ROWTYPE;
+BEGIN
+    IF TG_TABLE_NAME = 'tickets_ticket' THEN
+        IF TG_OP = 'UPDATE' AND
+           (OLD.subject, OLD.customer_name, OLD.customer_email, OLD.status,
+            OLD.priority, OLD.channel, OLD.assignee, OLD.tags)
+           IS NOT DISTINCT FROM
+           (NEW.subject, NEW.customer_name, NEW.customer_email, NEW.status,
+            NEW.priority, NEW.channel, NEW.assignee, NEW.tags)
+        THEN
+            RETURN NULL;
+        END IF;
+        INSERT INTO tickets_ticketevent (kind, op, ticket_id, message_id, created_at)
+        VALUES ('ticket', lower(TG_OP), COALESCE(NEW.id, OLD.id), NULL, now())
+        RETURNING * INTO ev;
+    ELSE
+        INSERT INTO tickets_ticketevent (kind, op, ticket_id, message_id, created_at)
+        VALUES ('message', lower(TG_OP), COALESCE(NEW.ticket_id, OLD.ticket_id),
+                COALESCE(NEW.id, OLD.id), now())
+        RETURNING * INTO ev;
+    END IF;
+
+    PERFORM pg_notify(%(channel)s, row_to_json(ev)::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+SCHEMA_CHANNEL = "CASE WHEN TG_TABLE_SCHEMA = 'public' THEN 'ticket_events' ELSE TG_TABLE_SCHEMA END"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tickets", "0011_ticketmessage_uuid7"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            EMIT_SQL % {"channel": SCHEMA_CHANNEL},
+            EMIT_SQL % {"channel": "'ticket_events'"},
+        ),
+    ]
@@ -0,0 +1,157 @@
+from importlib import import_module
+
+from django.db import migrations
+
+# Replace the row-level event triggers of 0007/0012 with statement-level
+# ones using transition tables, as 0005, 0006 and 0008 do: a COPY import
+# or an archive batch now writes its events with one INSERT ... SELECT and
+# sends one NOTIFY per statement instead of one of each per row.
+#
+# The notification carries the statement's events inline when there are
+# at most INLINE_EVENTS of them (pg_notify payloads are capped at 8000
+# bytes), else only their id range and count, and listeners read the rows
+# from tickets_ticketevent (apps.tickets.events). Channels are unchanged:
+# 'ticket_events', or the table's schema for schema-storage tenants.
+
+INLINE_EVENTS = 20
+
+_0012 = import_module("apps.tickets.migrations.0012_ticketevent_schema_channel")
+SCHEMA_CHANNEL = _0012.SCHEMA_CHANNEL
+
+# Ticket UPDATEs that only touch columns maintained by other triggers or
+# helpers (search_vector, message summary, updated_at bumps) are skipped,
+# as before
+TICKET_COLUMNS = ("subject", "customer_name", "customer_email", "status", "priority", "channel", "assignee", "tags")
+_OLD = ", ".join(f"o.{col}" for col in TICKET_COLUMNS)
+_NEW = ", ".join(f"n.{col}" for col in TICKET_COLUMNS)
+
+CREATE_SQL = f"""
+DROP TRIGGER IF EXISTS tickets_ticketevent_ticket ON tickets_ticket;
+DROP TRIGGER IF EXISTS tickets_ticketevent_message ON tickets_ticketmessage;
+DROP FUNCTION IF EXISTS tickets_ticketevent_emit();
+
+CREATE OR REPLACE FUNCTION tickets_ticketevent_announce(channel text, ids bigint[]) RETURNS void AS $$
+BEGIN
+    IF ids IS NULL THEN
+        RETURN;   -- the statement changed nothing that is reported
+    END IF;
+    IF cardinality(ids) <= {INLINE_EVENTS} THEN
+        PERFORM pg_notify(channel, (
+            SELECT json_build_object('events', json_agg(e ORDER BY e.id))::text
+            FROM tickets_ticketevent e
+            WHERE e.id = ANY(ids)
+        ));
+    ELSE
+        PERFORM pg_notify(channel, (
+            SELECT json_build_object('first', min(i), 'last', max(i), 'count', count(*))::text
+            FROM unnest(ids) i
+        ));
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION tickets_ticketevent_ticket() RETURNS trigger AS $$
+DECLARE
+    ids bigint[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        WITH ev AS (
+            INSERT INTO tickets_ticketevent (kind, op, ticket_id, message_id, created_at)
+            SELECT 'ticket', 'insert', id, NULL, now() FROM new_rows ORDER BY id
+            RETURNING id
+        ) SELECT array_agg(id) INTO ids FROM ev;
+    ELSIF TG_OP = 'UPDATE' THEN
+        WITH ev AS (
+            INSERT INTO tickets_ticketevent (kind, op, ticket_id, message_id, created_at)
+            SELECT 'ticket', 'update', n.id, NULL, now()
+            FROM new_rows n JOIN old_rows o ON o.id = n.id
+            WHERE ({_OLD}) IS DISTINCT FROM ({_NEW})
+            ORDER BY n.id
+            RETURNING id
+        ) SELECT array_agg(id) INTO ids FROM ev;
+    ELSE
+        WITH ev AS (
+            INSERT INTO tickets_ticketevent (kind, op, ticket_id, message_id, created_at)
+            SELECT 'ticket', 'delete', id, NULL, now() FROM old_rows ORDER BY id
+            RETURNING id
+        ) SELECT array_agg(id) INTO ids FROM ev;
+    END IF;
+
+    PERFORM tickets_ticketevent_announce({SCHEMA_CHANNEL}, ids);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION tickets_ticketevent_message() RETURNS trigger AS $$
+DECLARE
+    ids bigint[];
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        WITH ev AS (
+            INSERT INTO tickets_ticketevent (kind, op, ticket_id, message_id, created_at)
+            SELECT 'message', 'delete', ticket_id, id, now() FROM old_rows ORDER BY ticket_id, id
+            RETURNING id
+        ) SELECT array_agg(id) INTO ids FROM ev;
+    ELSE
+        WITH ev AS (
+            INSERT INTO tickets_ticketevent (kind, op, ticket_id, message_id, created_at)
+            SELECT 'message', lower(TG_OP), ticket_id, id, now() FROM new_rows ORDER BY ticket_id, id
+            RETURNING id
+        ) SELECT array_agg(id) INTO ids FROM ev;
+    END IF;
+
+    PERFORM tickets_ticketevent_announce({SCHEMA_CHANNEL}, ids);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER tickets_ticketevent_ticket_ins
+    AFTER INSERT ON tickets_ticket REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tickets_ticketevent_ticket();
+CREATE TRIGGER tickets_ticketevent_ticket_upd
+    AFTER UPDATE ON tickets_ticket REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tickets_ticketevent_ticket();
+CREATE TRIGGER tickets_ticketevent_ticket_del
+    AFTER DELETE ON tickets_ticket REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tickets_ticketevent_ticket();
+CREATE TRIGGER tickets_ticketevent_message_ins
+    AFTER INSERT ON tickets_ticketmessage REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tickets_ticketevent_message();
+CREATE TRIGGER tickets_ticketevent_message_upd
+    AFTER UPDATE ON tickets_ticketmessage REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tickets_ticketevent_message();
+CREATE TRIGGER tickets_ticketevent_message_del
+    AFTER DELETE ON tickets_ticketmessage REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tickets_ticketevent_message();
+"""
+
+# Back to the row-level triggers of 0007 with the 0012 channel
+DROP_SQL = """
+DROP TRIGGER IF EXISTS tickets_ticketevent_ticket_ins ON tickets_ticket;
+DROP TRIGGER IF EXISTS tickets_ticketevent_ticket_upd ON tickets_ticket;
+DROP TRIGGER IF EXISTS tickets_ticketevent_ticket_del ON tickets_ticket;
+DROP TRIGGER IF EXISTS tickets_ticketevent_message_ins ON tickets_ticketmessage;
+DROP TRIGGER IF EXISTS tickets_ticketevent_message_upd ON tickets_ticketmessage;
+DROP TRIGGER IF EXISTS tickets_ticketevent_message_del ON tickets_ticketmessage;
+DROP FUNCTION IF EXISTS tickets_ticketevent_ticket();
+DROP FUNCTION IF EXISTS tickets_ticketevent_message();
+DROP FUNCTION IF EXISTS tickets_ticketevent_announce(text, bigint[]);
+""" + _0012.EMIT_SQL % {"channel": SCHEMA_CHANNEL} + """
+CREATE TRIGGER tickets_ticketevent_ticket
+    AFTER INSERT OR UPDATE OR DELETE ON tickets_ticket
+    FOR EACH ROW EXECUTE FUNCTION tickets_ticketevent_emit();
+CREATE TRIGGER tickets_ticketevent_message
+    AFTER INSERT OR UPDATE OR DELETE ON tickets_ticketmessage
+    FOR EACH ROW EXECUTE FUNCTION tickets_ticketevent_emit();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tickets", "0012_ticketevent_schema_channel"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_SQL, DROP_SQL),
+    ]
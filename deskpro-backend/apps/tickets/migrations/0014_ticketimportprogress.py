@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tickets", "0013_ticketevent_statement_triggers"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TicketImportProgress",
+            fields=[
+                ("key", models.CharField(max_length=500, primary_key=True, serialize=False)),
+                ("records_done", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "app_label": "tickets",
+            },
+        ),
+    ]
@@ -0,0 +1,57 @@
+from importlib import import_module
+
+from django.db import migrations
+
+# Make the TicketStat upsert (0005) lock its counter rows in (dimension,
+# value) order. Each statement on tickets_ticket upserts the rows of every
+# value it changed; in GROUP BY output order, two concurrent multi-row
+# statements (a bulk update and an import or archive batch) could take the
+# same rows in opposite orders and deadlock. With one order they queue.
+#
+# They still queue: a statement holds its counter rows until its
+# transaction commits, so writes of one tenant that change the same values
+# serialize on them. Every INSERT and DELETE touches ('total', ''); UPDATEs
+# only touch the values they change (a subject edit touches none). Keep
+# bulk transactions short; apps.tickets.stats.reconcile repairs drift.
+
+_0005 = import_module("apps.tickets.migrations.0005_ticketstat")
+
+_UPSERT = """
+        WITH changed AS ({changed})
+        INSERT INTO tickets_ticketstat (dimension, value, count)
+        SELECT dimension, value, sum(delta) FROM ({deltas}) d
+        GROUP BY dimension, value
+        HAVING sum(delta) <> 0
+        ORDER BY dimension, value
+        ON CONFLICT (dimension, value)
+        DO UPDATE SET count = tickets_ticketstat.count + EXCLUDED.count;
+"""
+
+
+def _function_sql(upsert: str) -> str:
+    deltas, new, old = _0005._DELTAS, _0005._NEW, _0005._OLD
+    return f"""
+CREATE OR REPLACE FUNCTION tickets_ticketstat_apply() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        {upsert.format(changed=new, deltas=deltas)}
+    ELSIF TG_OP = 'DELETE' THEN
+        {upsert.format(changed=old, deltas=deltas)}
+    ELSE
+        {upsert.format(changed=f"{new} UNION ALL {old}", deltas=deltas)}
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tickets", "0014_ticketimportprogress"),
+    ]
+
+    operations = [
+        migrations.RunSQL(_function_sql(_UPSERT), _function_sql(_0005._UPSERT)),
+    ]
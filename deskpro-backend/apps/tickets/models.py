@@ -5,10 +5,14 @@ Tags are stored as a comma-separated text field for broad DB compatibility.
 Use a JSONField or ArrayField if you know all Tenant DBs will be PostgreSQL
 (Neon is Postgres, so ArrayField works — but requires django.contrib.postgres).
 """
-import uuid
-
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models.functions import Now
+
+from core.ids import uuid7
 
 
 class Ticket(models.Model):
@@ -41,27 +45,206 @@ class Ticket(models.Model):
     tags = ArrayField(models.CharField(max_length=100), default=list, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Maintained by apps.tickets.search — never set directly
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Message thread summary, maintained by DB triggers on tickets_ticketmessage
+    # (migration 0006) — never set directly
+    message_count = models.PositiveIntegerField(default=0, editable=False)
+    last_message_at = models.DateTimeField(null=True, editable=False)
+    last_message_sender = models.CharField(max_length=255, blank=True, default="", editable=False)
+    last_message_preview = models.CharField(max_length=200, blank=True, default="", editable=False)
 
     class Meta:
         app_label = "tickets"
-        ordering = ["-created_at"]
+        ordering = ["-created_at", "-id"]
+        indexes = [
+            # Keyset pagination seeks on (created_at, id) — see pagination.py
+            models.Index(fields=["-created_at", "-id"], name="ticket_created_id_idx"),
+            models.Index(fields=["-updated_at", "-id"], name="ticket_updated_id_idx"),
+            # Server-side list filters (see TicketFilterIn)
+            models.Index(fields=["status", "-created_at"], name="ticket_status_created_idx"),
+            models.Index(fields=["priority", "-created_at"], name="ticket_priority_created_idx"),
+            models.Index(fields=["channel", "-created_at"], name="ticket_channel_created_idx"),
+            models.Index(fields=["assignee", "status"], name="ticket_assignee_status_idx"),
+            # tags && ARRAY[...] (tags__overlap)
+            GinIndex(fields=["tags"], name="ticket_tags_gin"),
+            GinIndex(fields=["search_vector"], name="ticket_search_gin"),
+        ]
+
+    # Columns written only by the DB / helper SQL. Excluded from ORM updates
+    # so saving a ticket loaded earlier cannot overwrite newer values.
+    DB_MAINTAINED_FIELDS = frozenset({
+        "search_vector",
+        "message_count",
+        "last_message_at",
+        "last_message_sender",
+        "last_message_preview",
+    })
 
     def __str__(self):
         return f"#{self.pk} — {self.subject}"
 
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                f.name
+                for f in self._meta.concrete_fields
+                if not f.primary_key and f.name not in self.DB_MAINTAINED_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
 
 class TicketMessage(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    # Indexed by ticketmessage_thread_idx below (ticket_id is its leading column)
     ticket = models.ForeignKey(
-        Ticket, on_delete=models.CASCADE, related_name="messages"
+        Ticket, on_delete=models.CASCADE, related_name="messages", db_index=False
     )
     sender = models.CharField(max_length=255)
     body = models.TextField()
     timestamp = models.DateTimeField(auto_now_add=True)
+    # Delta sync watermark (GET /api/tickets/changes); db_default covers COPY
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now(), db_index=True)
 
     class Meta:
         app_label = "tickets"
-        ordering = ["timestamp"]
+        ordering = ["timestamp", "id"]
+        indexes = [
+            # Thread order for GET /api/tickets/{id}/messages and prefetches
+            models.Index(fields=["ticket", "timestamp", "id"], name="ticketmessage_thread_idx"),
+        ]
 
     def __str__(self):
         return f"Message {self.id} on Ticket #{self.ticket_id}"
+
+
+class TicketStat(models.Model):
+    """
+    Rollup counter: number of tickets per (dimension, value), e.g.
+    ("status", "open") or ("tag", "billing"); ("total", "") counts all.
+
+    Maintained by statement-level triggers on tickets_ticket (migration
+    0005), so it stays exact for ORM saves, bulk updates and COPY imports
+    alike. Never write it from Python — see apps.tickets.stats.
+
+    A write holds the counter rows of the values it changed until it
+    commits, taking them in (dimension, value) order (migration 0015):
+    concurrent writes to one tenant that change the same values queue
+    behind each other, and every ticket insert or delete behind the
+    ("total", "") row.
+    """
+    dimension = models.CharField(max_length=20)
+    value = models.CharField(max_length=255, blank=True)
+    count = models.BigIntegerField(default=0)
+
+    class Meta:
+        app_label = "tickets"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dimension", "value"], name="ticketstat_dimension_value_uniq"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.dimension}={self.value!r}: {self.count}"
+
+
+class TicketEvent(models.Model):
+    """
+    Append-only change log feeding the SSE change feed (apps.tickets.events).
+
+    Rows are written and announced via pg_notify by DB triggers on
+    tickets_ticket and tickets_ticketmessage (migration 0007); the id is the
+    SSE event id clients resume from. Old rows are pruned by the event hub.
+    """
+    KIND_TICKET = "ticket"
+    KIND_MESSAGE = "message"
+
+    id = models.BigAutoField(primary_key=True)
+    kind = models.CharField(max_length=10)
+    op = models.CharField(max_length=10)          # insert / update / delete
+    ticket_id = models.BigIntegerField()          # not a FK: outlives deleted tickets
+    message_id = models.UUIDField(null=True)
+    created_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        app_label = "tickets"
+        ordering = ["id"]
+
+    def __str__(self):
+        return f"Event {self.id}: {self.kind} {self.op} on Ticket #{self.ticket_id}"
+
+
+class TicketTombstone(models.Model):
+    """
+    Record of a deleted ticket or message, so delta sync clients
+    (GET /api/tickets/changes) can drop it from their local replica.
+
+    Written by statement-level DELETE triggers (migration 0008), which also
+    cover cascades and raw deletes. A `resync` row marks a bulk change that
+    delta sync cannot express (e.g. an import preserving old updated_at
+    values); clients whose watermark predates it must refetch everything.
+    """
+    KIND_TICKET = "ticket"
+    KIND_MESSAGE = "message"
+    KIND_RESYNC = "resync"
+
+    id = models.BigAutoField(primary_key=True)
+    kind = models.CharField(max_length=10)
+    ticket_id = models.BigIntegerField(null=True)
+    message_id = models.UUIDField(null=True)
+    deleted_at = models.DateTimeField(db_default=Now(), db_index=True)
+
+    class Meta:
+        app_label = "tickets"
+        ordering = ["id"]
+
+    def __str__(self):
+        return f"Tombstone {self.id}: {self.kind} {self.ticket_id or self.message_id or ''}"
+
+
+class ArchivedTicket(models.Model):
+    """
+    Cold copy of a resolved/closed ticket moved out of tickets_ticket by
+    apps.tickets.archive. Only lookup columns are real columns; the full
+    ticket with its messages (TicketOut shape) is kept in `payload`, which
+    Postgres stores compressed (TOAST). Read-only for the API.
+    """
+    id = models.BigIntegerField(primary_key=True)    # the original ticket id
+    subject = models.CharField(max_length=500)
+    customer_email = models.EmailField()
+    status = models.CharField(max_length=20)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+
+    class Meta:
+        app_label = "tickets"
+        ordering = ["-updated_at", "-id"]
+        indexes = [
+            models.Index(fields=["customer_email", "-updated_at"], name="archived_email_idx"),
+            # Purge scans by age
+            models.Index(fields=["updated_at", "id"], name="archived_updated_id_idx"),
+        ]
+
+    def __str__(self):
+        return f"Archived #{self.id}: {self.subject}"
+
+
+class TicketImportProgress(models.Model):
+    """
+    How far a resumable import (apps.tickets.importer) has got: the number
+    of source records committed under `key`, which names the import (the
+    import_tickets command uses the source file's path). Written in the
+    same transaction as each batch, so it never disagrees with the rows.
+    """
+    key = models.CharField(max_length=500, primary_key=True)
+    records_done = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "tickets"
+
+    def __str__(self):
+        return f"Import {self.key}: {self.records_done} record(s) done"
@@ -0,0 +1,170 @@
+"""
+Keyset (cursor) pagination for ticket lists.
+
+Tickets are ordered by a sort field (created_at or updated_at) with id as
+tiebreaker. Instead of OFFSET, each page continues strictly after the last
+row of the previous page, so the DB can seek straight into the matching
+(field, id) index and page N costs the same as page 1.
+
+Cursors are opaque to clients: urlsafe base64 of a small JSON array
+holding the sort key and the last row's (value, id). A cursor is only
+valid with the sort it was issued for.
+
+Message threads (paginate_thread) use the same scheme on (timestamp, id)
+within one ticket, paging backwards ("load older") or forwards ("load
+newer") from a cursor; the (ticket, timestamp, id) index serves both.
+"""
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+
+from django.db.models import Q, QuerySet
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+DEFAULT_SORT = "-created_at"
+
+DEFAULT_THREAD_PAGE_SIZE = 50
+MAX_THREAD_PAGE_SIZE = 200
+
+_THREAD = "thread"
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client sends a cursor we did not issue."""
+
+
+def encode_cursor(ticket, sort: str = DEFAULT_SORT) -> str:
+    """Build the opaque cursor pointing just after `ticket`."""
+    value = getattr(ticket, sort.lstrip("-"))
+    raw = json.dumps([sort, value.isoformat(), ticket.pk])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str = DEFAULT_SORT) -> tuple[datetime, int]:
+    """Decode a cursor back into its (value, id) key for `sort`."""
+    cursor_sort, value, pk = _decode(cursor)
+    try:
+        value, pk = datetime.fromisoformat(value), int(pk)
+    except (TypeError, ValueError) as exc:
+        raise InvalidCursor("Malformed cursor.") from exc
+    if cursor_sort != sort:
+        raise InvalidCursor("Cursor was issued for a different sort order.")
+    return value, pk
+
+
+def encode_message_cursor(message) -> str:
+    """Build the opaque thread cursor pointing at `message`."""
+    raw = json.dumps([_THREAD, message.timestamp.isoformat(), str(message.pk)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_message_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    kind, value, pk = _decode(cursor)
+    if kind != _THREAD:
+        raise InvalidCursor("Not a message cursor.")
+    try:
+        return datetime.fromisoformat(value), uuid.UUID(pk)
+    except (AttributeError, TypeError, ValueError) as exc:
+        raise InvalidCursor("Malformed cursor.") from exc
+
+
+def _decode(cursor: str) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        parts = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursor("Malformed cursor.") from exc
+    if not isinstance(parts, list) or len(parts) != 3:
+        raise InvalidCursor("Malformed cursor.")
+    return parts
+
+
+def paginate(
+    queryset: QuerySet,
+    cursor: str | None,
+    limit: int,
+    sort: str = DEFAULT_SORT,
+) -> tuple[list, str | None]:
+    """
+    Return one page of `queryset` ordered by `sort`, plus the next cursor.
+
+    One extra row is fetched to find out whether another page exists, so
+    no COUNT(*) is ever needed.
+    """
+    rows = list(page_queryset(queryset, cursor, limit, sort))
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, encode_cursor(rows[-1], sort)
+    return rows, None
+
+
+def page_queryset(
+    queryset: QuerySet,
+    cursor: str | None,
+    limit: int,
+    sort: str = DEFAULT_SORT,
+) -> QuerySet:
+    """The query paginate() runs for one page (limit + 1 rows), unevaluated."""
+    field = sort.lstrip("-")
+    descending = sort.startswith("-")
+    op = "lt" if descending else "gt"
+
+    queryset = queryset.order_by(sort, "-id" if descending else "id")
+    if cursor:
+        value, pk = decode_cursor(cursor, sort)
+        # (field, id) past (value, pk), written so that the inclusive bound
+        # on `field` becomes the index condition and the OR only filters
+        # the boundary rows.
+        queryset = queryset.filter(
+            Q(**{f"{field}__{op}e": value})
+            & (Q(**{f"{field}__{op}": value}) | Q(**{f"pk__{op}": pk}))
+        )
+    return queryset[: limit + 1]
+
+
+def paginate_thread(
+    queryset: QuerySet,
+    before: str | None,
+    after: str | None,
+    limit: int,
+) -> tuple[list, str | None, str | None]:
+    """
+    Return up to `limit` messages of one thread in chronological order,
+    plus (older_cursor, newer_cursor).
+
+    Without a cursor this is the tail of the thread; `before` pages towards
+    older messages, `after` towards newer ones. older_cursor is None once
+    the start of the thread is reached. newer_cursor is always set (the
+    last message, or `after` itself on an empty page) so clients can keep
+    asking for messages that arrive later.
+    """
+    if before and after:
+        raise InvalidCursor("Pass either 'before' or 'after', not both.")
+
+    if after:
+        timestamp, pk = decode_message_cursor(after)
+        rows = list(
+            queryset.filter(
+                Q(timestamp__gte=timestamp) & (Q(timestamp__gt=timestamp) | Q(pk__gt=pk))
+            ).order_by("timestamp", "id")[:limit]
+        )
+        # The `after` message itself is older than this page
+        has_older = True
+    else:
+        queryset = queryset.order_by("-timestamp", "-id")
+        if before:
+            timestamp, pk = decode_message_cursor(before)
+            queryset = queryset.filter(
+                Q(timestamp__lte=timestamp) & (Q(timestamp__lt=timestamp) | Q(pk__lt=pk))
+            )
+        rows = list(queryset[: limit + 1])
+        has_older = len(rows) > limit
+        rows = rows[:limit][::-1]
+
+    older = encode_message_cursor(rows[0]) if rows and has_older else None
+    newer = encode_message_cursor(rows[-1]) if rows else after
+    return rows, older, newer
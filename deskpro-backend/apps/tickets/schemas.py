@@ -5,10 +5,11 @@ Frontend expects camelCase field names (e.g. customerName, createdAt).
 We use alias_generator so Django snake_case model fields map automatically.
 """
 from datetime import datetime
-from typing import Optional
-from pydantic import ConfigDict
+from functools import lru_cache
+from typing import Annotated, Any, Optional
+from pydantic import ConfigDict, Field, StringConstraints
 
-from ninja import Schema
+from ninja import FilterSchema, Schema
 
 
 def to_camel(s: str) -> str:
@@ -17,6 +18,21 @@ def to_camel(s: str) -> str:
     return parts[0] + "".join(p.title() for p in parts[1:])
 
 
+_camel_key = lru_cache(maxsize=None)(to_camel)
+
+
+def camelize(data: Any) -> Any:
+    """
+    Recursively rename dict keys to camelCase — the trusted-output twin of
+    CamelSchema, used when FAST_JSON skips schema validation.
+    """
+    if isinstance(data, dict):
+        return {_camel_key(k): camelize(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [camelize(v) for v in data]
+    return data
+
+
 class CamelSchema(Schema):
     model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
 
@@ -41,3 +57,135 @@ class TicketOut(CamelSchema):
     created_at: datetime
     updated_at: datetime
     messages: list[TicketMessageOut] = []
+
+
+class TicketDetailOut(TicketOut):
+    # Set when `messages` holds only the latest messages (?messages=latest:N);
+    # pass it as `before` to GET /api/tickets/{id}/messages to load older ones
+    older_messages_cursor: Optional[str] = None
+
+
+class TicketMessagePageOut(CamelSchema):
+    """One window of a thread, oldest first — see pagination.paginate_thread."""
+    items: list[TicketMessageOut]
+    older_cursor: Optional[str] = None
+    newer_cursor: Optional[str] = None
+
+
+class TicketSummaryOut(CamelSchema):
+    """Inbox row — ticket columns plus the denormalized thread summary."""
+    id: int
+    subject: str
+    customer_name: str
+    status: str
+    priority: str
+    channel: str
+    assignee: str
+    tags: list[str]
+    created_at: datetime
+    updated_at: datetime
+    message_count: int = 0
+    last_message_at: Optional[datetime] = None
+    last_message_sender: str = ""
+    last_message_preview: str = ""
+
+
+class TicketListItemOut(TicketSummaryOut):
+    """Ticket list row — the inbox row plus the customer's email."""
+    customer_email: str
+
+
+class TicketPageOut(CamelSchema):
+    items: list[TicketListItemOut]
+    next_cursor: Optional[str] = None
+
+
+class TicketSummaryPageOut(CamelSchema):
+    items: list[TicketSummaryOut]
+    next_cursor: Optional[str] = None
+
+
+class TicketSearchHitOut(TicketSummaryOut):
+    """Search result — summary row plus rank and <mark>-highlighted excerpts."""
+    rank: float
+    subject_highlight: str
+    snippet: Optional[str] = None
+
+
+class TicketSearchPageOut(CamelSchema):
+    items: list[TicketSearchHitOut]
+    next_offset: Optional[int] = None
+
+
+class TicketChangeMessageOut(TicketMessageOut):
+    ticket_id: int
+    updated_at: datetime
+
+
+class TicketChangesOut(CamelSchema):
+    """Delta since a watermark — see apps.tickets.sync."""
+    tickets: list[TicketSummaryOut] = []
+    messages: list[TicketChangeMessageOut] = []
+    deleted_tickets: list[int] = []
+    deleted_messages: list[str] = []
+    watermark: str
+
+
+class ArchivedTicketOut(TicketOut):
+    archived_at: datetime
+
+
+class ArchivedTicketSummaryOut(CamelSchema):
+    id: int
+    subject: str
+    customer_email: str
+    status: str
+    created_at: datetime
+    updated_at: datetime
+    archived_at: datetime
+
+
+class TicketFilterIn(FilterSchema):
+    """
+    Query-string filters for ticket lists. Repeat a list param to OR values
+    (?status=open&status=pending); `tags` matches tickets with any given tag.
+    """
+    status: Optional[list[str]] = Field(None, q="status__in")
+    priority: Optional[list[str]] = Field(None, q="priority__in")
+    channel: Optional[list[str]] = Field(None, q="channel__in")
+    assignee: Optional[str] = Field(None, q="assignee")
+    tags: Optional[list[str]] = Field(None, q="tags__overlap")
+    created_after: Optional[datetime] = Field(None, q="created_at__gte")
+    created_before: Optional[datetime] = Field(None, q="created_at__lt")
+    updated_after: Optional[datetime] = Field(None, q="updated_at__gte")
+    updated_before: Optional[datetime] = Field(None, q="updated_at__lt")
+
+
+# Ticket.tags is ArrayField(CharField(max_length=100))
+Tag = Annotated[str, StringConstraints(max_length=100)]
+
+
+class TicketBulkUpdateIn(CamelSchema):
+    """
+    Select tickets by `ids` or by `filter` (exactly one), then apply any
+    combination of the set/add/remove operations in one UPDATE.
+    """
+    ids: Optional[list[int]] = Field(None, max_length=1000)
+    filter: Optional[TicketFilterIn] = None
+    set_status: Optional[str] = None
+    set_assignee: Optional[str] = Field(None, max_length=255)
+    add_tags: list[Tag] = []
+    remove_tags: list[Tag] = []
+
+
+class TicketBulkUpdateOut(CamelSchema):
+    updated: int
+
+
+class TicketStatsOut(CamelSchema):
+    total: int
+    status: dict[str, int]
+    priority: dict[str, int]
+    channel: dict[str, int]
+    assignee: dict[str, int]
+    tag: dict[str, int]
@@ -0,0 +1,114 @@
+"""
+Postgres full-text search over tickets.
+
+Ticket.search_vector holds a weighted tsvector of
+  A — subject
+  B — customer name + email
+  C — every message body
+and is served by a GIN index, so `search_vector @@ query` never scans
+tickets_ticketmessage.
+
+Keeping it current (wired up in apps.tickets.signals):
+  - message insert  → append_message_vector(): O(1) concat of the new body
+  - ticket save     → rebuild_search_vectors() for that ticket
+  - message delete  → rebuild_search_vectors() for its ticket
+The backfill_search_vectors command rebuilds whole tenant DBs in batches.
+"""
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.db import connections
+from django.db.models import F, QuerySet
+
+from apps.tickets.models import TicketMessage
+
+# Text search configuration. 'simple' does no stemming, which is the
+# safest choice while tenants write in mixed languages.
+SEARCH_CONFIG = "simple"
+
+HIGHLIGHT_OPTIONS = {
+    "start_sel": "<mark>",
+    "stop_sel": "</mark>",
+    "max_words": 30,
+    "min_words": 10,
+}
+
+_REBUILD_SQL = """
+    UPDATE tickets_ticket t SET search_vector =
+        setweight(to_tsvector(%(cfg)s::regconfig, coalesce(t.subject, '')), 'A')
+        || setweight(to_tsvector(%(cfg)s::regconfig,
+               coalesce(t.customer_name, '') || ' ' || coalesce(t.customer_email, '')), 'B')
+        || setweight(to_tsvector(%(cfg)s::regconfig, coalesce(
+               (SELECT string_agg(m.body, ' ') FROM tickets_ticketmessage m
+                WHERE m.ticket_id = t.id), '')), 'C')
+    WHERE t.id = ANY(%(ids)s)
+"""
+
+_APPEND_SQL = """
+    UPDATE tickets_ticket SET search_vector =
+        coalesce(search_vector, ''::tsvector)
+        || setweight(to_tsvector(%(cfg)s::regconfig, %(body)s), 'C')
+    WHERE id = %(ticket_id)s
+"""
+
+
+def rebuild_search_vectors(ticket_ids: list[int], using: str) -> int:
+    """Recompute search_vector from scratch for the given tickets."""
+    if not ticket_ids:
+        return 0
+    with connections[using].cursor() as cursor:
+        cursor.execute(_REBUILD_SQL, {"cfg": SEARCH_CONFIG, "ids": list(ticket_ids)})
+        return cursor.rowcount
+
+
+def append_message_vector(ticket_id: int, body: str, using: str) -> None:
+    """Fold one new message body into its ticket's search_vector."""
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            _APPEND_SQL,
+            {"cfg": SEARCH_CONFIG, "body": body, "ticket_id": ticket_id},
+        )
+
+
+def build_query(text: str) -> SearchQuery:
+    """Parse user input with websearch syntax ("quoted phrases", -exclude, or)."""
+    return SearchQuery(text, search_type="websearch", config=SEARCH_CONFIG)
+
+
+def search_tickets(queryset: QuerySet, query: SearchQuery) -> QuerySet:
+    """Filter `queryset` to matches, ranked best first, with a subject headline."""
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(
+            rank=SearchRank(F("search_vector"), query),
+            subject_headline=SearchHeadline(
+                "subject", query, config=SEARCH_CONFIG, **HIGHLIGHT_OPTIONS
+            ),
+        )
+        .order_by("-rank", "-id")
+    )
+
+
+def message_snippets(ticket_ids: list[int], query: SearchQuery, using: str) -> dict[int, str]:
+    """
+    Return {ticket_id: highlighted excerpt} from the first matching message
+    of each ticket. Only runs over the tickets of the current result page.
+    """
+    if not ticket_ids:
+        return {}
+    rows = (
+        TicketMessage.objects.using(using)
+        .filter(ticket_id__in=ticket_ids)
+        .annotate(document=SearchVector("body", config=SEARCH_CONFIG))
+        .filter(document=query)
+        .annotate(
+            snippet=SearchHeadline("body", query, config=SEARCH_CONFIG, **HIGHLIGHT_OPTIONS)
+        )
+        .order_by("ticket_id", "timestamp")
+        .distinct("ticket_id")
+        .values_list("ticket_id", "snippet")
+    )
+    return dict(rows)
@@ -0,0 +1,88 @@
+"""
+Model signal handlers for the tickets app (connected in TicketsConfig.ready).
+
+Writes always carry `using`, so handlers run against the same tenant DB
+as the save that triggered them.
+"""
+from django.conf import settings
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.tickets.cache import bump_version
+from apps.tickets.models import Ticket, TicketMessage
+from apps.tickets.search import append_message_vector, rebuild_search_vectors
+
+# Ticket columns that feed Ticket.search_vector
+SEARCHABLE_FIELDS = frozenset({"subject", "customer_name", "customer_email"})
+
+
+@receiver(post_save, sender=Ticket)
+def ticket_saved(sender, instance: Ticket, created, using, update_fields=None, **kwargs):
+    if update_fields is not None and not SEARCHABLE_FIELDS & set(update_fields):
+        return
+    rebuild_search_vectors([instance.pk], using=using)
+
+
+@receiver(post_save, sender=TicketMessage)
+def message_saved(sender, instance: TicketMessage, created, using, **kwargs):
+    if created:
+        append_message_vector(instance.ticket_id, instance.body, using=using)
+    else:
+        rebuild_search_vectors([instance.ticket_id], using=using)
+    _touch_ticket(instance.ticket_id, using)
+
+
+@receiver(post_delete, sender=TicketMessage)
+def message_deleted(sender, instance: TicketMessage, using, origin=None, **kwargs):
+    if _deleted_with_ticket(origin):
+        return
+    rebuild_search_vectors([instance.ticket_id], using=using)
+    _touch_ticket(instance.ticket_id, using)
+
+
+def _deleted_with_ticket(origin) -> bool:
+    """
+    True when a message is removed by the cascade of a Ticket delete
+    (`origin` is the Ticket or Ticket queryset delete() was called on):
+    its ticket is going too, and the ticket's own post_delete covers
+    cache and event fan-out, so per-message work would only add queries.
+    """
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return model is Ticket
+
+
+def _touch_ticket(ticket_id: int, using: str) -> None:
+    """
+    Bump the parent ticket's updated_at so thread changes invalidate the
+    ticket's ETag / Last-Modified (apps.tickets.conditional). Uses .update()
+    so it does not re-enter ticket_saved.
+    """
+    Ticket.objects.using(using).filter(pk=ticket_id).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Ticket)
+@receiver(post_delete, sender=Ticket)
+@receiver(post_save, sender=TicketMessage)
+@receiver(post_delete, sender=TicketMessage)
+def invalidate_cached_reads(sender, using, **kwargs):
+    if sender is TicketMessage and _deleted_with_ticket(kwargs.get("origin")):
+        return
+    bump_version(using)
+
+
+@receiver(post_save, sender=Ticket)
+@receiver(post_delete, sender=Ticket)
+@receiver(post_save, sender=TicketMessage)
+@receiver(post_delete, sender=TicketMessage)
+def publish_local_events(sender, using, **kwargs):
+    """TICKET_EVENTS_BACKEND=local: push this process's writes to SSE clients."""
+    if settings.TICKET_EVENTS_BACKEND != "local":
+        return
+    if sender is TicketMessage and _deleted_with_ticket(kwargs.get("origin")):
+        return
+    from apps.tickets.events import hub
+
+    transaction.on_commit(lambda: hub.poll_local(using), using=using)
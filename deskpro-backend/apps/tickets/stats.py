@@ -0,0 +1,85 @@
+"""
+Ticket statistics read from the TicketStat rollup table.
+
+Counters are kept current by DB triggers (migration 0005), so reading
+dashboard stats is one indexed scan of a small table instead of GROUP BYs
+over tickets_ticket. reconcile() rebuilds them from scratch for repair
+and drift monitoring (reconcile_ticket_stats command).
+"""
+from django.db import connections, transaction
+
+from apps.tickets.models import TicketStat
+
+DIMENSIONS = ("status", "priority", "channel", "assignee", "tag")
+
+# Same derivation as the trigger in migration 0005
+_EXPECTED_SQL = """
+    WITH changed AS (SELECT status, priority, channel, assignee, tags, 1 AS delta
+                     FROM tickets_ticket)
+    SELECT dimension, value, sum(delta) FROM (
+        SELECT 'total' AS dimension, '' AS value, delta FROM changed
+        UNION ALL SELECT 'status', status, delta FROM changed
+        UNION ALL SELECT 'priority', priority, delta FROM changed
+        UNION ALL SELECT 'channel', channel, delta FROM changed
+        UNION ALL SELECT 'assignee', assignee, delta FROM changed
+        UNION ALL SELECT 'tag', t.tag, delta
+            FROM changed CROSS JOIN LATERAL (SELECT DISTINCT unnest(changed.tags) AS tag) t
+    ) d
+    GROUP BY dimension, value
+"""
+
+
+def get_stats(using: str | None = None) -> dict:
+    """Return {"total": n, "status": {value: n}, ..., "tag": {value: n}}."""
+    stats: dict = {"total": 0, **{dim: {} for dim in DIMENSIONS}}
+    rows = TicketStat.objects.using(using).filter(count__gt=0).values_list(
+        "dimension", "value", "count"
+    )
+    for dimension, value, count in rows:
+        if dimension == "total":
+            stats["total"] = count
+        elif dimension in stats:
+            stats[dimension][value] = count
+    return stats
+
+
+def reconcile(using: str, fix: bool = True) -> list[tuple[str, str, int, int]]:
+    """
+    Recompute every counter from tickets_ticket and return the drift as
+    [(dimension, value, stored, actual)]. With fix=True the table is
+    rewritten in the same transaction.
+
+    A check (fix=False) reads both tables from one REPEATABLE READ
+    snapshot and blocks nobody: the triggers update the counters in the
+    writing transaction, so any snapshot sees them agree. A fix locks the
+    counter table for the duration instead, so concurrent ticket writes
+    wait at their trigger and apply their deltas after we commit (they
+    are not yet visible to our recount).
+    """
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        if fix:
+            cursor.execute("LOCK TABLE tickets_ticketstat IN SHARE ROW EXCLUSIVE MODE")
+        else:
+            cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+        cursor.execute(_EXPECTED_SQL)
+        actual = {(dim, value): count for dim, value, count in cursor.fetchall()}
+        stored = {
+            (dim, value): count
+            for dim, value, count in TicketStat.objects.using(using).values_list(
+                "dimension", "value", "count"
+            )
+        }
+
+        drift = [
+            (dim, value, stored.get((dim, value), 0), actual.get((dim, value), 0))
+            for dim, value in sorted(stored.keys() | actual.keys())
+            if stored.get((dim, value), 0) != actual.get((dim, value), 0)
+        ]
+
+        if fix and drift:
+            TicketStat.objects.using(using).all().delete()
+            TicketStat.objects.using(using).bulk_create(
+                TicketStat(dimension=dim, value=value, count=count)
+                for (dim, value), count in actual.items()
+            )
+    return drift
@@ -0,0 +1,158 @@
+"""
+Delta sync for client-side ticket replicas (GET /api/tickets/changes).
+
+A client takes a watermark (call without `since`), loads the ticket list,
+then repeatedly asks for everything that changed after its watermark:
+
+  tickets   updated_at >  since   (ticket_updated_id_idx)
+  messages  updated_at >  since   (TicketMessage.updated_at index)
+  deleted   tombstones with deleted_at > since (TicketTombstone)
+
+Each response carries the next watermark. updated_at is stamped when a
+transaction writes the row, not when it commits, so a watermark of "now"
+would skip rows of transactions still open: they commit later with a stamp
+below it. The watermark is therefore held back to the start of the oldest
+transaction in progress on the database (pg_stat_activity.xact_start, read
+in the same query as the DB clock), less STAMP_SLACK for the clock skew
+between app servers and the DB and the moment between Django stamping
+updated_at and sending the statement. Limits: a transaction open longer
+than MAX_HOLD is not waited for, and sessions of other roles are only seen
+with pg_read_all_stats (tenant DBs use one role). The overlap means a
+change may be delivered twice — clients apply changes as idempotent
+upserts. Counters ticket_sync.watermarks / .watermark_lag_ms / .held give
+the mean lag and how often an open transaction held a watermark back.
+
+Watermarks are opaque to clients (base64 of the ISO timestamp). A
+watermark older than the tombstone retention window, or older than a
+`resync` tombstone, cannot be served incrementally; the endpoint answers
+410 and the client starts over.
+"""
+import base64
+import binascii
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from apps.tickets.models import TicketMessage, TicketTombstone
+from core import metrics
+
+# How far a watermark trails the oldest open transaction (see module docstring)
+STAMP_SLACK = timedelta(seconds=1)
+
+# Longest an open transaction holds watermarks back
+MAX_HOLD = timedelta(minutes=10)
+
+_WATERMARK_SQL = """
+    SELECT clock_timestamp(), min(xact_start)
+    FROM pg_stat_activity
+    WHERE datname = current_database()
+      AND backend_type = 'client backend'
+      AND pid <> pg_backend_pid()
+"""
+
+# A delta larger than this is cheaper to get as a full refetch
+MAX_TICKET_CHANGES = 500
+MAX_MESSAGE_CHANGES = 2000
+
+
+class InvalidWatermark(ValueError):
+    pass
+
+
+class ResyncRequired(Exception):
+    """The delta since the watermark cannot (or should not) be served."""
+
+
+def encode_watermark(moment: datetime) -> str:
+    return base64.urlsafe_b64encode(moment.isoformat().encode()).decode().rstrip("=")
+
+
+def decode_watermark(watermark: str) -> datetime:
+    try:
+        padded = watermark + "=" * (-len(watermark) % 4)
+        moment = datetime.fromisoformat(base64.urlsafe_b64decode(padded).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidWatermark("Invalid watermark.")
+    if timezone.is_naive(moment):
+        raise InvalidWatermark("Invalid watermark.")
+    return moment
+
+
+def current_watermark(db_alias: str) -> str:
+    """A watermark no transaction still open on `db_alias` can commit a change below."""
+    with connections[db_alias].cursor() as cursor:
+        cursor.execute(_WATERMARK_SQL)
+        clock, oldest_open = cursor.fetchone()
+    moment = clock
+    if oldest_open is not None and oldest_open < clock:
+        moment = max(oldest_open, clock - MAX_HOLD)
+        metrics.incr("ticket_sync.held")
+    moment -= STAMP_SLACK
+    metrics.incr("ticket_sync.watermarks")
+    metrics.incr("ticket_sync.watermark_lag_ms", int((clock - moment).total_seconds() * 1000))
+    return encode_watermark(moment)
+
+
+def changes_since(tickets: QuerySet, since: datetime) -> dict:
+    """
+    Tickets and messages changed after `since`, plus tombstoned ids.
+    `tickets` is the tenant's Ticket queryset; messages and tombstones are
+    read from the same database. Raises ResyncRequired.
+    """
+    db_alias = tickets.db
+    # Taken before querying so nothing written during the reads is skipped
+    watermark = current_watermark(db_alias)
+
+    retention = timedelta(seconds=settings.TICKET_TOMBSTONE_RETENTION)
+    if since < timezone.now() - retention:
+        raise ResyncRequired("Watermark is older than the tombstone retention window.")
+
+    tombstones = TicketTombstone.objects.using(db_alias).filter(deleted_at__gt=since)
+    if tombstones.filter(kind=TicketTombstone.KIND_RESYNC).exists():
+        raise ResyncRequired("Tickets were bulk-imported since this watermark.")
+
+    changed_tickets = list(
+        tickets.filter(updated_at__gt=since).order_by("updated_at", "id")[: MAX_TICKET_CHANGES + 1]
+    )
+    changed_messages = list(
+        TicketMessage.objects.using(db_alias)
+        .filter(updated_at__gt=since)
+        .order_by("updated_at", "id")[: MAX_MESSAGE_CHANGES + 1]
+    )
+    if len(changed_tickets) > MAX_TICKET_CHANGES or len(changed_messages) > MAX_MESSAGE_CHANGES:
+        raise ResyncRequired("Too many changes since this watermark.")
+
+    limit = MAX_TICKET_CHANGES + MAX_MESSAGE_CHANGES
+    deleted = list(tombstones.values_list("kind", "ticket_id", "message_id")[: limit + 1])
+    if len(deleted) > limit:
+        raise ResyncRequired("Too many changes since this watermark.")
+
+    deleted_tickets, deleted_messages = [], []
+    for kind, ticket_id, message_id in deleted:
+        if kind == TicketTombstone.KIND_TICKET:
+            deleted_tickets.append(ticket_id)
+        elif kind == TicketTombstone.KIND_MESSAGE:
+            deleted_messages.append(str(message_id))
+
+    return {
+        "tickets": changed_tickets,
+        "messages": changed_messages,
+        "deleted_tickets": deleted_tickets,
+        "deleted_messages": deleted_messages,
+        "watermark": watermark,
+    }
+
+
+def mark_resync(db_alias: str) -> None:
+    """Force every delta sync client of this tenant to refetch (bulk writes)."""
+    TicketTombstone.objects.using(db_alias).create(kind=TicketTombstone.KIND_RESYNC)
+
+
+def prune_tombstones(db_alias: str) -> int:
+    """Delete tombstones older than TICKET_TOMBSTONE_RETENTION seconds."""
+    cutoff = timezone.now() - timedelta(seconds=settings.TICKET_TOMBSTONE_RETENTION)
+    deleted, _ = TicketTombstone.objects.using(db_alias).filter(deleted_at__lt=cutoff).delete()
+    return deleted
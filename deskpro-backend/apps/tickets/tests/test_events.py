@@ -0,0 +1,20 @@
+import pytest
+from django.db import connections
+
+from apps.tickets import events
+
+pytestmark = pytest.mark.django_db(databases=["default", "tenant_test"], transaction=True)
+
+
+def test_idle_stream_holds_no_connection(tenant_alias, settings, monkeypatch):
+    settings.TICKET_EVENTS_BACKEND = "local"
+    monkeypatch.setattr(events, "KEEPALIVE_SECONDS", 0.01)
+
+    frames = events.stream(tenant_alias, last_event_id=0)
+    try:
+        assert next(frames).startswith("retry:")
+        # Subscribed and replayed (nothing), now waiting for events
+        assert next(frames) == ": keepalive\n\n"
+        assert connections[tenant_alias].connection is None
+    finally:
+        frames.close()
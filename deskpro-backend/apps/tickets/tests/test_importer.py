@@ -0,0 +1,37 @@
+import pytest
+
+from apps.tickets.importer import RecordError, TicketImporter
+from apps.tickets.models import Ticket, TicketImportProgress
+
+pytestmark = pytest.mark.django_db(databases=["default", "tenant_test"])
+
+
+def _records(n: int, bad_at: int | None = None) -> list[dict]:
+    return [
+        {
+            "subject": f"Ticket {i}",
+            "customer_name": "Erika",
+            "customer_email": "not-an-email" if i == bad_at else f"erika{i}@example.com",
+            "messages": [{"sender": "customer", "body": "Hello"}],
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+def test_resume_skips_exactly_the_committed_batches(tenant_alias):
+    importer = TicketImporter(tenant_alias, batch_size=2, checkpoint="export.ndjson")
+
+    with pytest.raises(RecordError):
+        importer.run(_records(5, bad_at=4))
+    # Batch 1-2 committed with its progress; 3 was pending when 4 failed
+    assert Ticket.objects.count() == 2
+    assert TicketImportProgress.objects.get(key="export.ndjson").records_done == 2
+
+    result = importer.run(_records(5))
+
+    assert result.skipped == 2
+    assert result.tickets == 3
+    assert sorted(Ticket.objects.values_list("subject", flat=True)) == [
+        f"Ticket {i}" for i in range(1, 6)
+    ]
+    assert TicketImportProgress.objects.get(key="export.ndjson").records_done == 5
@@ -0,0 +1,82 @@
+"""
+Plan shape of the ticket list queries: each server-side filter of
+GET /api/tickets/ is served by its index (Ticket.Meta.indexes), and
+unfiltered pages, first or not, come out of the (sort field, id) index
+already ordered, with no Sort node.
+
+Tiny tables are always seq-scanned, so the tenant gets a few thousand
+tickets (analyzed) first.
+"""
+import pytest
+from django.db import connections
+
+from apps.tickets.models import Ticket
+from apps.tickets.pagination import page_queryset, paginate
+
+pytestmark = pytest.mark.django_db(databases=["default", "tenant_test"])
+
+PAGE_SIZE = 50
+SEED_TICKETS = 2000
+
+# Pages in the order of an index on (sort field, id)
+PAGES = [
+    ("first page", "ticket_created_id_idx", lambda qs, cursor: page_queryset(qs, None, PAGE_SIZE)),
+    ("cursor page", "ticket_created_id_idx", lambda qs, cursor: page_queryset(qs, cursor, PAGE_SIZE)),
+    ("sort=-updated_at", "ticket_updated_id_idx",
+     lambda qs, cursor: page_queryset(qs, None, PAGE_SIZE, "-updated_at")),
+]
+
+FILTERS = [
+    ("status=open", "ticket_status_created_idx",
+     lambda qs: page_queryset(qs.filter(status__in=["open"]), None, PAGE_SIZE)),
+    ("priority=urgent", "ticket_priority_created_idx",
+     lambda qs: page_queryset(qs.filter(priority__in=["urgent"]), None, PAGE_SIZE)),
+    ("channel=chat", "ticket_channel_created_idx",
+     lambda qs: page_queryset(qs.filter(channel__in=["chat"]), None, PAGE_SIZE)),
+    ("assignee+status", "ticket_assignee_status_idx",
+     lambda qs: qs.filter(assignee="nobody@example.com", status__in=["open"])),
+    ("tags overlap", "ticket_tags_gin", lambda qs: qs.filter(tags__overlap=["billing"])),
+]
+
+
+@pytest.fixture
+def tickets(tenant_alias):
+    # The filtered values are rare, as a filter's index is only worth
+    # reading when it narrows the list down
+    Ticket.objects.bulk_create(
+        (
+            Ticket(
+                subject=f"Ticket {i}",
+                customer_name="Erika",
+                customer_email=f"erika{i}@example.com",
+                status="open" if i % 50 == 0 else "closed",
+                priority="urgent" if i % 50 == 0 else "low",
+                channel="chat" if i % 50 == 0 else "email",
+                assignee=f"agent{i % 20}@example.com",
+                tags=["billing"] if i % 50 == 0 else ["login"],
+            )
+            for i in range(SEED_TICKETS)
+        ),
+        batch_size=1000,
+    )
+    with connections[tenant_alias].cursor() as cursor:
+        cursor.execute("ANALYZE tickets_ticket")
+    return Ticket.objects.all()
+
+
+@pytest.mark.parametrize("label,index,build", PAGES, ids=[p[0] for p in PAGES])
+def test_page_is_read_in_index_order(tickets, label, index, build):
+    _, cursor = paginate(tickets, None, 1)
+    assert cursor
+
+    plan = build(tickets, cursor).explain()
+
+    assert index in plan, plan
+    assert "Sort" not in plan, plan
+
+
+@pytest.mark.parametrize("label,index,build", FILTERS, ids=[f[0] for f in FILTERS])
+def test_filter_uses_its_index(tickets, label, index, build):
+    plan = build(tickets).explain()
+
+    assert index in plan, plan
@@ -62,6 +62,7 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + CONTROL_PLANE_APPS + TENANT_SC
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "core.compression.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -109,6 +110,66 @@ DATABASES = {
 
 DATABASE_ROUTERS = ["core.db_router.TenantDatabaseRouter"]
 
+# ---------------------------------------------------------------------------
+# Caches
+# ---------------------------------------------------------------------------
+
+# "tickets" holds per-tenant rendered ticket reads (see apps/tickets/cache.py).
+# Local memory is fine for a single process; with several workers set
+# TICKET_CACHE_URL (e.g. redis://localhost:6379/1, needs the `redis` package)
+# and configure the server with maxmemory + allkeys-lru so it stays bounded.
+_TICKET_CACHE_URL = config("TICKET_CACHE_URL", default="")
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "tickets": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": _TICKET_CACHE_URL,
+        }
+        if _TICKET_CACHE_URL
+        else {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "tickets",
+            "OPTIONS": {
+                "MAX_ENTRIES": config("TICKET_CACHE_MAX_ENTRIES", default=5000, cast=int),
+            },
+        }
+    ),
+}
+
+# Seconds a cached ticket response may live (invalidation is by version bump)
+TICKET_CACHE_TIMEOUT = config("TICKET_CACHE_TIMEOUT", default=300, cast=int)
+
+# Fast JSON path: orjson renderer + unvalidated ("trusted") ticket responses.
+# Requires the optional orjson dependency (uv sync --extra fast).
+FAST_JSON = config("FAST_JSON", default=False, cast=bool)
+
+# Ticket retention defaults (apps.tickets.archive); per-tenant overrides live
+# on Tenant.archive_after_days / purge_after_days. 0 disables the step.
+TICKET_ARCHIVE_AFTER_DAYS = config("TICKET_ARCHIVE_AFTER_DAYS", default=730, cast=int)
+TICKET_PURGE_AFTER_DAYS = config("TICKET_PURGE_AFTER_DAYS", default=0, cast=int)
+
+# Response compression (core.compression). br / zstd need the optional
+# `compression` extra; without it only gzip is offered.
+COMPRESSION_MIN_SIZE = config("COMPRESSION_MIN_SIZE", default=1024, cast=int)
+COMPRESSION_LEVELS = {
+    "gzip": config("COMPRESSION_GZIP_LEVEL", default=6, cast=int),
+    "br": config("COMPRESSION_BROTLI_LEVEL", default=4, cast=int),
+    "zstd": config("COMPRESSION_ZSTD_LEVEL", default=3, cast=int),
+}
+
+# Ticket change feed (GET /api/tickets/events, apps.tickets.events).
+# "listen" uses Postgres LISTEN/NOTIFY; "local" only sees this process's writes.
+TICKET_EVENTS_BACKEND = config("TICKET_EVENTS_BACKEND", default="listen")
+# Seconds TicketEvent rows are kept for Last-Event-ID replay
+TICKET_EVENTS_RETENTION = config("TICKET_EVENTS_RETENTION", default=86400, cast=int)
+# Seconds deletions are remembered for delta sync (GET /api/tickets/changes);
+# clients with an older watermark must refetch everything.
+TICKET_TOMBSTONE_RETENTION = config("TICKET_TOMBSTONE_RETENTION", default=30 * 86400, cast=int)
+
 # Custom User Model
 AUTH_USER_MODEL = "staff.SaasAdmin"
 
@@ -143,6 +204,54 @@ SIMPLE_JWT = {
     "USER_ID_CLAIM": "user_id",
 }
 
+# Tenant slug → DB alias cache (management.tenants.registry), in seconds
+TENANT_REGISTRY_TTL = config("TENANT_REGISTRY_TTL", default=300, cast=int)
+TENANT_REGISTRY_NEGATIVE_TTL = config("TENANT_REGISTRY_NEGATIVE_TTL", default=30, cast=int)
+TENANT_REGISTRY_MAX_ENTRIES = config("TENANT_REGISTRY_MAX_ENTRIES", default=10000, cast=int)
+
+# Tenant DB aliases kept registered per process (core.tenant_connections):
+# least recently used beyond the cap, and any idle this many seconds, are
+# closed and forgotten; 0 disables either limit
+TENANT_DB_MAX_ALIASES = config("TENANT_DB_MAX_ALIASES", default=1000, cast=int)
+TENANT_DB_IDLE_TIMEOUT = config("TENANT_DB_IDLE_TIMEOUT", default=900, cast=int)
+
+# Tenant DB connection pools (psycopg_pool via Django's OPTIONS["pool"]).
+# Sizes are per worker process and can be overridden per Tenant. The budget
+# caps the connections one process holds across tenant pools, counting each
+# registered tenant's min size until its pool grows (least recently used idle
+# pools are closed to stay under) — so about budget / min size tenants stay
+# warm per worker. Keep workers × budget under the Neon project's limit.
+TENANT_DB_POOL = config("TENANT_DB_POOL", default=True, cast=bool)
+TENANT_DB_POOL_MIN_SIZE = config("TENANT_DB_POOL_MIN_SIZE", default=1, cast=int)
+TENANT_DB_POOL_MAX_SIZE = config("TENANT_DB_POOL_MAX_SIZE", default=4, cast=int)
+TENANT_DB_POOL_TIMEOUT = config("TENANT_DB_POOL_TIMEOUT", default=5, cast=float)      # wait for a free connection
+TENANT_DB_POOL_MAX_IDLE = config("TENANT_DB_POOL_MAX_IDLE", default=300, cast=float)  # shrink back to min_size
+TENANT_DB_POOL_BUDGET = config("TENANT_DB_POOL_BUDGET", default=200, cast=int)
+
+# Schema-per-tenant storage (Tenant.storage = "schema"): tenant apps live in
+# their own Postgres schema inside one shared database, reached through a
+# single pool per worker (core.backends.tenant_schema) that sits outside the
+# budget above. Create the database once; credentials default to the
+# Control Plane's. TENANT_STORAGE_DEFAULT applies to new signups.
+TENANT_STORAGE_DEFAULT = config("TENANT_STORAGE_DEFAULT", default="database")
+TENANT_SHARED_DB = {
+    "NAME": config("TENANT_SHARED_DB_NAME", default="tenants_shared"),
+    "USER": config("TENANT_SHARED_DB_USER", default=DATABASES["default"]["USER"]),
+    "PASSWORD": config("TENANT_SHARED_DB_PASSWORD", default=DATABASES["default"]["PASSWORD"]),
+    "HOST": config("TENANT_SHARED_DB_HOST", default=DATABASES["default"]["HOST"]),
+    "PORT": config("TENANT_SHARED_DB_PORT", default=DATABASES["default"]["PORT"]),
+    "POOL_MIN_SIZE": config("TENANT_SHARED_DB_POOL_MIN_SIZE", default=2, cast=int),
+    "POOL_MAX_SIZE": config("TENANT_SHARED_DB_POOL_MAX_SIZE", default=20, cast=int),
+}
+
+# Register every active tenant when a WSGI/ASGI worker starts, and health-check
+# the DBs of the N tenants with the most members (management.tenants.warmup)
+TENANT_WARMUP = config("TENANT_WARMUP", default=False, cast=bool)
+TENANT_WARMUP_CONNECT_TOP = config("TENANT_WARMUP_CONNECT_TOP", default=0, cast=int)
+
+# Verified access tokens remembered per process (core.auth_context); 0 disables
+JWT_VERIFIED_CACHE_SIZE = config("JWT_VERIFIED_CACHE_SIZE", default=1024, cast=int)
+
 # Neon API
 NEON_API_KEY = config("NEON_API_KEY")
 NEON_PROJECT_ID = config("NEON_PROJECT_ID")
@@ -8,3 +8,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
 
 application = get_wsgi_application()
+
+# Opt-in (TENANT_WARMUP): register all active tenants before serving traffic
+from management.tenants.warmup import warm_up_on_startup  # noqa: E402
+
+warm_up_on_startup()
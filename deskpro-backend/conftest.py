@@ -0,0 +1,50 @@
+"""
+Shared pytest fixtures.
+
+Tenant-scoped apps only migrate on tenant_* aliases (TenantDatabaseRouter),
+so the session registers one, tenant_test, on the control-plane server:
+pytest-django creates and migrates a test database for it like any other.
+Tests touching the database are skipped when that server is unreachable.
+"""
+import psycopg
+import pytest
+from django.db import connections
+
+from core.tenant_connections import tenant_connections
+from core.thread_local import tenant_db
+
+TENANT_ALIAS = "tenant_test"
+
+
+def _postgres_available() -> bool:
+    params = connections["default"].get_connection_params()
+    params.pop("cursor_factory", None)
+    try:
+        psycopg.connect(**params, connect_timeout=3).close()
+    except psycopg.OperationalError:
+        return False
+    return True
+
+
+def pytest_collection_modifyitems(config, items):
+    db_items = [item for item in items if item.get_closest_marker("django_db")]
+    if db_items and not _postgres_available():
+        skip = pytest.mark.skip(reason="Postgres is not reachable")
+        for item in db_items:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(django_db_modify_db_settings_parallel_suffix):
+    default = connections["default"].settings_dict
+    tenant_connections.register(
+        TENANT_ALIAS,
+        {**default, "TEST": {**default["TEST"], "NAME": f"test_{TENANT_ALIAS}"}},
+    )
+
+
+@pytest.fixture
+def tenant_alias():
+    """The test tenant's alias, routed to for the duration of the test."""
+    with tenant_db(TENANT_ALIAS):
+        yield TENANT_ALIAS
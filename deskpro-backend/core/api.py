@@ -0,0 +1,25 @@
+"""
+Ops API — internal endpoints for monitoring, protected by X-Admin-Key.
+
+GET /api/ops/metrics — process-local counters and gauges (core.metrics)
+GET /api/ops/pools   — this worker's tenant DB connection pools (core.tenant_connections)
+"""
+from ninja import Router
+
+from core import metrics
+from core.tenant_connections import tenant_connections
+from management.tenants.auth import AdminKeyAuth
+
+router = Router(tags=["Ops"])
+
+
+@router.get("/metrics", response=dict[str, float], auth=AdminKeyAuth())
+def get_metrics(request):
+    """Return this worker's counters and gauges."""
+    return metrics.snapshot()
+
+
+@router.get("/pools", response=dict[str, dict[str, int]], auth=AdminKeyAuth())
+def get_pools(request):
+    """Return psycopg_pool statistics for each open tenant DB pool in this worker."""
+    return tenant_connections.pool_stats()
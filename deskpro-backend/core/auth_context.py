@@ -0,0 +1,118 @@
+"""
+Request-scoped JWT auth context.
+
+The access_token cookie is verified once per request: TenantMiddleware
+calls `authenticate(request)` and stores the result on
+`request.auth_context`; CookieAuth and /api/auth/me read it back instead of
+decoding the token again. Public paths skip the middleware check, so the
+first caller there pays for the decode and later ones reuse it.
+
+Verified tokens are also kept in a small process-wide LRU keyed by the
+token string, so the same token sent again (an agent's UI polling every
+few seconds) skips HMAC verification and claim parsing. An entry is
+only trusted until the token's own `exp`; invalid tokens are never cached.
+Payload dicts are shared between requests through the cache — treat them
+as read-only.
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.http import HttpRequest
+
+from core import metrics
+
+COOKIE_NAME = "access_token"
+
+_REQUEST_ATTR = "auth_context"
+
+
+@dataclass(frozen=True)
+class AuthContext:
+    token: str
+    payload: dict
+
+    @property
+    def tenant_slug(self) -> str | None:
+        return self.payload.get("tenant_slug")
+
+
+class VerifiedTokenCache:
+    """Bounded, thread-safe LRU of token → (payload, exp)."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[token]
+                return None
+            self._entries.move_to_end(token)
+            return payload
+
+    def put(self, token: str, payload: dict) -> None:
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, (int, float)) or self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[token] = (payload, float(expires_at))
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_cache = VerifiedTokenCache(settings.JWT_VERIFIED_CACHE_SIZE)
+metrics.register_gauge("jwt_cache.size", lambda: len(_cache))
+
+
+def decode_token(token: str) -> dict | None:
+    """Verify an access token and return its payload, or None if invalid/expired."""
+    payload = _cache.get(token)
+    if payload is not None:
+        metrics.incr("jwt_cache.hits")
+        return payload
+
+    metrics.incr("jwt_cache.misses")
+    try:
+        # Imported lazily: simplejwt reads settings and models at import time
+        from rest_framework_simplejwt.tokens import AccessToken
+
+        payload = dict(AccessToken(token).payload)
+    except Exception:
+        return None
+    _cache.put(token, payload)
+    return payload
+
+
+def authenticate(request: HttpRequest, token: str | None = None) -> AuthContext | None:
+    """
+    The request's verified auth context, decoding `token` (default: the
+    access_token cookie) only if this request has not done so already.
+    """
+    if token is None:
+        token = request.COOKIES.get(COOKIE_NAME)
+    if not token:
+        return None
+
+    context = getattr(request, _REQUEST_ATTR, None)
+    if context is not None and context.token == token:
+        return context
+
+    payload = decode_token(token)
+    if payload is None:
+        return None
+    context = AuthContext(token=token, payload=payload)
+    setattr(request, _REQUEST_ATTR, context)
+    return context
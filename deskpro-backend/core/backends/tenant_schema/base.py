@@ -0,0 +1,62 @@
+"""
+PostgreSQL backend for schema-per-tenant storage (Tenant.storage = "schema").
+
+Every schema tenant keeps its own alias (tenant_<slug>), so caches, change
+feeds and stats stay keyed by alias exactly as for database tenants, but
+all these aliases point at the shared tenant database and draw from ONE
+psycopg pool per process instead of a pool each. On every checkout the
+connection's search_path is set to the tenant's schema, so unqualified
+table names — the ORM's, raw SQL's and the trigger functions' — resolve
+inside it. public is left off the path: a fresh schema must never see
+another schema's django_migrations table.
+
+Extra DATABASES keys (see Tenant.get_db_config):
+  SCHEMA       the tenant's schema
+  SHARED_POOL  pool key, identical for every alias on the shared database
+
+Prepared statements are safe across tenants: Postgres re-plans a cached
+statement when search_path has changed since it was prepared.
+"""
+from django.db.backends.postgresql.base import DatabaseWrapper as PostgresDatabaseWrapper
+from psycopg import sql
+
+
+class DatabaseWrapper(PostgresDatabaseWrapper):
+    @property
+    def pool(self):
+        # Django's own pool setup, keyed by SHARED_POOL instead of the alias
+        pool_options = self.settings_dict["OPTIONS"].get("pool")
+        if not pool_options:
+            return None
+
+        key = self.settings_dict["SHARED_POOL"]
+        if key not in self._connection_pools:
+            from psycopg_pool import ConnectionPool
+
+            if pool_options is True:
+                pool_options = {}
+            connect_kwargs = self.get_connection_params()
+            connect_kwargs["autocommit"] = True
+            pool = ConnectionPool(
+                kwargs=connect_kwargs,
+                open=False,
+                configure=self._configure_connection,
+                check=ConnectionPool.check_connection if self.settings_dict["CONN_HEALTH_CHECKS"] else None,
+                **pool_options,
+            )
+            # Several threads may build one; the first to store it wins
+            self._connection_pools.setdefault(key, pool)
+
+        return self._connection_pools[key]
+
+    def close_pool(self):
+        pool = self._connection_pools.pop(self.settings_dict["SHARED_POOL"], None)
+        if pool is not None:
+            pool.close()
+
+    def init_connection_state(self):
+        super().init_connection_state()
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("SET search_path TO {}").format(sql.Identifier(self.settings_dict["SCHEMA"]))
+            )
@@ -0,0 +1,243 @@
+"""
+Response compression (gzip / brotli / zstd) for API payloads.
+
+CompressionMiddleware picks the best encoding the client accepts (zstd,
+then br, then gzip; q-values honoured) among those available:
+
+  gzip  — stdlib zlib, always available
+  br    — needs the `brotli` package     (uv sync --extra compression)
+  zstd  — needs the `zstandard` package  (uv sync --extra compression)
+
+Regular responses are compressed in one go when they are at least
+COMPRESSION_MIN_SIZE bytes. Streaming responses (exports) are compressed
+chunk by chunk as they are produced — nothing is buffered beyond the
+codec's own window, and the codec is flushed every STREAM_FLUSH_BYTES of
+input so slow streams still reach the client steadily.
+
+Skipped: responses that already carry Content-Encoding, non-text content
+types and text/event-stream (SSE frames must not sit in a codec buffer).
+
+Per-route levels: wrap a view with @compression(...) — for Ninja endpoints
+via ninja.decorators.decorate_view — to override COMPRESSION_LEVELS or to
+turn compression off for that route.
+"""
+import re
+import zlib
+from functools import partial, wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpRequest
+from django.utils.cache import patch_vary_headers
+
+from core import metrics
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the install
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the install
+    zstandard = None
+
+# Feed this much input into a streaming codec before forcing a flush
+STREAM_FLUSH_BYTES = 64 * 1024
+
+_COMPRESSIBLE = re.compile(
+    r"^(text/(?!event-stream)|application/(json|x-ndjson|javascript|xml|problem\+json))"
+)
+_REQUEST_ATTR = "_compression_overrides"
+
+
+class _Gzip:
+    def __init__(self, level: int):
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class _Brotli:
+    def __init__(self, level: int):
+        self._obj = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class _Zstd:
+    def __init__(self, level: int):
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def available_codecs() -> dict:
+    """Encoding token → codec class, most preferred first."""
+    codecs = {}
+    if zstandard is not None:
+        codecs["zstd"] = _Zstd
+    if brotli is not None:
+        codecs["br"] = _Brotli
+    codecs["gzip"] = _Gzip
+    return codecs
+
+
+def negotiate(accept_encoding: str, codecs) -> str | None:
+    """The encoding to use for this Accept-Encoding header, or None."""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        match = re.search(r"q=([0-9.]+)", params)
+        if match:
+            try:
+                q = float(match.group(1))
+            except ValueError:
+                q = 0.0
+        accepted[token] = q
+
+    best, best_q = None, 0.0
+    for encoding in codecs:  # server preference breaks q ties
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compression(enabled: bool = True, **levels: int):
+    """
+    Per-route override, e.g. @compression(gzip=1, br=1, zstd=1) for large
+    exports that should favour speed, or @compression(enabled=False).
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request: HttpRequest, *args, **kwargs):
+            setattr(request, _REQUEST_ATTR, {"enabled": enabled, "levels": levels})
+            return view(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class CompressionMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request: HttpRequest):
+        return self.process_response(request, await self.get_response(request))
+
+    def process_response(self, request: HttpRequest, response):
+        overrides = getattr(request, _REQUEST_ATTR, None) or {}
+        if not overrides.get("enabled", True):
+            return response
+        if response.has_header("Content-Encoding") or request.method == "HEAD":
+            return response
+        if not _COMPRESSIBLE.match(response.get("Content-Type", "")):
+            return response
+
+        # Varies whenever it *could* have been compressed, even if it was not
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        codecs = available_codecs()
+        encoding = negotiate(request.headers.get("Accept-Encoding", ""), codecs)
+        if encoding is None:
+            return response
+
+        levels = {**settings.COMPRESSION_LEVELS, **overrides.get("levels", {})}
+        make_codec = partial(codecs[encoding], levels[encoding])
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = _compress_async(
+                    response.streaming_content, make_codec, encoding
+                )
+            else:
+                response.streaming_content = _compress_stream(
+                    response.streaming_content, make_codec, encoding
+                )
+            response.headers.pop("Content-Length", None)
+        else:
+            if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+                return response
+            codec = make_codec()
+            compressed = codec.compress(response.content) + codec.finish()
+            if len(compressed) >= len(response.content):
+                return response
+            metrics.incr(f"compression.{encoding}.bytes_in", len(response.content))
+            metrics.incr(f"compression.{encoding}.bytes_out", len(compressed))
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # The representation changed, so a strong validator no longer holds
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+
+def _compress_stream(chunks, make_codec, encoding: str):
+    codec = make_codec()
+    pending = 0
+    for chunk in chunks:
+        out = codec.compress(chunk)
+        pending += len(chunk)
+        if pending >= STREAM_FLUSH_BYTES:
+            out += codec.flush()
+            pending = 0
+        if out:
+            yield out
+    yield codec.finish()
+    metrics.incr(f"compression.{encoding}.streams")
+
+
+async def _compress_async(chunks, make_codec, encoding: str):
+    codec = make_codec()
+    pending = 0
+    async for chunk in chunks:
+        out = codec.compress(chunk)
+        pending += len(chunk)
+        if pending >= STREAM_FLUSH_BYTES:
+            out += codec.flush()
+            pending = 0
+        if out:
+            yield out
+    yield codec.finish()
+    metrics.incr(f"compression.{encoding}.streams")
@@ -5,10 +5,14 @@ Control-plane apps (tenants, admin, auth, contenttypes, sessions) always
 use the 'default' (Control Plane) DB.
 
 All other apps (tenant related apps) are routed to the tenant DB alias
-stored in thread-local storage for the current request.
-"""
-from django.conf import settings
+stored in the request context (core.thread_local) for the current request.
 
+Every tenant has its own alias whatever its storage mode. For schema
+storage the alias points at the shared tenant database and its connections
+come from one shared pool with search_path set to the tenant's schema
+(core.backends.tenant_schema), so routing itself does not change.
+"""
+from core.tenant_connections import tenant_connections
 from core.thread_local import get_current_tenant_db
 
 # Apps that live exclusively on the Control Plane DB
@@ -66,13 +70,19 @@ class TenantDatabaseRouter:
         return None
 
 
-def register_tenant_db(tenant) -> None:
+def register_tenant_db(tenant, replace: bool = False) -> None:
     """
     Dynamically add a tenant's DB configuration to settings.DATABASES.
 
-    Called during signup (after provisioning) and lazily per-request
-    by TenantMiddleware when a tenant alias is not yet registered.
+    Called during signup (after provisioning) and lazily per-request via
+    the TenantRegistry when a tenant alias is not yet registered.
+    `replace` refreshes an existing entry (e.g. rotated credentials).
+    Registered aliases are bounded and evicted when idle — see
+    core.tenant_connections.
     """
-    alias = tenant.get_db_alias()
-    if alias not in settings.DATABASES:
-        settings.DATABASES[alias] = tenant.get_db_config()
+    tenant_connections.register(tenant.get_db_alias(), tenant.get_db_config(), replace=replace)
+
+
+def unregister_tenant_db(alias: str) -> None:
+    """Remove a tenant alias from settings.DATABASES and close its connection."""
+    tenant_connections.unregister(alias)
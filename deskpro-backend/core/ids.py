@@ -0,0 +1,56 @@
+"""
+Time-ordered UUIDs (UUIDv7, RFC 9562) for primary keys.
+
+uuid4 keys land on a random leaf of the primary-key B-tree on every
+insert, so a large, write-heavy table (tickets_ticketmessage) keeps
+splitting pages all over the index and needs the whole index cached.
+UUIDv7 starts with a 48-bit Unix-millisecond timestamp: new keys go to
+the right edge of the index like a sequence, while staying globally
+unique and unguessable enough for public ids (74 random/counter bits).
+
+Use `uuid7` as the default of every new UUID primary key. On Python 3.14+
+the stdlib implementation is used; otherwise the fallback below, which
+keeps ids monotonic within a process by using the 12-bit rand_a field as a
+counter when several ids share a millisecond (RFC 9562 §6.2, method 1).
+"""
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+_COUNTER_MAX = 0xFFF
+
+
+def _uuid7() -> uuid.UUID:
+    global _last_ms, _counter
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _last_ms:
+            _last_ms = ms
+            # Random start in the lower half leaves room to count upwards
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            _counter += 1
+            if _counter > _COUNTER_MAX:
+                # Counter exhausted (or clock went back): borrow the next ms
+                _last_ms += 1
+                _counter = 0
+        ms, counter = _last_ms, _counter
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | rand_b
+    return uuid.UUID(int=value)
+
+
+_impl = getattr(uuid, "uuid7", _uuid7)
+
+
+def uuid7() -> uuid.UUID:
+    """Return a new time-ordered UUID (version 7)."""
+    # A real module-level function, so migrations reference core.ids.uuid7
+    # whichever implementation is behind it
+    return _impl()
@@ -0,0 +1,40 @@
+"""
+Process-local counters and gauges for ops scraping.
+
+Counters are plain named integers bumped from hot paths (cache hits,
+evictions, ...). Gauges are callables sampled at scrape time, for values
+that already live somewhere else (e.g. the size of a registry).
+
+Values are per worker process; aggregate across workers in the scraper.
+Exposed via GET /api/ops/metrics (see core.api).
+"""
+import threading
+from collections import defaultdict
+from typing import Callable
+
+_lock = threading.Lock()
+_counters: dict[str, int] = defaultdict(int)
+_gauges: dict[str, Callable[[], float]] = {}
+
+
+def incr(name: str, value: int = 1) -> None:
+    """Add `value` to counter `name`."""
+    with _lock:
+        _counters[name] += value
+
+
+def register_gauge(name: str, func: Callable[[], float]) -> None:
+    """Register a callable sampled on every snapshot()."""
+    _gauges[name] = func
+
+
+def snapshot() -> dict[str, float]:
+    """Return all counters and current gauge values."""
+    with _lock:
+        values: dict[str, float] = dict(_counters)
+    for name, func in list(_gauges.items()):
+        try:
+            values[name] = func()
+        except Exception:
+            values[name] = -1
+    return dict(sorted(values.items()))
@@ -1,31 +1,37 @@
 """
-TenantMiddleware — extracts tenant_slug from JWT cookie and sets thread-local DB alias.
+TenantMiddleware — extracts tenant_slug from JWT cookie and sets the tenant DB alias.
 
-Flow per request:
-  1. Clear any leftover thread-local state
+Flow per request (identical for the sync and async call paths):
+  1. Clear any leftover tenant context
   2. Skip public paths (no auth required)
-  3. Read JWT from httpOnly cookie "access_token"
+  3. Verify the JWT from httpOnly cookie "access_token" (once per request,
+     kept as request.auth_context — see core.auth_context)
   4. Extract tenant_slug from JWT payload
-  5. Ensure tenant DB is registered in settings.DATABASES
-  6. Set thread-local DB alias to f"tenant_{slug}"
+  5. Resolve the slug to a registered DB alias (TenantRegistry, cached)
+  6. Lease the alias (core.tenant_connections) so it is not evicted while
+     in use, and set the context's DB alias to f"tenant_{slug}"
   7. Execute the view
-  8. Clean up thread-local state
+  8. Release the lease (streaming responses: when closed) and clean up
+     the tenant context
 """
-import logging
+from functools import partial
+from typing import NamedTuple
 
-from django.conf import settings
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
 from django.http import HttpRequest, JsonResponse
 
+from core import metrics
+from core.auth_context import COOKIE_NAME, authenticate
+from core.tenant_connections import tenant_connections
 from core.thread_local import clear_current_tenant_db, set_current_tenant_db
 
-logger = logging.getLogger(__name__)
-
 # Paths accessible without a valid tenant JWT cookie
 PUBLIC_PATHS = {
     "/api/tenants/",   # signup + delete — each endpoint handles its own auth
     "/api/auth/login",
     "/api/auth/logout",
     "/api/auth/me",    # reads JWT directly, no tenant DB needed
+    "/api/ops/",       # monitoring — requires X-Admin-Key
     "/api/docs",
     "/api/openapi.json",
     "/admin/",
@@ -34,81 +40,178 @@ PUBLIC_PATHS = {
 }
 
 
-def _is_public(path: str) -> bool:
-    return any(path.startswith(p) for p in PUBLIC_PATHS)
+class _Tenant(NamedTuple):
+    slug: str
+    alias: str | None  # leased; None: unknown / inactive (when not needs_load)
+    needs_load: bool   # registry has no fresh entry — resolve() and lease it
+
+
+def _tenant_not_found(tenant_slug: str) -> JsonResponse:
+    return JsonResponse(
+        {"detail": f"Tenant '{tenant_slug}' not found or inactive."},
+        status=404,
+    )
+
+
+def _tenant_busy(tenant_slug: str) -> JsonResponse:
+    response = JsonResponse(
+        {"detail": f"Tenant '{tenant_slug}' is temporarily unavailable, retry shortly."},
+        status=503,
+    )
+    response["Retry-After"] = "1"
+    return response
+
+
+def _registry():
+    # Imported lazily: the registry pulls in the Control Plane models
+    from management.tenants.registry import tenant_registry
 
+    return tenant_registry
 
-def _decode_token(token: str) -> dict | None:
-    """Decode a JWT access token and return its payload, or None on failure."""
-    try:
-        from rest_framework_simplejwt.tokens import AccessToken
 
-        decoded = AccessToken(token)
-        return dict(decoded.payload)
-    except Exception:
+_BUSY = object()
+
+
+def _load_and_lease(tenant_slug: str):
+    """
+    resolve() the slug and lease its alias. Another thread's register()
+    can evict the alias between the two; then resolve() sees it missing
+    and registers it again, so this is tried twice. Returns the leased
+    alias, None for an unknown or inactive tenant, or _BUSY when every
+    other alias is leased and this one keeps losing its place.
+    """
+    for _ in range(2):
+        alias = _registry().resolve(tenant_slug)
+        if alias is None or tenant_connections.acquire(alias):
+            return alias
+        metrics.incr("tenant_db.lease_retries")
+    return _BUSY
+
+
+def _hold_until_closed(response, lease: str | None) -> str | None:
+    """
+    Streaming responses keep using the tenant DB after the middleware
+    returns: hand the alias lease over to response.close(). Returns the
+    lease still to be released by the caller.
+    """
+    if lease is not None and response.streaming:
+        response._resource_closers.append(partial(tenant_connections.release, lease))
         return None
+    return lease
+
+
+def _is_public(path: str) -> bool:
+    return any(path.startswith(p) for p in PUBLIC_PATHS)
 
 
 class TenantMiddleware:
+    """
+    Works in both sync (WSGI) and async (ASGI) stacks, so Django does not
+    have to hop threads around it. The tenant alias is stored in a
+    ContextVar (core.thread_local), which sync_to_async carries into sync
+    views.
+    """
+
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
 
     def __call__(self, request: HttpRequest):
-        clear_current_tenant_db()
+        if self.async_mode:
+            return self.__acall__(request)
 
+        clear_current_tenant_db()
+        lease = None
         try:
-            if not _is_public(request.path):
-                token = request.COOKIES.get("access_token")
-                if not token:
-                    return JsonResponse(
-                        {"detail": "Not authenticated."},
-                        status=401,
-                    )
-
-                payload = _decode_token(token)
-
-                if payload is None:
-                    return JsonResponse(
-                        {"detail": "Invalid or expired token."},
-                        status=401,
-                    )
-
-                tenant_slug = payload.get("tenant_slug")
-                if not tenant_slug:
-                    return JsonResponse(
-                        {"detail": "Token missing tenant_slug claim."},
-                        status=401,
-                    )
-
-                db_alias = f"tenant_{tenant_slug}"
-
-                # Lazily register tenant DB if not already loaded
-                if db_alias not in settings.DATABASES:
-                    self._load_tenant_db(tenant_slug, db_alias)
-                    if db_alias not in settings.DATABASES:
-                        return JsonResponse(
-                            {"detail": f"Tenant '{tenant_slug}' not found or inactive."},
-                            status=404,
-                        )
-
-                set_current_tenant_db(db_alias)
+            tenant = self._resolve_tenant(request)
+            if isinstance(tenant, JsonResponse):
+                return tenant
+            if tenant is not None:
+                alias = tenant.alias
+                if tenant.needs_load:
+                    alias = _load_and_lease(tenant.slug)
+                if alias is _BUSY:
+                    return _tenant_busy(tenant.slug)
+                if alias is None:
+                    return _tenant_not_found(tenant.slug)
+                lease = alias
+                set_current_tenant_db(alias)
 
             response = self.get_response(request)
+            lease = _hold_until_closed(response, lease)
         finally:
+            if lease is not None:
+                tenant_connections.release(lease)
             clear_current_tenant_db()
 
         return response
 
-    @staticmethod
-    def _load_tenant_db(tenant_slug: str, db_alias: str) -> None:
-        """Load a single tenant's DB config from the Control Plane DB."""
+    async def __acall__(self, request: HttpRequest):
+        clear_current_tenant_db()
+        lease = None
         try:
-            from management.tenants.models import Tenant
-            from core.db_router import register_tenant_db
+            tenant = self._resolve_tenant(request)
+            if isinstance(tenant, JsonResponse):
+                return tenant
+            if tenant is not None:
+                alias = tenant.alias
+                if tenant.needs_load:
+                    # Control Plane lookup is ORM work — keep it off the event loop
+                    alias = await sync_to_async(_load_and_lease)(tenant.slug)
+                if alias is _BUSY:
+                    return _tenant_busy(tenant.slug)
+                if alias is None:
+                    return _tenant_not_found(tenant.slug)
+                lease = alias
+                set_current_tenant_db(alias)
+
+            response = await self.get_response(request)
+            lease = _hold_until_closed(response, lease)
+        finally:
+            if lease is not None:
+                tenant_connections.release(lease)
+            clear_current_tenant_db()
 
-            tenant = Tenant.objects.using("default").get(
-                slug=tenant_slug, is_active=True
+        return response
+
+    @staticmethod
+    def _resolve_tenant(request: HttpRequest) -> "_Tenant | JsonResponse | None":
+        """
+        Work out the tenant for `request` without touching any database.
+        Returns None for public paths and a 401 response for bad tokens.
+        """
+        if _is_public(request.path):
+            return None
+
+        if not request.COOKIES.get(COOKIE_NAME):
+            return JsonResponse(
+                {"detail": "Not authenticated."},
+                status=401,
+            )
+
+        # Stored on the request for CookieAuth and views (core.auth_context)
+        context = authenticate(request)
+
+        if context is None:
+            return JsonResponse(
+                {"detail": "Invalid or expired token."},
+                status=401,
+            )
+
+        tenant_slug = context.tenant_slug
+        if not tenant_slug:
+            return JsonResponse(
+                {"detail": "Token missing tenant_slug claim."},
+                status=401,
             )
-            register_tenant_db(tenant)
-        except Exception as exc:
-            logger.warning("Could not load tenant DB for '%s': %s", tenant_slug, exc)
+
+        # Registered alias from the TenantRegistry, leased; cold slugs are loaded by the caller
+        fresh, alias = _registry().get_cached(tenant_slug)
+        if fresh and alias is not None and not tenant_connections.acquire(alias):
+            fresh = False   # evicted since it was cached
+        return _Tenant(tenant_slug, alias, needs_load=not fresh)
@@ -0,0 +1,70 @@
+"""
+Fast JSON rendering for the Ninja API (opt-in via FAST_JSON).
+
+ORJSONRenderer  — drop-in replacement for Ninja's stdlib JSONRenderer.
+trusted_response — renders data that our own serializers built straight
+                   from the ORM, skipping the response-schema validation
+                   pass. Callers are responsible for producing exactly the
+                   documented (camelCase) shape.
+
+orjson is an optional dependency (`uv sync --extra fast`); it is only
+imported when FAST_JSON is enabled.
+"""
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+from ninja.renderers import BaseRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the install
+    orjson = None
+
+_django_encoder = DjangoJSONEncoder()
+
+
+def _default(obj):
+    # orjson handles UUID/dataclasses natively; everything else goes through
+    # Django's encoder: Decimal, lazy translation strings, and datetimes,
+    # which it truncates to milliseconds (orjson would keep microseconds
+    # and change the wire format of every timestamp).
+    return _django_encoder.default(obj)
+
+
+def dumps(data) -> bytes:
+    return orjson.dumps(
+        data,
+        default=_default,
+        option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+    )
+
+
+class ORJSONRenderer(BaseRenderer):
+    media_type = "application/json"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImproperlyConfigured(
+                "FAST_JSON is enabled but orjson is not installed "
+                "(uv sync --extra fast)."
+            )
+
+    def render(self, request, data, *, response_status):
+        return dumps(data)
+
+
+def trusted_response(data, response: HttpResponse | None = None, status: int = 200) -> HttpResponse:
+    """
+    Render `data` without schema validation.
+
+    `response` is Ninja's temporal response for the view; its headers
+    (ETag, Cache-Control, cookies...) are carried over, because Ninja
+    returns a view's own HttpResponse untouched.
+    """
+    result = HttpResponse(dumps(data), content_type="application/json", status=status)
+    if response is not None:
+        for header, value in response.items():
+            if header.lower() != "content-type":
+                result[header] = value
+        result.cookies.update(response.cookies)
+    return result
@@ -0,0 +1,320 @@
+"""
+TenantConnections — bounded registry of the tenant DB aliases known to
+django.db.connections, and of their connection pools.
+
+Tenant aliases are added to settings.DATABASES at runtime (the dict
+django.db.connections reads its configuration from). Left alone, a
+long-lived worker serving thousands of tenants keeps every config it ever
+registered, and every thread keeps a DatabaseWrapper for each alias it
+ever touched. This registry:
+
+  - serialises inserts and removals behind one lock, and replaces the
+    DATABASES dict copy-on-write, so a concurrent connections.all()
+    (close_old_connections runs it around every request) never iterates
+    a dict that is changing size;
+  - keeps aliases in LRU order, capped at TENANT_DB_MAX_ALIASES;
+  - keeps the connections of their pools within TENANT_DB_POOL_BUDGET,
+    the connections this process may hold open: each alias counts its
+    pool's min_size (1 when unpooled) as soon as it is registered, or the
+    pool's live size once it has grown past that. Growth happens inside
+    psycopg_pool, so it is charged at the next register() or sweep(),
+    which close the least recently used idle pools to get back under;
+  - evicts aliases unused for TENANT_DB_IDLE_TIMEOUT seconds;
+  - never evicts an alias with an open lease (TenantMiddleware holds one
+    for each request it routes, until the response is closed).
+
+Pools are Django's own psycopg_pool integration (OPTIONS["pool"], see
+Tenant.get_db_config), opened lazily on an alias's first query. Evicting,
+unregistering or re-registering an alias with a different config closes
+its pool. Schema tenants share one pool (core.backends.tenant_schema),
+which outlives their aliases and reserves nothing from the budget.
+
+Django connections are per thread, so only the thread that opened one can
+close it: the evicting thread closes its own at once, every other thread
+closes its copy at its next request_finished. An evicted tenant is simply
+loaded again by the TenantRegistry the next time it is needed.
+
+Management commands and scripts register through core.db_router as before
+and are subject to the same limits (the alias they are working on is
+always the most recently used one).
+"""
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from django.conf import settings
+from django.core.signals import request_finished
+from django.db import connections
+from django.dispatch import receiver
+
+from core import metrics
+
+# Cumulative psycopg_pool counters (get_stats()), carried over from closed pools
+POOL_COUNTERS = ("requests_num", "requests_queued", "requests_wait_ms", "requests_errors", "connections_lost")
+
+
+def _pools() -> dict:
+    """Django's process-wide alias → psycopg_pool.ConnectionPool map."""
+    from django.db.backends.postgresql.base import DatabaseWrapper
+
+    return DatabaseWrapper._connection_pools
+
+
+def _reservation(config: dict) -> int:
+    """Connections an alias holds open in this process once in use (before its pool grows)."""
+    if config.get("SHARED_POOL"):
+        return 0   # schema tenants: bounded by the shared pool (TENANT_SHARED_DB_POOL_MAX_SIZE)
+    pool = config.get("OPTIONS", {}).get("pool")
+    if isinstance(pool, dict):
+        return max(pool.get("min_size", 4), 1)   # psycopg_pool's default min_size is 4
+    return 1
+
+
+def _close_local(alias: str) -> None:
+    """Close and forget this thread's connection to `alias`, if it opened one."""
+    conn = getattr(connections._connections, alias, None)
+    if conn is None:
+        return
+    try:
+        conn.close()
+    finally:
+        del connections[alias]
+    metrics.incr("tenant_db.connections_closed")
+
+
+class TenantConnections:
+    def __init__(self, max_aliases: int, connection_budget: int, idle_timeout: float):
+        self.max_aliases = max_aliases              # 0: unbounded
+        self.connection_budget = connection_budget  # 0: unbounded
+        self.idle_timeout = idle_timeout            # 0: never evict for idleness
+        self._last_used: OrderedDict[str, float] = OrderedDict()
+        self._reserved: dict[str, int] = {}
+        self._leases: dict[str, int] = {}
+        # Recently evicted or reconfigured aliases (→ generation) whose
+        # per-thread connections may still be open; each thread remembers
+        # how far it got
+        self._retired: OrderedDict[str, int] = OrderedDict()
+        self._generation = 0
+        self._seen = threading.local()
+        self._closed_pool_totals: Counter[str] = Counter()
+        self._next_sweep = 0.0
+        self._lock = threading.Lock()
+
+    def register(self, alias: str, config: dict, replace: bool = False) -> None:
+        """Make `alias` routable with `config` (kept if already registered, unless `replace`)."""
+        stale = []
+        with self._lock:
+            current = settings.DATABASES.get(alias)
+            if current is None or (replace and current != config):
+                databases = dict(settings.DATABASES)
+                databases[alias] = config
+                self._publish(databases)
+                self._reserved[alias] = _reservation(config)
+                if current is not None:
+                    # New credentials or pool sizes: connections made with the old ones go
+                    self._retire([alias])
+                    stale.append(alias)
+            self._touch(alias)
+            evicted = self._evict(time.monotonic(), capacity_only=True)
+        self._close(stale + evicted)
+
+    def unregister(self, alias: str) -> None:
+        """Forget `alias` now, leased or not (tenant deleted or deactivated)."""
+        with self._lock:
+            self._forget([alias])
+        self._close([alias])
+
+    def acquire(self, alias: str) -> bool:
+        """
+        Take a lease on `alias` so it is not evicted while in use. False if
+        the alias is not (or no longer) registered; nothing to release then.
+        """
+        with self._lock:
+            if alias not in settings.DATABASES:
+                return False
+            self._leases[alias] = self._leases.get(alias, 0) + 1
+            self._touch(alias)
+            return True
+
+    def release(self, alias: str) -> None:
+        with self._lock:
+            count = self._leases.get(alias, 0) - 1
+            if count > 0:
+                self._leases[alias] = count
+            else:
+                self._leases.pop(alias, None)
+            if alias in self._last_used:
+                self._touch(alias)
+
+    def sweep(self, force: bool = False) -> list[str]:
+        """Evict idle aliases (at most every few seconds unless `force`); returns them."""
+        now = time.monotonic()
+        with self._lock:
+            if not force and now < self._next_sweep:
+                return []
+            self._next_sweep = now + min(max(self.idle_timeout / 4, 1), 60)
+            evicted = self._evict(now, capacity_only=False)
+        self._close(evicted)
+        return evicted
+
+    def close_retired(self) -> None:
+        """Close this thread's connections to aliases evicted by other threads."""
+        seen = getattr(self._seen, "generation", 0)
+        with self._lock:
+            if self._generation == seen:
+                return
+            retired = []
+            for alias, generation in reversed(self._retired.items()):
+                if generation <= seen:
+                    break
+                retired.append(alias)
+            self._seen.generation = self._generation
+        for alias in retired:
+            _close_local(alias)
+
+    def pool_stats(self) -> dict[str, dict[str, int]]:
+        """psycopg_pool statistics for each open tenant pool, and the shared schema pool."""
+        return {
+            alias: pool.get_stats()
+            for alias, pool in list(_pools().items())
+            if alias.startswith(("tenant_", "shared_")) and not pool.closed
+        }
+
+    def pool_totals(self) -> dict[str, int]:
+        """Pool statistics summed over all tenants; counters include closed pools."""
+        with self._lock:
+            totals = Counter(self._closed_pool_totals)
+        for stats in self.pool_stats().values():
+            totals["connections"] += stats.get("pool_size", 0)
+            totals["in_use"] += stats.get("pool_size", 0) - stats.get("pool_available", 0)
+            totals["waiting"] += stats.get("requests_waiting", 0)
+            for key in POOL_COUNTERS:
+                totals[key] += stats.get(key, 0)
+        return dict(totals)
+
+    def reserved(self) -> int:
+        """Connections charged to the budget by all registered aliases (see TENANT_DB_POOL_BUDGET)."""
+        with self._lock:
+            return sum(self._usage().values())
+
+    def capacity(self, configs) -> int:
+        """
+        How many of `configs` (in order) fit together in an empty registry:
+        within the alias cap and the connection budget at their reservations.
+        """
+        fitted = reserved = 0
+        for config in configs:
+            if self.max_aliases and fitted >= self.max_aliases:
+                break
+            reserved += _reservation(config)
+            if self.connection_budget and reserved > self.connection_budget:
+                break
+            fitted += 1
+        return fitted
+
+    def __len__(self) -> int:
+        return len(self._last_used)
+
+    def _close(self, aliases: list[str]) -> None:
+        """Close this thread's connection and the pool of each alias (lock not held)."""
+        for alias in aliases:
+            _close_local(alias)
+            pool = _pools().pop(alias, None)
+            if pool is None:
+                continue
+            stats = pool.get_stats()
+            with self._lock:
+                for key in POOL_COUNTERS:
+                    self._closed_pool_totals[key] += stats.get(key, 0)
+            # Idle connections close now; ones still checked out by other
+            # threads close when they are handed back
+            pool.close(timeout=0)
+            metrics.incr("tenant_db.pools_closed")
+
+    # Internals below run with the lock held
+
+    def _touch(self, alias: str) -> None:
+        self._last_used[alias] = time.monotonic()
+        self._last_used.move_to_end(alias)
+
+    def _usage(self) -> dict[str, int]:
+        """Connections each alias counts against the budget: its reservation or its pool's live size."""
+        usage = dict(self._reserved)
+        pools = _pools()
+        for alias in usage:
+            pool = pools.get(alias)
+            if pool is not None and not pool.closed:
+                usage[alias] = max(usage[alias], pool.get_stats().get("pool_size", 0))
+        return usage
+
+    def _over_capacity(self, connections_used: int) -> bool:
+        if self.max_aliases and len(self._last_used) > self.max_aliases:
+            return True
+        return bool(self.connection_budget) and connections_used > self.connection_budget
+
+    def _evict(self, now: float, capacity_only: bool) -> list[str]:
+        evicted = []
+        idle_before = now - self.idle_timeout
+        usage = self._usage()
+        connections_used = sum(usage.values())
+        # Oldest first; stop at the first alias that is neither over capacity nor idle
+        for alias, last_used in list(self._last_used.items()):
+            over = self._over_capacity(connections_used)
+            idle = not capacity_only and self.idle_timeout and last_used <= idle_before
+            if not over and not idle:
+                break
+            if alias in self._leases:
+                continue
+            evicted.append(alias)
+            connections_used -= usage.get(alias, 0)
+            self._last_used.pop(alias)
+            self._reserved.pop(alias, None)
+            metrics.incr("tenant_db.evictions.capacity" if over else "tenant_db.evictions.idle")
+        self._forget(evicted)
+        return evicted
+
+    def _forget(self, aliases: list[str]) -> None:
+        if not aliases:
+            return
+        databases = dict(settings.DATABASES)
+        for alias in aliases:
+            databases.pop(alias, None)
+            self._last_used.pop(alias, None)
+            self._reserved.pop(alias, None)
+        self._publish(databases)
+        self._retire(aliases)
+
+    def _retire(self, aliases: list[str]) -> None:
+        self._generation += 1
+        for alias in aliases:
+            self._retired[alias] = self._generation
+            self._retired.move_to_end(alias)
+        while len(self._retired) > max(self.max_aliases, 100):
+            self._retired.popitem(last=False)
+
+    @staticmethod
+    def _publish(databases: dict) -> None:
+        # connections.settings is a cached reference to settings.DATABASES; swap both
+        settings.DATABASES = databases
+        connections.settings = databases
+
+
+tenant_connections = TenantConnections(
+    max_aliases=settings.TENANT_DB_MAX_ALIASES,
+    connection_budget=settings.TENANT_DB_POOL_BUDGET,
+    idle_timeout=settings.TENANT_DB_IDLE_TIMEOUT,
+)
+metrics.register_gauge("tenant_db.aliases", lambda: len(tenant_connections))
+metrics.register_gauge("tenant_db.leased", lambda: len(tenant_connections._leases))
+metrics.register_gauge("tenant_db.reserved_connections", tenant_connections.reserved)
+for _key in ("connections", "in_use", "waiting", *POOL_COUNTERS):
+    metrics.register_gauge(
+        f"tenant_db.pool.{_key}",
+        lambda key=_key: tenant_connections.pool_totals().get(key, 0),
+    )
+
+
+@receiver(request_finished)
+def close_retired_connections(sender, **kwargs):
+    tenant_connections.close_retired()
+    tenant_connections.sweep()
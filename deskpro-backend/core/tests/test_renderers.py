@@ -0,0 +1,52 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+from ninja.responses import NinjaJSONEncoder
+
+from apps.tickets.api import _serialize_ticket
+from apps.tickets.models import Ticket, TicketMessage
+from apps.tickets.schemas import TicketOut, camelize
+from core.thread_local import tenant_db
+
+pytest.importorskip("orjson")
+
+from core.renderers import dumps  # noqa: E402
+
+
+def _ticket() -> Ticket:
+    # Sub-millisecond parts, which the validated path drops
+    created = datetime(2026, 3, 1, 9, 30, 45, 164533, tzinfo=timezone.utc)
+    ticket = Ticket(
+        id=1,
+        subject="Cannot log in",
+        customer_name="Erika Mustermann",
+        customer_email="erika@example.com",
+        status="open",
+        priority="high",
+        channel="email",
+        assignee="agent@example.com",
+        tags=["login"],
+        created_at=created,
+        updated_at=created.replace(microsecond=999999),
+    )
+    # Assigning message.ticket asks the router for an alias; nothing is queried
+    with tenant_db("tenant_test"):
+        message = TicketMessage(ticket=ticket, sender="customer", body="Hello", timestamp=created)
+    prefetched = TicketMessage.objects.all()
+    prefetched._result_cache = [message]
+    prefetched._prefetch_done = True
+    ticket._prefetched_objects_cache = {"messages": prefetched}
+    return ticket
+
+
+def test_trusted_output_matches_validated_output():
+    data = _serialize_ticket(_ticket())
+
+    validated = json.dumps(
+        TicketOut.model_validate(data).model_dump(by_alias=True), cls=NinjaJSONEncoder
+    )
+    trusted = dumps(camelize(data))
+
+    assert json.loads(trusted) == json.loads(validated)
+    assert json.loads(trusted)["createdAt"] == "2026-03-01T09:30:45.164Z"
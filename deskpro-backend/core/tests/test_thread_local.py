@@ -0,0 +1,88 @@
+"""
+TenantMiddleware never leaks one request's tenant into another.
+
+No database is touched: fake tenants are seeded into the TenantRegistry so
+the middleware never has to look them up. Each request carries a JWT for a
+random tenant, and the downstream "view" checks the routed alias at several
+points while hundreds of requests interleave: before and after awaits,
+and inside sync_to_async (where Django runs sync views under ASGI).
+"""
+import asyncio
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.test import AsyncRequestFactory, RequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.middleware import TenantMiddleware
+from core.thread_local import get_current_tenant_db
+from management.tenants.models import Tenant
+from management.tenants.registry import tenant_registry
+
+TENANTS = 20
+REQUESTS = 500
+
+
+@pytest.fixture(scope="module")
+def tokens() -> dict[str, str]:
+    tokens = {}
+    for i in range(TENANTS):
+        slug = f"isolation{i}"
+        tenant_registry.remember(Tenant(name=slug, slug=slug, is_active=True))
+        token = AccessToken()
+        token["tenant_slug"] = slug
+        tokens[slug] = str(token)
+    return tokens
+
+
+def test_interleaved_async_requests_keep_their_tenant(tokens):
+    async def view(request):
+        expected = request.expected_alias
+        assert get_current_tenant_db() == expected
+        await asyncio.sleep(random.random() / 1000)
+        assert get_current_tenant_db() == expected
+        assert await sync_to_async(get_current_tenant_db)() == expected
+        await asyncio.sleep(0)
+        assert get_current_tenant_db() == expected
+        return HttpResponse()
+
+    middleware = TenantMiddleware(view)
+    factory = AsyncRequestFactory()
+
+    async def one_request():
+        slug = random.choice(list(tokens))
+        request = factory.get("/api/tickets/")
+        request.COOKIES["access_token"] = tokens[slug]
+        request.expected_alias = f"tenant_{slug}"
+        response = await middleware(request)
+        assert response.status_code == 200, response.content
+        assert get_current_tenant_db() is None
+
+    async def run():
+        await asyncio.gather(*(one_request() for _ in range(REQUESTS)))
+
+    asyncio.run(run())
+
+
+def test_threaded_requests_keep_their_tenant(tokens):
+    def view(request):
+        assert get_current_tenant_db() == request.expected_alias
+        return HttpResponse()
+
+    middleware = TenantMiddleware(view)
+    factory = RequestFactory()
+
+    def one_request(_):
+        slug = random.choice(list(tokens))
+        request = factory.get("/api/tickets/")
+        request.COOKIES["access_token"] = tokens[slug]
+        request.expected_alias = f"tenant_{slug}"
+        response = middleware(request)
+        assert response.status_code == 200, response.content
+        assert get_current_tenant_db() is None
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(one_request, range(REQUESTS)))
@@ -1,26 +1,45 @@
 """
-Thread-local storage for the current tenant's database alias.
+Request-scoped storage for the current tenant's database alias.
 
 Each request sets a tenant DB alias at the start and clears it after
 (handled by TenantMiddleware). This ensures ORM queries are routed to
 the correct Neon database for the authenticated tenant.
+
+The alias lives in a ContextVar rather than threading.local: under WSGI
+each worker thread has its own context, so behaviour is unchanged; under
+ASGI every request task gets its own context, and asgiref's sync_to_async
+copies it into whichever executor thread runs the sync view. Concurrent
+async requests on one thread therefore never see each other's tenant.
+
+The module keeps its historical name and function API for its callers.
 """
-import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
 
-_thread_locals = threading.local()
+_tenant_db: ContextVar[str | None] = ContextVar("tenant_db", default=None)
 
 
 def set_current_tenant_db(alias: str) -> None:
-    """Set the DB alias for the current thread."""
-    _thread_locals.tenant_db = alias
+    """Set the DB alias for the current context."""
+    _tenant_db.set(alias)
 
 
 def get_current_tenant_db() -> str | None:
-    """Return the DB alias for the current thread, or None if not set."""
-    return getattr(_thread_locals, "tenant_db", None)
+    """Return the DB alias for the current context, or None if not set."""
+    return _tenant_db.get()
 
 
 def clear_current_tenant_db() -> None:
-    """Clear the tenant DB alias from the current thread."""
-    if hasattr(_thread_locals, "tenant_db"):
-        del _thread_locals.tenant_db
+    """Clear the tenant DB alias from the current context."""
+    _tenant_db.set(None)
+
+
+@contextmanager
+def tenant_db(alias: str) -> Iterator[str]:
+    """Route queries to `alias` inside the block, restoring the previous alias after."""
+    token = _tenant_db.set(alias)
+    try:
+        yield alias
+    finally:
+        _tenant_db.reset(token)
@@ -5,16 +5,15 @@ POST /api/auth/login   — authenticate and set httpOnly JWT cookies
 POST /api/auth/logout  — clear JWT cookies
 """
 import json
-import logging
 
 from django.http import HttpResponse
 from ninja import Router
 from ninja.errors import HttpError
 
+from core.auth_context import COOKIE_NAME, authenticate
 from management.authentication.tenantusers.schemas import LoginIn
 from management.authentication.tenantusers.tokens import TenantRefreshToken
-
-logger = logging.getLogger(__name__)
+from management.tenants.registry import tenant_registry
 
 router = Router(tags=["Auth"])
 
@@ -28,14 +27,8 @@ def login(request, payload: LoginIn):
     Authenticate a TenantUser and return user info.
     Access and refresh JWTs are stored in httpOnly cookies (not in the response body).
     """
-    from django.conf import settings
-
-    db_alias = f"tenant_{payload.tenant_slug}"
-
-    if db_alias not in settings.DATABASES:
-        _try_load_tenant_db(payload.tenant_slug, db_alias)
-
-    if db_alias not in settings.DATABASES:
+    db_alias = tenant_registry.resolve(payload.tenant_slug)
+    if db_alias is None:
         raise HttpError(404, f"Tenant '{payload.tenant_slug}' not found.")
 
     from management.authentication.tenantusers.models import TenantUser
@@ -67,16 +60,12 @@ def login(request, payload: LoginIn):
 @router.get("/me")
 def me(request):
     """Return the current user's info from the JWT cookie."""
-    token = request.COOKIES.get("access_token")
-    if not token:
-        from ninja.errors import HttpError
+    if not request.COOKIES.get(COOKIE_NAME):
         raise HttpError(401, "Not authenticated.")
-    try:
-        from rest_framework_simplejwt.tokens import AccessToken
-        payload = dict(AccessToken(token).payload)
-    except Exception:
-        from ninja.errors import HttpError
+    context = authenticate(request)
+    if context is None:
         raise HttpError(401, "Invalid or expired token.")
+    payload = context.payload
     return {"email": payload.get("email", ""), "full_name": payload.get("full_name", "")}
 
 
@@ -92,15 +81,3 @@ def logout(request):
     response.delete_cookie("refresh_token", path="/")
     return response
 
-
-def _try_load_tenant_db(tenant_slug: str, db_alias: str) -> None:
-    try:
-        from management.tenants.models import Tenant
-        from core.db_router import register_tenant_db
-
-        tenant = Tenant.objects.using("default").get(
-            slug=tenant_slug, is_active=True
-        )
-        register_tenant_db(tenant)
-    except Exception as exc:
-        logger.warning("Could not load tenant DB '%s': %s", tenant_slug, exc)
@@ -5,7 +5,7 @@ from django.conf import settings
 from django.contrib import admin, messages
 
 from management.tenants.models import Tenant, TenantMember
-from core.neon_client import NeonClient
+from management.tenants.schemas import SLUG_RE
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +18,7 @@ class TenantCreationForm(forms.ModelForm):
     """
     Extends the standard Tenant form with admin credentials so that saving
     from the admin panel triggers the full provisioning flow:
-    Neon DB → migrations → Agent → TenantMember → activate.
+    Neon DB or shared-DB schema → migrations → Agent → TenantMember → activate.
     """
     admin_full_name = forms.CharField(
         max_length=255,
@@ -35,7 +35,20 @@ class TenantCreationForm(forms.ModelForm):
 
     class Meta:
         model = Tenant
-        fields = ("name", "slug", "admin_email")
+        fields = ("name", "slug", "admin_email", "storage")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["storage"].initial = settings.TENANT_STORAGE_DEFAULT
+
+    def clean_slug(self):
+        slug = self.cleaned_data["slug"]
+        if not SLUG_RE.match(slug):
+            raise forms.ValidationError(
+                "Slug must be 3-50 characters and contain only lowercase "
+                "letters, digits, and hyphens."
+            )
+        return slug
 
 
 # ---------------------------------------------------------------------------
@@ -65,10 +78,10 @@ class TenantAdmin(admin.ModelAdmin):
     search_fields = ("name", "slug", "admin_email")
 
     # neon_db_password is intentionally excluded — encrypted at rest, never shown.
-    readonly_fields = ("id", "admin_email", "created_at", "neon_database_name",
+    readonly_fields = ("id", "admin_email", "created_at", "storage", "neon_database_name",
                        "neon_db_host", "neon_db_user", "neon_db_port")
     fields = (
-        "id", "name", "slug", "admin_email", "is_active", "created_at",
+        "id", "name", "slug", "admin_email", "is_active", "created_at", "storage",
         "neon_database_name", "neon_db_host", "neon_db_user", "neon_db_port",
     )
 
@@ -86,7 +99,7 @@ class TenantAdmin(admin.ModelAdmin):
 
     def get_fields(self, request, obj=None):
         if obj is None:
-            return ("name", "slug", "admin_email", "admin_full_name", "admin_password")
+            return ("name", "slug", "admin_email", "storage", "admin_full_name", "admin_password")
         return super().get_fields(request, obj)
 
     def get_readonly_fields(self, request, obj=None):
@@ -157,15 +170,7 @@ class TenantMemberAdmin(admin.ModelAdmin):
 # ---------------------------------------------------------------------------
 
 def _cleanup_tenant(tenant: Tenant) -> None:
-    """Delete Neon DB and unregister from settings.DATABASES."""
-    if tenant.neon_database_name:
-        try:
-            NeonClient().delete_database(tenant.neon_database_name)
-            logger.info("Deleted Neon DB '%s'", tenant.neon_database_name)
-        except Exception as exc:
-            logger.warning("Could not delete Neon DB for '%s': %s", tenant.slug, exc)
-
-    db_alias = tenant.get_db_alias()
-    if db_alias in settings.DATABASES:
-        del settings.DATABASES[db_alias]
-        logger.info("Unregistered DB alias '%s'", db_alias)
+    """Delete Neon DB (or shared-DB schema) and unregister from settings.DATABASES."""
+    from management.tenants.provisioning import drop_tenant_storage
+
+    drop_tenant_storage(tenant)
@@ -3,18 +3,28 @@ Tenant API.
 
 POST   /api/tenants/signup        — provision a new tenant (public)
 DELETE /api/tenants/{slug}        — delete a tenant (requires X-Admin-Key)
+POST   /api/tenants/{slug}/import — bulk-import tickets via COPY (requires X-Admin-Key)
 """
+import io
 import logging
+from typing import Literal
 
 from django.conf import settings
-from ninja import Router
+from ninja import File, Router
 from ninja.errors import HttpError
+from ninja.files import UploadedFile
 
 from management.tenants.auth import AdminKeyAuth
 from management.tenants.models import Tenant
-from management.tenants.provisioning import provision_tenant
-from management.tenants.schemas import TenantSignupIn, TenantSignupOut, TenantDeleteOut
-from core.neon_client import NeonClient
+from management.tenants.provisioning import drop_tenant_storage, provision_tenant
+from management.tenants.schemas import (
+    TenantDeleteOut,
+    TenantImportOut,
+    TenantSignupIn,
+    TenantSignupOut,
+)
+from core.db_router import register_tenant_db
+from core.tenant_connections import tenant_connections
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +48,7 @@ def signup(request, payload: TenantSignupIn):
             name=payload.name,
             slug=payload.slug,
             admin_email=payload.admin_email,
+            storage=settings.TENANT_STORAGE_DEFAULT,
             is_active=False,
         )
         provision_tenant(
@@ -67,7 +78,7 @@ def delete_tenant(request, slug: str):
     """
     Delete a tenant:
       1. Look up the tenant record
-      2. Delete the Neon database
+      2. Delete the Neon database (or drop the tenant's shared-DB schema)
       3. Remove from settings.DATABASES
       4. Delete the control-plane Tenant record
     """
@@ -76,19 +87,61 @@ def delete_tenant(request, slug: str):
     except Tenant.DoesNotExist:
         raise HttpError(404, f"Tenant '{slug}' not found.")
 
-    db_alias = tenant.get_db_alias()
-
-    try:
-        NeonClient().delete_database(tenant.neon_database_name)
-        logger.info("Deleted Neon DB for tenant '%s'", slug)
-    except Exception as exc:
-        logger.warning("Could not delete Neon DB for '%s': %s", slug, exc)
-
-    if db_alias in settings.DATABASES:
-        del settings.DATABASES[db_alias]
-        logger.info("Unregistered DB alias '%s'", db_alias)
+    drop_tenant_storage(tenant)
 
     tenant.delete(using="default")
     logger.info("Tenant '%s' deleted from control plane.", slug)
 
     return TenantDeleteOut(slug=slug, message=f"Tenant '{slug}' deleted successfully.")
+
+
+@router.post("/{slug}/import", response=TenantImportOut, auth=AdminKeyAuth())
+def import_tickets(
+    request,
+    slug: str,
+    file: UploadedFile = File(...),
+    format: Literal["ndjson", "csv"] = "ndjson",
+    dry_run: bool = False,
+    preserve_timestamps: bool = True,
+):
+    """
+    Bulk-import tickets into a tenant DB from an NDJSON/CSV upload.
+
+    Use dry_run=true first: it validates every record and lists errors
+    without writing. A real run stops at the first invalid record; batches
+    before it stay committed. For very large or resumable imports use the
+    import_tickets management command instead.
+    """
+    from apps.tickets.importer import READERS, RecordError, TicketImporter
+
+    try:
+        tenant = Tenant.objects.using("default").get(slug=slug, is_active=True)
+    except Tenant.DoesNotExist:
+        raise HttpError(404, f"Tenant '{slug}' not found.")
+    register_tenant_db(tenant)
+    db_alias = tenant.get_db_alias()
+
+    importer = TicketImporter(db_alias=db_alias, preserve_timestamps=preserve_timestamps)
+    stream = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    # Lease the alias so other traffic cannot evict it (and close its pool) mid-import
+    if not tenant_connections.acquire(db_alias):
+        raise HttpError(503, "Tenant database is busy, retry the import.")
+    try:
+        result = importer.run(READERS[format](stream), dry_run=dry_run)
+    except RecordError as exc:
+        raise HttpError(422, f"Import stopped at invalid {exc}.")
+    finally:
+        tenant_connections.release(db_alias)
+
+    logger.info(
+        "Ticket import for '%s': %d ticket(s), %d message(s), dry_run=%s",
+        slug, result.tickets, result.messages, dry_run,
+    )
+    return TenantImportOut(
+        tickets=result.tickets,
+        messages=result.messages,
+        batches=result.batches,
+        invalid=result.invalid,
+        errors=result.errors,
+        dry_run=result.dry_run,
+    )
@@ -6,3 +6,5 @@ class TenantsConfig(AppConfig):
     name = "management.tenants"
     label = "tenants"
 
+    def ready(self):
+        from management.tenants import registry  # noqa: F401 — connects signal handlers
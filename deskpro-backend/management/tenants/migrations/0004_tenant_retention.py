@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0003_tenantmember_and_encrypt_password'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tenant',
+            name='archive_after_days',
+            field=models.PositiveIntegerField(blank=True, help_text='Move resolved/closed tickets untouched this long to the archive', null=True),
+        ),
+        migrations.AddField(
+            model_name='tenant',
+            name='purge_after_days',
+            field=models.PositiveIntegerField(blank=True, help_text='Hard-delete archived tickets untouched this long', null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+import core.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0004_tenant_retention'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tenant',
+            name='id',
+            field=models.UUIDField(default=core.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
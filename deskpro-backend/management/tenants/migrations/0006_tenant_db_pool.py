@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0005_tenant_uuid7'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tenant',
+            name='db_pool_min_size',
+            field=models.PositiveSmallIntegerField(blank=True, help_text="Connections each worker keeps open to this tenant's DB", null=True),
+        ),
+        migrations.AddField(
+            model_name='tenant',
+            name='db_pool_max_size',
+            field=models.PositiveSmallIntegerField(blank=True, help_text="Most connections each worker opens to this tenant's DB", null=True),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0006_tenant_db_pool'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tenant',
+            name='storage',
+            field=models.CharField(choices=[('database', 'Dedicated Neon database'), ('schema', 'Schema in the shared tenant database')], default='database', max_length=10),
+        ),
+    ]
@@ -5,10 +5,11 @@ Tenant        — one row per provisioned tenant; holds Neon DB credentials.
 TenantMember  — mirror of every Agent across all tenants so SaaS admins
                  can see who belongs where without querying tenant DBs.
 """
-import uuid
-
+from django.conf import settings
 from django.db import models
 
+from core.ids import uuid7
+
 
 class EncryptedCharField(models.CharField):
     """
@@ -36,11 +37,21 @@ class EncryptedCharField(models.CharField):
 
 
 class Tenant(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    STORAGE_DATABASE = "database"
+    STORAGE_SCHEMA = "schema"
+    STORAGE_CHOICES = [
+        (STORAGE_DATABASE, "Dedicated Neon database"),
+        (STORAGE_SCHEMA, "Schema in the shared tenant database"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=255)
     slug = models.SlugField(max_length=50, unique=True)
 
-    # Neon DB credentials — password is encrypted at rest via EncryptedCharField
+    # Where the tenant-scoped apps live; fixed at provisioning
+    storage = models.CharField(max_length=10, choices=STORAGE_CHOICES, default=STORAGE_DATABASE)
+
+    # Neon DB credentials (database storage only) — password is encrypted at rest via EncryptedCharField
     neon_database_name = models.CharField(max_length=255, blank=True)
     neon_db_host = models.CharField(max_length=255, blank=True)
     neon_db_user = models.CharField(max_length=255, blank=True)
@@ -49,6 +60,26 @@ class Tenant(models.Model):
 
     admin_email = models.EmailField(blank=True, help_text="Email of the tenant registrant")
     is_active = models.BooleanField(default=False)
+
+    # Ticket retention (apps.tickets.archive); null = settings default
+    archive_after_days = models.PositiveIntegerField(
+        null=True, blank=True,
+        help_text="Move resolved/closed tickets untouched this long to the archive",
+    )
+    purge_after_days = models.PositiveIntegerField(
+        null=True, blank=True,
+        help_text="Hard-delete archived tickets untouched this long",
+    )
+
+    # Tenant DB connection pool per worker (core.tenant_connections); null = settings default
+    db_pool_min_size = models.PositiveSmallIntegerField(
+        null=True, blank=True,
+        help_text="Connections each worker keeps open to this tenant's DB",
+    )
+    db_pool_max_size = models.PositiveSmallIntegerField(
+        null=True, blank=True,
+        help_text="Most connections each worker opens to this tenant's DB",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -60,7 +91,69 @@ class Tenant(models.Model):
     def get_db_alias(self) -> str:
         return f"tenant_{self.slug}"
 
+    def get_db_schema(self) -> str | None:
+        """Postgres schema holding this tenant's tables in the shared DB; None for database storage."""
+        if self.storage != self.STORAGE_SCHEMA:
+            return None
+        return f"tenant_{self.slug}"
+
+    def get_db_pool_options(self) -> dict | None:
+        """psycopg_pool.ConnectionPool arguments for this tenant, or None when pooling is off."""
+        if not settings.TENANT_DB_POOL:
+            return None
+        if self.storage == self.STORAGE_SCHEMA:
+            # One pool per process shared by every schema tenant (core.backends.tenant_schema)
+            shared = settings.TENANT_SHARED_DB
+            return {
+                "name": f"shared_{shared['NAME']}",
+                "min_size": shared["POOL_MIN_SIZE"],
+                "max_size": max(shared["POOL_MAX_SIZE"], shared["POOL_MIN_SIZE"], 1),
+                "timeout": settings.TENANT_DB_POOL_TIMEOUT,
+                "max_idle": settings.TENANT_DB_POOL_MAX_IDLE,
+            }
+        min_size = self.db_pool_min_size
+        if min_size is None:
+            min_size = settings.TENANT_DB_POOL_MIN_SIZE
+        max_size = self.db_pool_max_size
+        if max_size is None:
+            max_size = settings.TENANT_DB_POOL_MAX_SIZE
+        return {
+            "name": self.get_db_alias(),
+            "min_size": min_size,
+            "max_size": max(max_size, min_size, 1),
+            "timeout": settings.TENANT_DB_POOL_TIMEOUT,
+            "max_idle": settings.TENANT_DB_POOL_MAX_IDLE,
+        }
+
     def get_db_config(self) -> dict:
+        options = {"sslmode": "require"}
+        pool = self.get_db_pool_options()
+        if pool is not None:
+            # Django's built-in psycopg pool; connections go back to it
+            # instead of being closed at the end of each request
+            options["pool"] = pool
+
+        schema = self.get_db_schema()
+        if schema is not None:
+            shared = settings.TENANT_SHARED_DB
+            return {
+                "ENGINE": "core.backends.tenant_schema",
+                "NAME": shared["NAME"],
+                "USER": shared["USER"],
+                "PASSWORD": shared["PASSWORD"],
+                "HOST": shared["HOST"],
+                "PORT": str(shared["PORT"]),
+                "SCHEMA": schema,
+                "SHARED_POOL": f"shared_{shared['NAME']}",
+                "TIME_ZONE": None,
+                "CONN_HEALTH_CHECKS": pool is not None,
+                "CONN_MAX_AGE": 0,
+                "AUTOCOMMIT": True,
+                "ATOMIC_REQUESTS": False,
+                "OPTIONS": options,
+                "TEST": {},
+            }
+
         return {
             "ENGINE": "django.db.backends.postgresql",
             "NAME": self.neon_database_name,
@@ -69,11 +162,12 @@ class Tenant(models.Model):
             "HOST": self.neon_db_host,
             "PORT": str(self.neon_db_port),
             "TIME_ZONE": None,
-            "CONN_HEALTH_CHECKS": False,
-            "CONN_MAX_AGE": 0,
+            # With a pool: check connections as they are handed out
+            "CONN_HEALTH_CHECKS": pool is not None,
+            "CONN_MAX_AGE": 0,   # pooling requires 0
             "AUTOCOMMIT": True,
             "ATOMIC_REQUESTS": False,
-            "OPTIONS": {"sslmode": "require"},
+            "OPTIONS": options,
             "TEST": {},
         }
 
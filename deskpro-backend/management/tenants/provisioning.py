@@ -2,19 +2,24 @@
 Tenant provisioning logic — shared between the REST API and Django Admin.
 
 provision_tenant() is the single entry point for steps 3-9 of tenant setup:
-  3. Create a dedicated Neon database for the tenant
-  4. Persist credentials on the Tenant record
+  3. Create a dedicated Neon database for the tenant (database storage)
+  4. Persist credentials on the Tenant record (database storage)
   5. Register DB alias in settings.DATABASES
-  6. Apply template schema (Django migrations)
+  6. Apply template schema (Django migrations) — for schema storage into
+     a new schema of the shared tenant database (Tenant.storage)
   7. Create the first admin Agent on the tenant DB
   8. Mirror the admin in the control-plane TenantMember directory
   9. Activate the tenant
+
+drop_tenant_storage() undoes step 3 when a tenant is deleted.
 """
 import logging
 
 from django.core.management import call_command
+from django.db import connections
+from psycopg import sql
 
-from core.db_router import register_tenant_db
+from core.db_router import register_tenant_db, unregister_tenant_db
 from core.neon_client import NeonClient
 from management.tenants.models import Tenant, TenantMember
 
@@ -28,22 +33,24 @@ def provision_tenant(tenant: Tenant, admin_password: str, admin_full_name: str)
     Caller is responsible for rolling back (deleting the Tenant record)
     if this function raises.
     """
-    # 3. Create a dedicated Neon database for this tenant
-    creds = NeonClient().create_database(f"tenant_{tenant.slug}")
-
-    # 4. Persist credentials
-    tenant.neon_database_name = creds.database_name
-    tenant.neon_db_host = creds.host
-    tenant.neon_db_user = creds.user
-    tenant.neon_db_password = creds.password
-    tenant.neon_db_port = creds.port
-    tenant.save(using="default")
+    if tenant.storage == Tenant.STORAGE_DATABASE:
+        # 3. Create a dedicated Neon database for this tenant
+        creds = NeonClient().create_database(f"tenant_{tenant.slug}")
+
+        # 4. Persist credentials
+        tenant.neon_database_name = creds.database_name
+        tenant.neon_db_host = creds.host
+        tenant.neon_db_user = creds.user
+        tenant.neon_db_password = creds.password
+        tenant.neon_db_port = creds.port
+        tenant.save(using="default")
 
     # 5. Register DB alias so Django can route queries immediately
     register_tenant_db(tenant)
     db_alias = tenant.get_db_alias()
 
-    # 6. Apply template schema
+    # 6. Apply template schema (schema storage: create the schema first)
+    create_tenant_schema(tenant)
     _run_tenant_migrations(db_alias)
 
     # 7. Create first admin TenantUser on tenant DB
@@ -70,6 +77,42 @@ def provision_tenant(tenant: Tenant, admin_password: str, admin_full_name: str)
     logger.info("Tenant '%s' provisioned successfully.", tenant.slug)
 
 
+def create_tenant_schema(tenant: Tenant) -> None:
+    """
+    Create a schema-storage tenant's schema in the shared database (no-op
+    for database storage). The tenant's alias must be registered.
+    Idempotent, like the migrations that follow it.
+    """
+    schema = tenant.get_db_schema()
+    if schema is None:
+        return
+    with connections[tenant.get_db_alias()].cursor() as cursor:
+        cursor.execute(sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(sql.Identifier(schema)))
+
+
+def drop_tenant_storage(tenant: Tenant) -> None:
+    """
+    Delete the tenant's Neon database, or drop its schema from the shared
+    database, then unregister its alias. Failures are logged, not raised.
+    """
+    db_alias = tenant.get_db_alias()
+    schema = tenant.get_db_schema()
+    try:
+        if schema is not None:
+            register_tenant_db(tenant)
+            with connections[db_alias].cursor() as cursor:
+                cursor.execute(sql.SQL("DROP SCHEMA IF EXISTS {} CASCADE").format(sql.Identifier(schema)))
+            logger.info("Dropped schema '%s' for tenant '%s'", schema, tenant.slug)
+        elif tenant.neon_database_name:
+            NeonClient().delete_database(tenant.neon_database_name)
+            logger.info("Deleted Neon DB '%s'", tenant.neon_database_name)
+    except Exception as exc:
+        logger.warning("Could not delete storage for '%s': %s", tenant.slug, exc)
+
+    unregister_tenant_db(db_alias)
+    logger.info("Unregistered DB alias '%s'", db_alias)
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
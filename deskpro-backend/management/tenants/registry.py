@@ -0,0 +1,160 @@
+"""
+TenantRegistry — process-wide cache of slug → tenant DB alias.
+
+Resolving a tenant means a Control Plane query plus a Fernet decrypt of
+the DB password, so results are remembered:
+
+  positive  active tenant, DB alias registered    (TENANT_REGISTRY_TTL)
+  negative  unknown or inactive slug              (TENANT_REGISTRY_NEGATIVE_TTL)
+
+Loads are single-flight: when N requests for the same cold slug arrive
+together, one of them queries the Control Plane and the others wait for
+its result. Entries are bounded (LRU, TENANT_REGISTRY_MAX_ENTRIES) so a
+flood of bogus slugs cannot grow memory without limit.
+
+Tenant post_save / post_delete (connected in TenantsConfig.ready) update
+the entry immediately in this process: deactivating or deleting a tenant
+unregisters its alias, so its DB stops being routable at once. Other
+worker processes pick the change up when their entry expires.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core import metrics
+from core.db_router import register_tenant_db, unregister_tenant_db
+from management.tenants.models import Tenant
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    alias: str | None          # None: negative entry
+    expires_at: float
+
+
+@dataclass
+class _Flight:
+    done: threading.Event = field(default_factory=threading.Event)
+    alias: str | None = None
+
+
+class TenantRegistry:
+    def __init__(self, ttl: float, negative_ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._flights: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def get_cached(self, slug: str) -> tuple[bool, str | None]:
+        """
+        (fresh, alias) without touching any database. When `fresh` is False
+        the caller must call resolve(); when True, alias None means the
+        tenant is known not to exist or to be inactive.
+        """
+        with self._lock:
+            entry = self._entries.get(slug)
+            if entry is None or entry.expires_at <= time.monotonic():
+                return False, None
+            self._entries.move_to_end(slug)
+        if entry.alias is not None and entry.alias not in settings.DATABASES:
+            return False, None   # unregistered behind our back — reload
+        metrics.incr("tenant_registry.hits")
+        return True, entry.alias
+
+    def resolve(self, slug: str) -> str | None:
+        """Registered DB alias for an active tenant, or None."""
+        fresh, alias = self.get_cached(slug)
+        if fresh:
+            return alias
+
+        with self._lock:
+            flight = self._flights.get(slug)
+            leader = flight is None
+            if leader:
+                flight = self._flights[slug] = _Flight()
+
+        if not leader:
+            metrics.incr("tenant_registry.waits")
+            flight.done.wait()
+            return flight.alias
+
+        try:
+            flight.alias = self._load(slug)
+        finally:
+            with self._lock:
+                del self._flights[slug]
+            flight.done.set()
+        return flight.alias
+
+    def _load(self, slug: str) -> str | None:
+        metrics.incr("tenant_registry.misses")
+        try:
+            tenant = Tenant.objects.using("default").get(slug=slug, is_active=True)
+        except Tenant.DoesNotExist:
+            self._store(slug, None)
+            return None
+        except Exception as exc:
+            # Control Plane trouble is not an answer — do not cache it
+            logger.warning("Could not load tenant DB for '%s': %s", slug, exc)
+            return None
+        return self.remember(tenant)
+
+    def remember(self, tenant: Tenant) -> str | None:
+        """Record a Tenant's current state (registering or dropping its alias)."""
+        if not tenant.is_active:
+            self.forget(tenant.slug)
+            return None
+        register_tenant_db(tenant, replace=True)
+        alias = tenant.get_db_alias()
+        self._store(tenant.slug, alias)
+        return alias
+
+    def forget(self, slug: str) -> None:
+        """Unregister the tenant's alias and cache it as absent."""
+        unregister_tenant_db(f"tenant_{slug}")
+        self._store(slug, None)
+
+    def _store(self, slug: str, alias: str | None) -> None:
+        ttl = self.ttl if alias is not None else self.negative_ttl
+        with self._lock:
+            self._entries[slug] = _Entry(alias, time.monotonic() + ttl)
+            self._entries.move_to_end(slug)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+tenant_registry = TenantRegistry(
+    ttl=settings.TENANT_REGISTRY_TTL,
+    negative_ttl=settings.TENANT_REGISTRY_NEGATIVE_TTL,
+    max_entries=settings.TENANT_REGISTRY_MAX_ENTRIES,
+)
+metrics.register_gauge("tenant_registry.entries", lambda: len(tenant_registry))
+
+
+@receiver(post_save, sender=Tenant)
+def tenant_saved(sender, instance: Tenant, **kwargs):
+    # Provisioning saves credentials before registering the alias and
+    # activating; remember() only registers once the tenant is active.
+    tenant_registry.remember(instance)
+
+
+@receiver(post_delete, sender=Tenant)
+def tenant_deleted(sender, instance: Tenant, **kwargs):
+    tenant_registry.forget(instance.slug)
@@ -36,3 +36,12 @@ class TenantSignupOut(Schema):
 class TenantDeleteOut(Schema):
     slug: str
     message: str
+
+
+class TenantImportOut(Schema):
+    tickets: int
+    messages: int
+    batches: int
+    invalid: int
+    errors: list[str]
+    dry_run: bool
@@ -0,0 +1,119 @@
+"""
+Tenant registry warm-up at worker startup (opt-in: TENANT_WARMUP=True).
+
+Without it every worker discovers tenants one request at a time after a
+deploy, each cold request paying a Control Plane query, a Fernet decrypt
+and — on Neon — possibly a compute wake-up. warm_up() instead:
+
+  1. loads every active Tenant in one Control Plane query (credentials are
+     decrypted as the rows are read) and records them in the TenantRegistry,
+     which registers each DB alias via core.db_router.register_tenant_db
+     (only the busiest that fit within TENANT_DB_MAX_ALIASES and
+     TENANT_DB_POOL_BUDGET, so warm-up never evicts what it registered);
+  2. optionally opens and health-checks (SELECT 1) the DBs of the N
+     tenants with the most members — our proxy for "most active" — in
+     parallel, waking suspended Neon computes before traffic arrives.
+
+Called from config/wsgi.py and config/asgi.py once the application is
+built, so management commands never pay for it. Failures are logged and
+never prevent the worker from starting.
+"""
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Count
+
+from core import metrics
+from core.tenant_connections import tenant_connections
+from management.tenants.models import Tenant
+from management.tenants.registry import tenant_registry
+
+logger = logging.getLogger(__name__)
+
+# Parallel health checks; each holds one short-lived connection
+CONNECT_WORKERS = 8
+
+
+@dataclass
+class WarmupReport:
+    loaded: int = 0
+    connected: int = 0
+    failed: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+_last_report = WarmupReport()
+metrics.register_gauge("tenant_warmup.loaded", lambda: _last_report.loaded)
+metrics.register_gauge("tenant_warmup.connected", lambda: _last_report.connected)
+metrics.register_gauge("tenant_warmup.failed", lambda: len(_last_report.failed))
+metrics.register_gauge("tenant_warmup.seconds", lambda: _last_report.seconds)
+
+
+def warm_up(connect_top: int = 0) -> WarmupReport:
+    """Register all active tenants; health-check the `connect_top` busiest."""
+    report = WarmupReport()
+    started = time.perf_counter()
+
+    # Busiest first; as many as the bounded connection registry
+    # (core.tenant_connections) holds without evicting any of them
+    tenants = list(
+        Tenant.objects.using("default")
+        .filter(is_active=True)
+        .annotate(n_members=Count("members"))
+        .order_by("-n_members", "slug")
+    )
+    tenants = tenants[: tenant_connections.capacity(t.get_db_config() for t in tenants)]
+    # Quietest first, so the busiest end up most recently used
+    for tenant in reversed(tenants):
+        if tenant_registry.remember(tenant) is not None:
+            report.loaded += 1
+
+    if connect_top > 0 and tenants:
+        aliases = [tenant.get_db_alias() for tenant in tenants[:connect_top]]
+        with ThreadPoolExecutor(max_workers=min(CONNECT_WORKERS, len(aliases))) as pool:
+            for alias, error in zip(aliases, pool.map(_health_check, aliases)):
+                if error is None:
+                    report.connected += 1
+                else:
+                    report.failed.append(alias)
+                    logger.warning("Warm-up health check failed for '%s': %s", alias, error)
+
+    report.seconds = time.perf_counter() - started
+    global _last_report
+    _last_report = report
+    return report
+
+
+def _health_check(alias: str) -> str | None:
+    """Open a connection to `alias` and run SELECT 1; the error text, or None."""
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute("SELECT 1")
+        return None
+    except Exception as exc:
+        return str(exc)
+    finally:
+        # Connections are per thread; do not leave one behind in the pool thread
+        connections[alias].close()
+
+
+def warm_up_on_startup() -> None:
+    """Entry point for the WSGI/ASGI modules: honours settings, logs, never raises."""
+    if not settings.TENANT_WARMUP:
+        return
+    try:
+        report = warm_up(connect_top=settings.TENANT_WARMUP_CONNECT_TOP)
+    except Exception:
+        logger.exception("Tenant warm-up failed; tenants will load lazily.")
+        return
+    logger.info(
+        "Tenant warm-up: %d tenants registered, %d/%d DB connections healthy in %.0f ms",
+        report.loaded,
+        report.connected,
+        report.connected + len(report.failed),
+        report.seconds * 1000,
+    )
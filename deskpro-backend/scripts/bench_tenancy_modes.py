@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+"""
+Benchmark database-per-tenant vs schema-per-tenant: server connections and
+request latency with many tenants.
+
+Usage:
+    python scripts/bench_tenancy_modes.py postgresql://localhost/bench \\
+        [--tenants 1000] [--threads 16] [--requests 20000] [--skew 1.1]
+
+Against a scratch Postgres database (schemas bench_t0000... are dropped and
+recreated), each tenant gets a small tickets table in its own schema. A
+thread pool then serves --requests requests, each for a tenant drawn from a
+Zipf(--skew) distribution (a few busy tenants, a long tail), running the two
+queries of a typical ticket read on one checked-out connection:
+
+  database  one pool per tenant (TENANT_DB_POOL_MIN/MAX_SIZE) within
+            --budget connections, each pool counting its min_size or its
+            live size if larger: least recently used idle pools are closed
+            to make room, as core.tenant_connections does.
+            Connections are pinned to their tenant (search_path given at
+            connect time) and can never serve another one — exactly the
+            client-side behaviour of separate databases, without creating
+            --tenants databases.
+  schema    one shared pool (TENANT_SHARED_DB_POOL_MIN/MAX_SIZE); every
+            checkout sets search_path to the tenant's schema, as
+            core.backends.tenant_schema does.
+
+Reported per mode: requests/s, latency percentiles (checkout + queries,
+connects included), peak and mean client connections seen by the server
+(pg_stat_activity, sampled every 100 ms), connections opened, and pool
+timeouts. Point the DSN at a Neon database to include TLS/auth costs.
+
+Needs psycopg and psycopg_pool; Django is not loaded.
+"""
+import argparse
+import random
+import statistics
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import psycopg
+from psycopg_pool import ConnectionPool, PoolTimeout
+
+TICKETS_PER_TENANT = 50
+
+READ_SQL = (
+    "SELECT count(*) FROM tickets WHERE status = 'open'",
+    "SELECT id, subject, status FROM tickets WHERE id = %s",
+)
+
+
+def schema_name(i: int) -> str:
+    return f"bench_t{i:04d}"
+
+
+def setup(dsn: str, tenants: int) -> None:
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        for i in range(tenants):
+            schema = schema_name(i)
+            conn.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+            conn.execute(f"CREATE SCHEMA {schema}")
+            conn.execute(
+                f"CREATE TABLE {schema}.tickets ("
+                " id bigint PRIMARY KEY, subject text NOT NULL, status text NOT NULL)"
+            )
+            conn.execute(
+                f"INSERT INTO {schema}.tickets"
+                " SELECT g, 'Ticket ' || g, (ARRAY['open', 'pending', 'resolved'])[1 + g % 3]"
+                f" FROM generate_series(1, {TICKETS_PER_TENANT}) g"
+            )
+
+
+def teardown(dsn: str, tenants: int) -> None:
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        for i in range(tenants):
+            conn.execute(f"DROP SCHEMA IF EXISTS {schema_name(i)} CASCADE")
+
+
+class DatabaseMode:
+    """A pool per tenant, within a connection budget (LRU eviction of idle pools)."""
+
+    def __init__(self, dsn: str, min_size: int, max_size: int, budget: int, timeout: float):
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self.budget = budget
+        self.timeout = timeout
+        self._pools: OrderedDict[int, ConnectionPool] = OrderedDict()
+        self._leases: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self._closed_stats: list[dict] = []
+
+    @contextmanager
+    def connection(self, tenant: int):
+        to_close = []
+        with self._lock:
+            pool = self._pools.get(tenant)
+            if pool is None:
+                pool = ConnectionPool(
+                    self.dsn,
+                    min_size=self.min_size,
+                    max_size=self.max_size,
+                    timeout=self.timeout,
+                    kwargs={"autocommit": True, "options": f"-c search_path={schema_name(tenant)}"},
+                    open=True,
+                )
+                self._pools[tenant] = pool
+                usage = {
+                    other: max(self.min_size, p.get_stats().get("pool_size", 0))
+                    for other, p in self._pools.items()
+                }
+                used = sum(usage.values())
+                for other in list(self._pools):
+                    if used <= self.budget:
+                        break
+                    if other == tenant or self._leases.get(other):
+                        continue
+                    to_close.append(self._pools.pop(other))
+                    used -= usage[other]
+                    self.evictions += 1
+            self._pools.move_to_end(tenant)
+            self._leases[tenant] = self._leases.get(tenant, 0) + 1
+        for old in to_close:
+            self._closed_stats.append(old.get_stats())
+            old.close(timeout=0)
+        try:
+            with pool.connection() as conn:
+                yield conn
+        finally:
+            with self._lock:
+                self._leases[tenant] -= 1
+
+    def stats(self) -> list[dict]:
+        with self._lock:
+            pools = list(self._pools.values())
+        return self._closed_stats + [pool.get_stats() for pool in pools]
+
+    def close(self) -> None:
+        for pool in self._pools.values():
+            pool.close()
+
+
+class SchemaMode:
+    """One shared pool; search_path set on every checkout."""
+
+    def __init__(self, dsn: str, min_size: int, max_size: int, timeout: float):
+        self.pool = ConnectionPool(
+            dsn, min_size=min_size, max_size=max_size, timeout=timeout,
+            kwargs={"autocommit": True}, open=True,
+        )
+        self.evictions = 0
+
+    @contextmanager
+    def connection(self, tenant: int):
+        with self.pool.connection() as conn:
+            conn.execute(f"SET search_path TO {schema_name(tenant)}")
+            yield conn
+
+    def stats(self) -> list[dict]:
+        return [self.pool.get_stats()]
+
+    def close(self) -> None:
+        self.pool.close()
+
+
+class ConnectionSampler(threading.Thread):
+    """Counts client backends on the server every `interval` seconds."""
+
+    def __init__(self, dsn: str, interval: float = 0.1):
+        super().__init__(daemon=True)
+        self.dsn = dsn
+        self.interval = interval
+        self.samples: list[int] = []
+        self.stopping = threading.Event()
+
+    def run(self):
+        with psycopg.connect(self.dsn, autocommit=True) as conn:
+            while not self.stopping.is_set():
+                count = conn.execute(
+                    "SELECT count(*) FROM pg_stat_activity"
+                    " WHERE datname = current_database() AND backend_type = 'client backend'"
+                    " AND pid <> pg_backend_pid()"
+                ).fetchone()[0]
+                self.samples.append(count)
+                self.stopping.wait(self.interval)
+
+
+def run(mode, tenant_weights: list[float], args) -> dict:
+    population = range(len(tenant_weights))
+    latencies: list[float] = []
+    timeouts = 0
+    lock = threading.Lock()
+
+    def one_request(_):
+        nonlocal timeouts
+        tenant = random.choices(population, cum_weights=tenant_weights)[0]
+        started = time.perf_counter()
+        try:
+            with mode.connection(tenant) as conn:
+                conn.execute(READ_SQL[0]).fetchone()
+                conn.execute(READ_SQL[1], [random.randint(1, TICKETS_PER_TENANT)]).fetchone()
+        except PoolTimeout:
+            with lock:
+                timeouts += 1
+            return
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+
+    sampler = ConnectionSampler(args.dsn)
+    sampler.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        list(pool.map(one_request, range(args.requests)))
+    finished = time.perf_counter()
+    sampler.stopping.set()
+    sampler.join()
+
+    stats = mode.stats()
+    mode.close()
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+    return {
+        "rps": len(latencies) / (finished - started),
+        "p50": quantiles[49] * 1000,
+        "p95": quantiles[94] * 1000,
+        "p99": quantiles[98] * 1000,
+        "peak_conns": max(sampler.samples, default=0),
+        "mean_conns": statistics.fmean(sampler.samples) if sampler.samples else 0.0,
+        "opened": sum(s.get("connections_num", 0) for s in stats),
+        "timeouts": timeouts,
+        "evictions": mode.evictions,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("dsn", help="Scratch database, e.g. postgresql://localhost/bench")
+    parser.add_argument("--tenants", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=16, help="Concurrent requests (worker threads)")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent of tenant popularity")
+    parser.add_argument("--pool-min", type=int, default=1, help="Per-tenant pool min_size (database mode)")
+    parser.add_argument("--pool-max", type=int, default=4, help="Per-tenant pool max_size (database mode)")
+    parser.add_argument("--budget", type=int, default=200, help="Connections across tenant pools (database mode)")
+    parser.add_argument("--shared-min", type=int, default=2, help="Shared pool min_size (schema mode)")
+    parser.add_argument("--shared-max", type=int, default=20, help="Shared pool max_size (schema mode)")
+    parser.add_argument("--timeout", type=float, default=5.0, help="Pool checkout timeout, seconds")
+    parser.add_argument("--modes", default="database,schema")
+    parser.add_argument("--keep", action="store_true", help="Leave the bench schemas behind")
+    args = parser.parse_args()
+
+    print(f"Creating {args.tenants:,} tenant schemas...")
+    setup(args.dsn, args.tenants)
+
+    weights = [1 / (rank + 1) ** args.skew for rank in range(args.tenants)]
+    cumulative, total = [], 0.0
+    for weight in weights:
+        total += weight
+        cumulative.append(total)
+
+    print(
+        f"{args.requests:,} requests on {args.threads} threads, "
+        f"{args.tenants:,} tenants, Zipf skew {args.skew}"
+    )
+    factories = {
+        "database": lambda: DatabaseMode(args.dsn, args.pool_min, args.pool_max, args.budget, args.timeout),
+        "schema": lambda: SchemaMode(args.dsn, args.shared_min, args.shared_max, args.timeout),
+    }
+    try:
+        for name in args.modes.split(","):
+            r = run(factories[name](), cumulative, args)
+            print(
+                f"  {name:8}  {r['rps']:8,.0f} req/s  "
+                f"p50 {r['p50']:6.2f} ms  p95 {r['p95']:6.2f} ms  p99 {r['p99']:7.2f} ms  "
+                f"conns peak {r['peak_conns']:4d} mean {r['mean_conns']:6.1f}  "
+                f"opened {r['opened']:5d}  evicted {r['evictions']:5d}  timeouts {r['timeouts']}"
+            )
+    finally:
+        if not args.keep:
+            teardown(args.dsn, args.tenants)
+
+
+if __name__ == "__main__":
+    main()
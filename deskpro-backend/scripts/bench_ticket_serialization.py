@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""
+Benchmark per-ticket serialization cost: default Ninja path vs FAST_JSON.
+
+Usage:
+    python scripts/bench_ticket_serialization.py [--tickets 500] [--messages 10]
+
+Builds unsaved Ticket/TicketMessage instances in memory (no DB needed) and
+times rendering a page of tickets with their threads (the shape of ticket
+detail and NDJSON export rows) both ways:
+
+  default   _serialize_ticket → TicketOut validation + camelCase dump
+            → stdlib json with Ninja's encoder
+  fast      _serialize_ticket → camelize → orjson (trusted output)
+
+orjson must be installed for the fast column (uv sync --extra fast).
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+from datetime import timedelta
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("DJANGO_ENV", "dev")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", f"config.settings.{os.environ['DJANGO_ENV']}")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.utils import timezone  # noqa: E402
+from ninja.responses import NinjaJSONEncoder  # noqa: E402
+
+from apps.tickets.api import _serialize_ticket  # noqa: E402
+from apps.tickets.models import Ticket, TicketMessage  # noqa: E402
+from apps.tickets.schemas import CamelSchema, TicketOut, camelize  # noqa: E402
+from core.renderers import dumps  # noqa: E402
+from core.thread_local import tenant_db  # noqa: E402
+
+# Never connected to: assigning message.ticket asks the DB router for an
+# alias, and the router requires a tenant context
+BENCH_ALIAS = "tenant_bench"
+
+
+class TicketListOut(CamelSchema):
+    items: list[TicketOut]
+    next_cursor: Optional[str] = None
+
+
+def build_tickets(n_tickets: int, n_messages: int) -> list[Ticket]:
+    with tenant_db(BENCH_ALIAS):
+        return _build_tickets(n_tickets, n_messages)
+
+
+def _build_tickets(n_tickets: int, n_messages: int) -> list[Ticket]:
+    now = timezone.now()
+    tickets = []
+    for i in range(n_tickets):
+        ticket = Ticket(
+            id=i + 1,
+            subject=f"Cannot log in after password reset #{i}",
+            customer_name="Erika Mustermann",
+            customer_email="erika@example.com",
+            status="open",
+            priority="high",
+            channel="email",
+            assignee="agent@example.com",
+            tags=["login", "billing"],
+            created_at=now - timedelta(minutes=i),
+            updated_at=now,
+        )
+        messages = [
+            TicketMessage(
+                ticket=ticket,
+                sender="customer" if j % 2 else "agent",
+                body="Hello, I still cannot access my account. " * 8,
+                timestamp=now - timedelta(minutes=i, seconds=j),
+            )
+            for j in range(n_messages)
+        ]
+        # Stand in for prefetch_related("messages") so .all() never queries
+        prefetched = TicketMessage.objects.all()
+        prefetched._result_cache = messages
+        prefetched._prefetch_done = True
+        ticket._prefetched_objects_cache = {"messages": prefetched}
+        tickets.append(ticket)
+    return tickets
+
+
+def render_default(tickets: list[Ticket]) -> bytes:
+    data = {"items": [_serialize_ticket(t) for t in tickets], "next_cursor": None}
+    validated = TicketListOut.model_validate(data).model_dump(by_alias=True)
+    return json.dumps(validated, cls=NinjaJSONEncoder).encode()
+
+
+def render_fast(tickets: list[Ticket]) -> bytes:
+    data = {"items": [_serialize_ticket(t) for t in tickets], "next_cursor": None}
+    return dumps(camelize(data))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickets", type=int, default=500)
+    parser.add_argument("--messages", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tickets = build_tickets(args.tickets, args.messages)
+    print(f"{args.tickets} tickets × {args.messages} messages, best of {args.repeat}")
+
+    results = {}
+    for name, render in (("default", render_default), ("fast", render_fast)):
+        try:
+            size = len(render(tickets))
+        except Exception as exc:
+            print(f"  {name:<8} skipped: {exc}")
+            continue
+        best = min(timeit.repeat(lambda: render(tickets), number=1, repeat=args.repeat))
+        results[name] = best
+        per_ticket_us = best / args.tickets * 1e6
+        print(f"  {name:<8} {best * 1000:8.1f} ms/page  {per_ticket_us:7.1f} µs/ticket  {size / 1024:8.1f} KiB")
+
+    if len(results) == 2:
+        print(f"  speedup  {results['default'] / results['fast']:.1f}×")
+
+
+if __name__ == "__main__":
+    main()
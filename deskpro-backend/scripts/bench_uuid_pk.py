@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+"""
+Benchmark UUIDv4 vs UUIDv7 primary keys: insert throughput and index size.
+
+Usage:
+    python scripts/bench_uuid_pk.py postgresql://localhost/bench [--rows 2000000] [--batch 10000]
+
+Against a scratch local Postgres database (tables bench_pk_v4 / bench_pk_v7
+are dropped and recreated), for each key type:
+
+  1. create a table shaped like tickets_ticketmessage (uuid PK, ticket_id,
+     timestamp, body),
+  2. insert --rows rows in --batch sized COPY statements, one transaction
+     per batch, timing the whole run and the last 10% separately (once the
+     index no longer fits in shared_buffers the v4 slowdown shows there),
+  3. report rows/s, primary-key index size and its leaf density
+     (pgstattuple, if the extension can be created).
+
+Needs only psycopg; Django is not loaded.
+"""
+import argparse
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import psycopg
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.ids import uuid7  # noqa: E402
+
+BODY = "Hello, I still cannot access my account after the password reset. " * 3
+
+GENERATORS = {"v4": uuid.uuid4, "v7": uuid7}
+
+
+def bench(conn: psycopg.Connection, name: str, make_id, rows: int, batch: int) -> dict:
+    table = f"bench_pk_{name}"
+    with conn.cursor() as cur:
+        cur.execute(f"DROP TABLE IF EXISTS {table}")
+        cur.execute(
+            f"CREATE TABLE {table} ("
+            " id uuid PRIMARY KEY,"
+            " ticket_id bigint NOT NULL,"
+            " timestamp timestamptz NOT NULL DEFAULT now(),"
+            " body text NOT NULL)"
+        )
+    conn.commit()
+
+    tail_from = rows - rows // 10
+    started = time.perf_counter()
+    tail_started = None
+    done = 0
+    while done < rows:
+        n = min(batch, rows - done)
+        if tail_started is None and done >= tail_from:
+            tail_started = time.perf_counter()
+        with conn.cursor() as cur:
+            with cur.copy(f"COPY {table} (id, ticket_id, body) FROM STDIN") as copy:
+                for i in range(n):
+                    copy.write_row((make_id(), (done + i) // 20, BODY))
+        conn.commit()
+        done += n
+    finished = time.perf_counter()
+
+    with conn.cursor() as cur:
+        cur.execute("SELECT pg_relation_size(%s)", [f"{table}_pkey"])
+        index_bytes = cur.fetchone()[0]
+        density = None
+        try:
+            cur.execute("SELECT avg_leaf_density FROM pgstatindex(%s)", [f"{table}_pkey"])
+            density = cur.fetchone()[0]
+        except psycopg.Error:
+            conn.rollback()
+    conn.commit()
+
+    return {
+        "rows_per_s": rows / (finished - started),
+        "tail_rows_per_s": (rows - tail_from) / (finished - (tail_started or started)),
+        "index_mib": index_bytes / 2**20,
+        "leaf_density": density,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("dsn", help="Scratch database, e.g. postgresql://localhost/bench")
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--keep", action="store_true", help="Leave the bench tables behind")
+    args = parser.parse_args()
+
+    with psycopg.connect(args.dsn) as conn:
+        try:
+            conn.execute("CREATE EXTENSION IF NOT EXISTS pgstattuple")
+            conn.commit()
+        except psycopg.Error:
+            conn.rollback()
+            print("  (pgstattuple unavailable — leaf density not reported)")
+
+        print(f"{args.rows:,} rows, COPY batches of {args.batch:,}")
+        results = {}
+        for name, make_id in GENERATORS.items():
+            results[name] = r = bench(conn, name, make_id, args.rows, args.batch)
+            density = f"{r['leaf_density']:5.1f}%" if r["leaf_density"] is not None else "   n/a"
+            print(
+                f"  {name}  {r['rows_per_s']:10,.0f} rows/s  "
+                f"last 10%: {r['tail_rows_per_s']:10,.0f} rows/s  "
+                f"pkey {r['index_mib']:8.1f} MiB  leaf density {density}"
+            )
+
+        v4, v7 = results["v4"], results["v7"]
+        print(
+            f"  v7 vs v4: {v7['rows_per_s'] / v4['rows_per_s']:.2f}× throughput, "
+            f"{v7['index_mib'] / v4['index_mib']:.2f}× index size"
+        )
+
+        if not args.keep:
+            for name in GENERATORS:
+                conn.execute(f"DROP TABLE IF EXISTS bench_pk_{name}")
+            conn.commit()
+
+
+if __name__ == "__main__":
+    main()
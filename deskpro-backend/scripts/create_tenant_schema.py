@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 """
-Run Django migrations on a specific tenant DB alias.
+Run Django migrations on a specific tenant DB alias (for schema storage,
+creating the tenant's schema in the shared tenant DB first).
 
 Usage:
     python scripts/create_tenant_schema.py <tenant_slug>
@@ -25,6 +26,7 @@ django.setup()
 from django.core.management import call_command  # noqa: E402
 
 from management.tenants.models import Tenant  # noqa: E402
+from management.tenants.provisioning import create_tenant_schema as create_schema  # noqa: E402
 from core.db_router import register_tenant_db  # noqa: E402
 
 
@@ -37,6 +39,7 @@ def create_tenant_schema(tenant_slug: str) -> None:
 
     db_alias = tenant.get_db_alias()
     register_tenant_db(tenant)
+    create_schema(tenant)
 
     print(f"Running migrations on '{db_alias}'...")
     call_command("migrate", "--database", db_alias, verbosity=1)
@@ -3,10 +3,13 @@
 Run Django migrations on all active tenant DBs.
 
 Usage:
-    python scripts/migrate_all_tenants.py
+    python scripts/migrate_all_tenants.py [--storage database|schema]
 
-Useful after adding a new migration to accounts or tickets apps.
+Useful after adding a new migration to accounts or tickets apps. Handles
+both storage modes: database tenants migrate their own Neon DB, schema
+tenants their schema in the shared tenant DB (created if missing).
 """
+import argparse
 import os
 import sys
 from pathlib import Path
@@ -23,11 +26,14 @@ django.setup()
 from django.core.management import call_command  # noqa: E402
 
 from management.tenants.models import Tenant  # noqa: E402
+from management.tenants.provisioning import create_tenant_schema  # noqa: E402
 from core.db_router import register_tenant_db  # noqa: E402
 
 
-def migrate_all_tenants() -> None:
+def migrate_all_tenants(storage: str | None = None) -> None:
     tenants = Tenant.objects.using("default").filter(is_active=True)
+    if storage:
+        tenants = tenants.filter(storage=storage)
     count = tenants.count()
 
     if count == 0:
@@ -39,8 +45,9 @@ def migrate_all_tenants() -> None:
     for tenant in tenants:
         db_alias = tenant.get_db_alias()
         register_tenant_db(tenant)
-        print(f"  → {db_alias} ({tenant.name})...")
+        print(f"  → {db_alias} ({tenant.name}, {tenant.storage})...")
         try:
+            create_tenant_schema(tenant)
             call_command("migrate", "--database", db_alias, verbosity=0)
             print(f"     ✓ Done.")
         except Exception as exc:
@@ -50,4 +57,7 @@ def migrate_all_tenants() -> None:
 
 
 if __name__ == "__main__":
-    migrate_all_tenants()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--storage", choices=[Tenant.STORAGE_DATABASE, Tenant.STORAGE_SCHEMA])
+    args = parser.parse_args()
+    migrate_all_tenants(args.storage)